@@ -0,0 +1,13 @@
+#!/usr/bin/env cython
+# coding: utf-8
+# cython: embedsignature=True
+
+cimport cython
+
+ctypedef cython.floating DTYPE_t
+
+cdef DTYPE_t _mean_absolute_difference(DTYPE_t[:] a, DTYPE_t[:] b) nogil
+cdef DTYPE_t _logsumexp_2d(DTYPE_t[:, :] data) nogil
+cdef void _dirichlet_expectation_1d(DTYPE_t[:] alpha, DTYPE_t[:] out) nogil
+cdef void _dirichlet_expectation_2d(DTYPE_t[:, :] alpha, DTYPE_t[:, :] out) nogil
+cdef DTYPE_t _digamma(DTYPE_t x,) nogil
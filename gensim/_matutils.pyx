@@ -6,7 +6,6 @@ from __future__ import division
 cimport cython
 import numpy as np
 cimport numpy as np
-ctypedef cython.floating DTYPE_t
 from libc.math cimport log, exp, fabs
 from cython.parallel import prange
 
@@ -297,7 +296,7 @@ def digamma(DTYPE_t x):
 
 
 @cython.cdivision(True)
-cdef inline DTYPE_t _digamma(DTYPE_t x,) nogil:
+cdef DTYPE_t _digamma(DTYPE_t x,) nogil:
     """Digamma function for positive floats.
 
     Parameters
@@ -11,6 +11,7 @@ from .svmlightcorpus import SvmLightCorpus  # noqa:F401
 from .lowcorpus import LowCorpus  # noqa:F401
 from .dictionary import Dictionary  # noqa:F401
 from .hashdictionary import HashDictionary  # noqa:F401
+from .compactdictionary import CompactDictionary  # noqa:F401
 from .wikicorpus import WikiCorpus  # noqa:F401
 from .textcorpus import TextCorpus, TextDirectoryCorpus  # noqa:F401
 from .ucicorpus import UciCorpus  # noqa:F401
@@ -0,0 +1,474 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""A read-only, array-backed variant of :class:`~gensim.corpora.dictionary.Dictionary`.
+
+Notes
+-----
+
+:class:`~gensim.corpora.dictionary.Dictionary` keeps its mappings and statistics in Python dicts, which costs
+a few hundred bytes per token. With vocabularies of tens of millions of tokens, that adds up to gigabytes
+of RAM in every process that loads the dictionary, and (un)pickling it is slow.
+
+:class:`~gensim.corpora.compactdictionary.CompactDictionary` stores the same information in a handful of
+numpy arrays:
+
+* all tokens, UTF-8 encoded and concatenated in id order (a "string pool"), plus their offsets,
+* a sorted array of 64-bit token hashes, with the corresponding ids, for token -> id lookups,
+* the document and collection frequencies, indexed by id.
+
+The arrays can be memory-mapped on load, so that several worker processes share one copy of the dictionary.
+Token lookups hash and search many tokens at once, with numpy. Convert documents in batches, with
+:meth:`~gensim.corpora.compactdictionary.CompactDictionary.docs2bow` and
+:meth:`~gensim.corpora.compactdictionary.CompactDictionary.docs2idx`: one document at a time, with
+:meth:`~gensim.corpora.compactdictionary.CompactDictionary.doc2bow`, is slower than with a
+:class:`~gensim.corpora.dictionary.Dictionary`.
+
+The dictionary is frozen: build (and filter) a :class:`~gensim.corpora.dictionary.Dictionary` first,
+then convert it.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import Dictionary, CompactDictionary
+    >>> from gensim.test.utils import common_texts, get_tmpfile
+    >>>
+    >>> dct = CompactDictionary(Dictionary(common_texts))
+    >>> dct.doc2bow(["human", "computer", "computer", "non_existent_word"])
+    [(0, 2), (1, 1)]
+    >>>
+    >>> dct.save(get_tmpfile("compact.dict"))
+    >>> dct = CompactDictionary.load(get_tmpfile("compact.dict"), mmap='r')
+
+"""
+
+from collections import Counter
+from collections.abc import Mapping
+import logging
+
+import numpy as np
+
+from gensim import utils
+from gensim.corpora.dictionary import ids2csr
+from six import iteritems, string_types
+
+
+logger = logging.getLogger(__name__)
+
+# multiplier of the polynomial token hash, an arbitrary large odd 64-bit constant
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_HASH_CHUNKSIZE = 10000
+
+
+def _encode_all(tokens):
+    try:
+        return [token.encode('utf8') for token in tokens]
+    except AttributeError:
+        # some tokens are already bytes
+        return [token if isinstance(token, bytes) else token.encode('utf8') for token in tokens]
+
+
+_HASH_POWERS = np.cumprod(np.full(8, _HASH_MULTIPLIER, dtype=np.uint64), dtype=np.uint64)
+
+
+def _hash_powers(num):
+    # _HASH_MULTIPLIER ** 1..num, cached for the usual short tokens
+    if num <= len(_HASH_POWERS):
+        return _HASH_POWERS[:num]
+    return np.cumprod(np.full(num, _HASH_MULTIPLIER, dtype=np.uint64), dtype=np.uint64)
+
+
+def hash_tokens(encoded):
+    """Compute the 64-bit hashes used by :class:`~gensim.corpora.compactdictionary.CompactDictionary`.
+
+    Parameters
+    ----------
+    encoded : list of bytes
+        UTF-8 encoded tokens.
+
+    Returns
+    -------
+    numpy.ndarray
+        Hash of each token, as uint64. The hash doesn't depend on the process (unlike the built-in `hash`),
+        so it can be persisted.
+
+    """
+    if not encoded:
+        return np.zeros(0, dtype=np.uint64)
+    lengths = np.fromiter(map(len, encoded), dtype=np.uint64, count=len(encoded))
+    # fixed-width byte matrix, one token per row, zero-padded on the right (numpy also strips trailing zero
+    # bytes of the tokens themselves, so the length is hashed separately)
+    matrix = np.array(encoded, dtype=bytes)
+    width = -(-matrix.itemsize // 8) * 8  # round up, to read each token as a row of 64-bit little-endian words
+    if width != matrix.itemsize:
+        matrix = matrix.astype('S%i' % width)
+    matrix = matrix.view('<u8').reshape(len(encoded), width // 8)
+    powers = _hash_powers(width // 8)
+    # padding bytes are zeros and do not contribute, so the hash is independent of `width`;
+    # uint64 arithmetic wraps around, i.e. this is a polynomial hash modulo 2**64, with the length as constant term
+    return matrix.astype(np.uint64, copy=False).dot(powers) + lengths
+
+
+def _hash_chunked(encoded):
+    # bound the size of the fixed-width matrix in `hash_tokens`, in case of a few very long tokens
+    if len(encoded) <= _HASH_CHUNKSIZE:
+        return hash_tokens(encoded)
+    return np.concatenate([
+        hash_tokens(encoded[start:start + _HASH_CHUNKSIZE]) for start in range(0, len(encoded), _HASH_CHUNKSIZE)
+    ])
+
+
+class CompactDictionary(utils.SaveLoad, Mapping):
+    """Read-only mapping between tokens and their integer ids, backed by numpy arrays.
+
+    Implements the same id -> token `Mapping` interface as :class:`~gensim.corpora.dictionary.Dictionary`,
+    with a fraction of its memory footprint.
+
+    Attributes
+    ----------
+    token_pool : numpy.ndarray
+        UTF-8 bytes of all tokens, concatenated in id order.
+    token_offsets : numpy.ndarray
+        Token with id `i` is stored in `token_pool[token_offsets[i]:token_offsets[i + 1]]`.
+    hashes : numpy.ndarray
+        Sorted 64-bit hashes of the tokens, see :func:`~gensim.corpora.compactdictionary.hash_tokens`.
+    hash_ids : numpy.ndarray
+        Token ids, in the order of `hashes`.
+    collisions : dict of (str, int)
+        token -> tokenId for the (very rare) tokens whose hash is not unique. These tokens are looked up here,
+        and their hashes are left out of `hashes`.
+    dfs : numpy.ndarray
+        Document frequencies: token_id -> how many documents contain this token.
+    cfs : numpy.ndarray
+        Collection frequencies: token_id -> how many instances of this token are contained in the documents.
+    num_docs : int
+        Number of documents processed.
+    num_pos : int
+        Total number of corpus positions (number of processed words).
+    num_nnz : int
+        Total number of non-zeroes in the BOW matrix.
+
+    Notes
+    -----
+    A token whose hash matches the hash of a dictionary token is compared with that token in `token_pool`,
+    so tokens that are *not* in the dictionary are never mapped to an id, even if their hashes collide.
+
+    :meth:`~gensim.corpora.compactdictionary.CompactDictionary.doc2bow` and
+    :meth:`~gensim.corpora.compactdictionary.CompactDictionary.doc2idx` pay the numpy overhead once per
+    document, which makes them several times slower than the same methods of a
+    :class:`~gensim.corpora.dictionary.Dictionary`. They are there for compatibility; the fast path is to
+    convert many documents at once, with :meth:`~gensim.corpora.compactdictionary.CompactDictionary.docs2bow`
+    or :meth:`~gensim.corpora.compactdictionary.CompactDictionary.docs2idx`.
+
+    """
+    def __init__(self, dictionary=None):
+        """
+
+        Parameters
+        ----------
+        dictionary : :class:`~gensim.corpora.dictionary.Dictionary`, optional
+            Dictionary to convert. Its ids must be contiguous, see
+            :meth:`~gensim.corpora.dictionary.Dictionary.compactify`.
+
+        """
+        self.token_pool = np.zeros(0, dtype=np.uint8)
+        self.token_offsets = np.zeros(1, dtype=np.int64)
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.hash_ids = np.zeros(0, dtype=np.int64)
+        self.collisions = {}
+        self.dfs = np.zeros(0, dtype=np.int64)
+        self.cfs = np.zeros(0, dtype=np.int64)
+
+        self.num_docs = 0
+        self.num_pos = 0
+        self.num_nnz = 0
+
+        if dictionary is not None:
+            self.add_dictionary(dictionary)
+
+    def add_dictionary(self, dictionary):
+        """Replace the contents of this dictionary with those of `dictionary`.
+
+        Parameters
+        ----------
+        dictionary : :class:`~gensim.corpora.dictionary.Dictionary`
+            Dictionary to convert. Its ids must be contiguous.
+
+        Raises
+        ------
+        ValueError
+            If the ids of `dictionary` are not exactly `0..len(dictionary) - 1`.
+
+        """
+        num_tokens = len(dictionary.token2id)
+        tokens = [None] * num_tokens
+        for token, tokenid in iteritems(dictionary.token2id):
+            if not 0 <= tokenid < num_tokens or tokens[tokenid] is not None:
+                raise ValueError("token ids must be contiguous, call Dictionary.compactify() first")
+            tokens[tokenid] = token
+        tokens = _encode_all(tokens)
+
+        lengths = np.fromiter((len(token) for token in tokens), dtype=np.int64, count=num_tokens)
+        self.token_offsets = np.zeros(num_tokens + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.token_offsets[1:])
+        self.token_pool = np.frombuffer(b''.join(tokens), dtype=np.uint8).copy()
+
+        hashes = _hash_chunked(tokens)
+        order = np.argsort(hashes, kind='stable')
+        hashes = hashes[order]
+        # hashes shared by several tokens can't be told apart: keep those tokens in a plain dict instead
+        duplicated = np.zeros(num_tokens, dtype=bool)
+        if num_tokens > 1:
+            same = hashes[1:] == hashes[:-1]
+            duplicated[1:] |= same
+            duplicated[:-1] |= same
+        self.collisions = {tokens[tokenid].decode('utf8'): int(tokenid) for tokenid in order[duplicated]}
+        if self.collisions:
+            logger.warning("%i tokens with colliding hashes, looking those up in a dict", len(self.collisions))
+        self.hashes = hashes[~duplicated]
+        self.hash_ids = order[~duplicated].astype(np.int64)
+
+        self.dfs = np.zeros(num_tokens, dtype=np.int64)
+        self.cfs = np.zeros(num_tokens, dtype=np.int64)
+        for tokenid, freq in iteritems(dictionary.dfs):
+            self.dfs[tokenid] = freq
+        for tokenid, freq in iteritems(dictionary.cfs):
+            self.cfs[tokenid] = freq
+        self.num_docs = dictionary.num_docs
+        self.num_pos = dictionary.num_pos
+        self.num_nnz = dictionary.num_nnz
+
+    def __getitem__(self, tokenid):
+        """Get the string token that corresponds to `tokenid`.
+
+        Parameters
+        ----------
+        tokenid : int
+            Id of token.
+
+        Returns
+        -------
+        str
+            Token corresponding to `tokenid`.
+
+        Raises
+        ------
+        KeyError
+            If this dictionary doesn't contain such `tokenid`.
+
+        """
+        if not 0 <= tokenid < len(self):
+            raise KeyError(tokenid)
+        start, end = self.token_offsets[tokenid], self.token_offsets[tokenid + 1]
+        return self.token_pool[start:end].tobytes().decode('utf8')
+
+    def __iter__(self):
+        """Iterate over all token ids."""
+        return iter(range(len(self)))
+
+    def __len__(self):
+        """Get number of stored tokens.
+
+        Returns
+        -------
+        int
+            Number of stored tokens.
+
+        """
+        return len(self.token_offsets) - 1
+
+    def __str__(self):
+        some_tokens = [self[tokenid] for tokenid in range(min(5, len(self)))]
+        return "CompactDictionary(%i unique tokens: %s%s)" % (len(self), some_tokens, '...' if len(self) > 5 else '')
+
+    def keys(self):
+        """Get all stored ids.
+
+        Returns
+        -------
+        list of int
+            List of all token ids.
+
+        """
+        return list(range(len(self)))
+
+    def lookup(self, tokens, unknown_word_index=-1):
+        """Get the ids of all `tokens` at once.
+
+        Parameters
+        ----------
+        tokens : list of {str, bytes}
+            Tokens to look up.
+        unknown_word_index : int, optional
+            Id to use for tokens not in the dictionary.
+
+        Returns
+        -------
+        numpy.ndarray
+            Token ids, in the same order as `tokens`.
+
+        """
+        encoded = _encode_all(tokens)
+        ids = np.full(len(encoded), unknown_word_index, dtype=np.int64)
+        if len(self.hashes):
+            # in chunks, to keep the temporary arrays of `hash_tokens` and `_same_tokens` small
+            for start in range(0, len(encoded), _HASH_CHUNKSIZE):
+                chunk = encoded[start:start + _HASH_CHUNKSIZE]
+                hashes = hash_tokens(chunk)
+                positions = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+                found = np.flatnonzero(self.hashes[positions] == hashes)
+                candidates = self.hash_ids[positions[found]]
+                same = self._same_tokens([chunk[position] for position in found], candidates)
+                ids[start + found[same]] = candidates[same]
+        if self.collisions:
+            for position, token in enumerate(encoded):
+                tokenid = self.collisions.get(token.decode('utf8'))
+                if tokenid is not None:
+                    ids[position] = tokenid
+        return ids
+
+    def _same_tokens(self, encoded, tokenids):
+        """Check which of the `encoded` tokens are equal to the tokens with ids `tokenids`, byte for byte.
+
+        Parameters
+        ----------
+        encoded : list of bytes
+            UTF-8 encoded tokens.
+        tokenids : numpy.ndarray
+            Id of the dictionary token to compare each of `encoded` with.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask of the equal tokens.
+
+        """
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        starts = self.token_offsets[tokenids]
+        same = lengths == self.token_offsets[tokenids + 1] - starts
+        if not same.any():
+            return same
+        # compare the bytes of all tokens of matching length at once: for each byte, the index of its token
+        # and its position within the token
+        query = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        query_starts = np.cumsum(lengths) - lengths
+        lengths = lengths[same]
+        token_index = np.repeat(np.flatnonzero(same), lengths)
+        within = np.arange(len(token_index)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        differ = query[query_starts[token_index] + within] != self.token_pool[starts[token_index] + within]
+        same[token_index[differ]] = False
+        return same
+
+    def doc2bow(self, document):
+        """Convert `document` into the bag-of-words (BoW) format = list of `(token_id, token_count)` tuples.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+
+        Return
+        ------
+        list of (int, int)
+            BoW representation of `document`, in ascending id order. Tokens not in the dictionary are ignored.
+
+        """
+        if isinstance(document, string_types):
+            raise TypeError("doc2bow expects an array of unicode tokens on input, not a single string")
+
+        counter = Counter(document)
+        result = {}
+        # plain Python from here on: numpy calls cost more than they save on the few tokens of one document
+        for tokenid, count in zip(self.lookup(list(counter)).tolist(), counter.values()):
+            if tokenid >= 0:
+                # sum up counts of the same token given both as str and as bytes
+                result[tokenid] = result.get(tokenid, 0) + count
+        return sorted(result.items())
+
+    def doc2idx(self, document, unknown_word_index=-1):
+        """Convert `document` (a list of words) into a list of indexes = list of `token_id`.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document
+        unknown_word_index : int, optional
+            Index to use for words not in the dictionary.
+
+        Returns
+        -------
+        list of int
+            Token ids for tokens in `document`, in the same order.
+
+        """
+        if isinstance(document, string_types):
+            raise TypeError("doc2idx expects an array of unicode tokens on input, not a single string")
+
+        return self.lookup(document, unknown_word_index).tolist()
+
+    def docs2idx(self, documents, unknown_word_index=-1):
+        """Convert many `documents` at once into token ids, with a single vectorized lookup.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents.
+        unknown_word_index : int, optional
+            Index to use for words not in the dictionary.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Token ids of all documents, concatenated, and the `indptr` array: ids of document `i` are
+            `ids[indptr[i]:indptr[i + 1]]`.
+
+        """
+        tokens, indptr = [], [0]
+        for document in documents:
+            if isinstance(document, string_types):
+                raise TypeError("docs2idx expects documents as arrays of unicode tokens, not single strings")
+            tokens.extend(document)
+            indptr.append(len(tokens))
+        return self.lookup(tokens, unknown_word_index), np.array(indptr, dtype=np.int64)
+
+    def docs2bow(self, documents, dtype=np.int64):
+        """Convert many `documents` at once into a sparse bag-of-words matrix.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents.
+        dtype : numpy.dtype, optional
+            Data type of the token counts.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            Matrix of shape (number of documents, `len(self)`), with one document per row.
+
+        """
+        ids, indptr = self.docs2idx(documents)
+        return ids2csr(ids, indptr, len(self), dtype=dtype)
+
+    def to_dictionary(self):
+        """Convert back into a regular, updatable :class:`~gensim.corpora.dictionary.Dictionary`.
+
+        Returns
+        -------
+        :class:`~gensim.corpora.dictionary.Dictionary`
+            Dictionary with the same ids and statistics.
+
+        """
+        from gensim.corpora.dictionary import Dictionary
+
+        result = Dictionary()
+        result.token2id = {self[tokenid]: tokenid for tokenid in range(len(self))}
+        result.dfs = {tokenid: int(freq) for tokenid, freq in enumerate(self.dfs)}
+        result.cfs = {tokenid: int(freq) for tokenid, freq in enumerate(self.cfs)}
+        result.num_docs = self.num_docs
+        result.num_pos = self.num_pos
+        result.num_nnz = self.num_nnz
+        return result
@@ -8,11 +8,15 @@
 
 from __future__ import with_statement
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Mapping
 import sys
 import logging
 import itertools
+import multiprocessing
+
+import numpy as np
+import scipy.sparse
 
 from gensim import utils
 
@@ -171,7 +175,7 @@ class Dictionary(utils.SaveLoad, Mapping):
         """
         return Dictionary(documents=documents)
 
-    def add_documents(self, documents, prune_at=2000000):
+    def add_documents(self, documents, prune_at=2000000, workers=1, chunksize=10000):
         """Update dictionary from a collection of `documents`.
 
         Parameters
@@ -182,6 +186,13 @@ class Dictionary(utils.SaveLoad, Mapping):
             Dictionary will try to keep no more than `prune_at` words in its mapping, to limit its RAM
             footprint, the correctness is not guaranteed.
             Use :meth:`~gensim.corpora.dictionary.Dictionary.filter_extremes` to perform proper filtering.
+        workers : int, optional
+            Number of worker processes. If greater than 1, `documents` are streamed to the workers in chunks of
+            `chunksize` documents, each chunk is counted into a partial dictionary, and the partial dictionaries
+            are merged into this one in the order of the input stream. Without pruning, the resulting token ids
+            and statistics are the same as with `workers=1`.
+        chunksize : int, optional
+            Number of documents per chunk sent to a worker process. Only used if `workers` is greater than 1.
 
         Examples
         --------
@@ -198,6 +209,10 @@ class Dictionary(utils.SaveLoad, Mapping):
             10
 
         """
+        if workers > 1:
+            self._add_documents_parallel(documents, prune_at, workers, chunksize)
+            return
+
         for docno, document in enumerate(documents):
             # log progress & run a regular check for pruning, once every 10k docs
             if docno % 10000 == 0:
@@ -213,6 +228,46 @@ class Dictionary(utils.SaveLoad, Mapping):
             self, self.num_docs, self.num_pos
         )
 
+    def _add_documents_parallel(self, documents, prune_at, workers, chunksize):
+        """Update dictionary from `documents`, counting chunks of documents in `workers` processes.
+
+        Parameters
+        ----------
+        documents : iterable of iterable of str
+            Input corpus.
+        prune_at : int
+            Maximum number of words kept in the mapping, checked after each merged chunk.
+        workers : int
+            Number of worker processes.
+        chunksize : int
+            Number of documents per chunk.
+
+        """
+        def merge(partial):
+            self.merge_with(partial)
+            if prune_at is not None and len(self) > prune_at:
+                self.filter_extremes(no_below=0, no_above=1.0, keep_n=prune_at)
+            logger.info("adding document #%i to %s", self.num_docs, self)
+
+        pool = multiprocessing.Pool(workers)
+        pending = deque()
+        try:
+            for chunk in utils.chunkize_serial(documents, chunksize):
+                pending.append(pool.apply_async(_partial_dictionary, (chunk,)))
+                # merge the partial dictionaries in the order they were sent, with at most 2 chunks per worker
+                # in flight, because multiprocessing.Pool would otherwise load the entire input into RAM
+                while len(pending) >= 2 * workers:
+                    merge(pending.popleft().get())
+            while pending:
+                merge(pending.popleft().get())
+        finally:
+            pool.terminate()
+
+        logger.info(
+            "built %s from %i documents (total %i corpus positions)",
+            self, self.num_docs, self.num_pos
+        )
+
     def doc2bow(self, document, allow_update=False, return_missing=False):
         """Convert `document` into the bag-of-words (BoW) format = list of `(token_id, token_count)` tuples.
 
@@ -313,6 +368,89 @@ class Dictionary(utils.SaveLoad, Mapping):
         document = [word if isinstance(word, unicode) else unicode(word, 'utf-8') for word in document]
         return [self.token2id.get(word, unknown_word_index) for word in document]
 
+    def docs2idx(self, documents, unknown_word_index=-1):
+        """Convert many `documents` at once into token ids, same as calling
+        :meth:`~gensim.corpora.dictionary.Dictionary.doc2idx` on each, but concatenated into flat arrays.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents.
+        unknown_word_index : int, optional
+            Index to use for words not in the dictionary.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Token ids of all documents, concatenated, and the `indptr` array: ids of document `i` are
+            `ids[indptr[i]:indptr[i + 1]]`.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import Dictionary
+            >>>
+            >>> dct = Dictionary([["a", "a", "b"], ["a", "c"]])
+            >>> ids, indptr = dct.docs2idx([["a", "c"], ["b", "not_in_dictionary"]])
+            >>> ids.tolist(), indptr.tolist()
+            ([0, 2, 1, -1], [0, 2, 4])
+
+        """
+        get = self.token2id.get
+        ids, indptr = [], [0]
+        for document in documents:
+            if isinstance(document, string_types):
+                raise TypeError("docs2idx expects documents as arrays of unicode tokens, not single strings")
+            document_ids = [get(word, unknown_word_index) for word in document]
+            if unknown_word_index in document_ids:
+                # second chance for tokens passed as utf8 bytes
+                document_ids = [
+                    get(unicode(word, 'utf-8'), unknown_word_index) if isinstance(word, bytes) else wordid
+                    for word, wordid in zip(document, document_ids)
+                ]
+            ids.extend(document_ids)
+            indptr.append(len(ids))
+        return np.array(ids, dtype=np.int64), np.array(indptr, dtype=np.int64)
+
+    def docs2bow(self, documents, dtype=np.int64):
+        """Convert many `documents` at once into a sparse bag-of-words matrix.
+
+        Same as :meth:`~gensim.corpora.dictionary.Dictionary.doc2bow` on each document, but the tokens are
+        counted with numpy into a single matrix, instead of creating a list of tuples per document.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Input documents.
+        dtype : numpy.dtype, optional
+            Data type of the token counts.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            Matrix of shape (number of documents, number of tokens in the dictionary), with one document per row,
+            widened up to the highest token id in `documents` + 1 if the ids have gaps.
+            Wrap it with `gensim.matutils.Sparse2Corpus(result, documents_columns=False)` to get a streamed corpus.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.corpora import Dictionary
+            >>>
+            >>> dct = Dictionary([["a", "a", "b"], ["a", "c"]])
+            >>> dct.docs2bow([["a", "c", "a"], ["b", "not_in_dictionary"]]).toarray()
+            array([[2, 0, 1],
+                   [0, 1, 0]])
+
+        """
+        ids, indptr = self.docs2idx(documents)
+        # ids may have gaps, e.g. after load_from_text(): only the ids in this batch matter, scanning
+        # the whole vocabulary for its highest id would cost more than the batch itself
+        num_terms = max(len(self.token2id), int(ids.max()) + 1 if len(ids) else 0)
+        return ids2csr(ids, indptr, num_terms, dtype=dtype)
+
     def filter_extremes(self, no_below=5, no_above=0.5, keep_n=100000, keep_tokens=None):
         """Filter out tokens in the dictionary by their frequency.
 
@@ -580,9 +718,11 @@ class Dictionary(utils.SaveLoad, Mapping):
                 new_id = len(self.token2id)
                 self.token2id[other_token] = new_id
                 self.dfs[new_id] = 0
+                self.cfs[new_id] = 0
             old2new[other_id] = new_id
             try:
                 self.dfs[new_id] += other.dfs[other_id]
+                self.cfs[new_id] = self.cfs.get(new_id, 0) + other.cfs[other_id]
             except Exception:
                 # `other` isn't a Dictionary (probably just a dict) => ignore dfs, keep going
                 pass
@@ -761,3 +901,57 @@ class Dictionary(utils.SaveLoad, Mapping):
             result, result.num_docs, result.num_pos
         )
         return result
+
+
+def _partial_dictionary(documents):
+    """Count a chunk of documents into a new dictionary, used by the worker processes
+    of :meth:`~gensim.corpora.dictionary.Dictionary.add_documents`.
+
+    Parameters
+    ----------
+    documents : list of list of str
+        Chunk of documents.
+
+    Returns
+    -------
+    :class:`~gensim.corpora.dictionary.Dictionary`
+        Dictionary of the tokens in `documents`, with ids in order of first appearance.
+
+    """
+    partial = Dictionary()
+    for document in documents:
+        partial.doc2bow(document, allow_update=True)
+    return partial
+
+
+def ids2csr(ids, indptr, num_terms, dtype=np.int64):
+    """Count token ids of documents into a sparse bag-of-words matrix.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        Token ids of all documents, concatenated. Negative ids (unknown tokens) are ignored.
+    indptr : numpy.ndarray
+        Token ids of document `i` are `ids[indptr[i]:indptr[i + 1]]`.
+    num_terms : int
+        Number of columns of the result.
+    dtype : numpy.dtype, optional
+        Data type of the token counts.
+
+    Returns
+    -------
+    :class:`scipy.sparse.csr_matrix`
+        Matrix of shape (number of documents, `num_terms`), with one document per row, in canonical format
+        (sorted token ids, no duplicate entries).
+
+    """
+    num_docs = len(indptr) - 1
+    rows = np.repeat(np.arange(num_docs, dtype=np.int64), np.diff(indptr))
+    known = ids >= 0
+    rows, cols = rows[known], ids[known]
+    # duplicate (row, col) entries are summed up = token counts
+    result = scipy.sparse.coo_matrix(
+        (np.ones(len(cols), dtype=dtype), (rows, cols)), shape=(num_docs, num_terms)
+    ).tocsr()
+    result.sum_duplicates()
+    return result
@@ -82,6 +82,43 @@ def argsort(x, topn=None, reverse=False):
     return most_extreme.take(np.argsort(x.take(most_extreme)))  # resort topn into order
 
 
+def argsort_rows(x, topn=None, reverse=False):
+    """Row-wise version of :func:`~gensim.matutils.argsort`, for a whole 2D array at once.
+
+    Parameters
+    ----------
+    x : array_like
+        2D array to get the smallest element indices from, one row at a time.
+    topn : int, optional
+        Number of indices of the smallest (greatest) elements to be returned for each row.
+        If not given, indices of all elements will be returned in ascending (descending) order.
+    reverse : bool, optional
+        Return the `topn` greatest elements in descending order,
+        instead of smallest elements in ascending order?
+
+    Returns
+    -------
+    numpy.ndarray
+        2D array of shape ``(x.shape[0], min(topn, x.shape[1]))``, with indices that sort each row
+        of `x` in the requested order.
+
+    """
+    x = np.asarray(x)
+    num_rows, num_cols = x.shape
+    if topn is None:
+        topn = num_cols
+    topn = min(topn, num_cols)
+    if topn <= 0:
+        return np.empty((num_rows, 0), dtype=np.intp)
+    if reverse:
+        x = -x
+    if topn >= num_cols:
+        return np.argsort(x, axis=1)[:, :topn]
+    rows = np.arange(num_rows)[:, np.newaxis]
+    most_extreme = np.argpartition(x, topn, axis=1)[:, :topn]
+    return most_extreme[rows, np.argsort(x[rows, most_extreme], axis=1)]  # resort topn of each row into order
+
+
 def corpus2csc(corpus, num_terms=None, dtype=np.float64, num_docs=None, num_nnz=None, printprogress=0):
     """Convert a streamed corpus in bag-of-words format into a sparse matrix `scipy.sparse.csc_matrix`,
     with documents as columns.
@@ -73,6 +73,27 @@ Create a callback to print progress information to the console:
     Epoch #4 start
     Epoch #4 end
 
+Save a checkpoint of a long training run every 10 minutes, and continue from the last one after a crash:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.models.callbacks import TrainingCheckpoint
+    >>> from gensim.test.utils import common_texts
+    >>>
+    >>> model = Word2Vec(vector_size=10, min_count=0)
+    >>> model.build_vocab(common_texts)
+    >>> model.save(get_tmpfile('w2v_untrained.model'))  # keep the vocabulary, the checkpoint only holds the weights
+    >>>
+    >>> checkpoint = TrainingCheckpoint(get_tmpfile('w2v_checkpoint'), every=600)
+    >>> result = model.train(common_texts, total_examples=model.corpus_count, epochs=5, callbacks=[checkpoint])
+    >>>
+    >>> # after a crash
+    >>> model = Word2Vec.load(get_tmpfile('w2v_untrained.model'))
+    >>> result = model.train(
+    ...     common_texts, total_examples=model.corpus_count, epochs=5, callbacks=[checkpoint],
+    ...     resume_from=get_tmpfile('w2v_checkpoint'))
+
 Create and bind a callback to a topic model. This callback will log the perplexity metric in real time:
 
 .. sourcecode:: pycon
@@ -90,9 +111,14 @@ Create and bind a callback to a topic model. This callback will log the perplexi
 import gensim
 import logging
 import copy
+import os
 import sys
+import threading
+from timeit import default_timer
 import numpy as np
 
+from gensim import utils
+
 if sys.version_info[0] >= 3:
     from queue import Queue
 else:
@@ -105,6 +131,8 @@ try:
 except ImportError:
     VISDOM_INSTALLED = False
 
+logger = logging.getLogger(__name__)
+
 
 class Metric(object):
     """Base Metric class for topic model evaluation metrics.
@@ -302,8 +330,18 @@ class PerplexityMetric(Metric):
 
         """
         super(PerplexityMetric, self).set_parameters(**kwargs)
-        corpus_words = sum(cnt for document in self.corpus for _, cnt in document)
-        perwordbound = self.model.bound(self.corpus) / corpus_words
+        from gensim.models.ldamodel import LdaModel, HeldOutCorpus  # avoid a circular import
+        corpus = self.corpus
+        if isinstance(self.model, LdaModel) and not isinstance(corpus, HeldOutCorpus):
+            # the same corpus is evaluated after every pass: convert it only once, and warm-start its inference
+            if getattr(self, '_heldout', (None, None))[0] is not corpus:
+                self._heldout = (corpus, HeldOutCorpus(corpus))
+            corpus = self._heldout[1]
+        if isinstance(corpus, HeldOutCorpus):
+            corpus_words = corpus.num_words
+        else:
+            corpus_words = sum(cnt for document in corpus for _, cnt in document)
+        perwordbound = self.model.bound(corpus) / corpus_words
         return np.exp2(-perwordbound)
 
 
@@ -644,3 +682,161 @@ class CallbackAny2Vec(object):
 
         """
         pass
+
+
+class TrainingCheckpoint(CallbackAny2Vec):
+    """Periodically save the weights and training progress of a :class:`~gensim.models.word2vec.Word2Vec`,
+    :class:`~gensim.models.doc2vec.Doc2Vec` or :class:`~gensim.models.fasttext.FastText` model, so that an
+    interrupted training can continue with `train(..., resume_from=path_prefix)`.
+
+    Unlike :meth:`~gensim.utils.SaveLoad.save`, a checkpoint only copies the weight matrices into memory-mapped
+    .npy files allocated when training starts, and pickles a few counters next to them: the position in the current
+    epoch, from which the learning rate is computed, the random state and the training loss.
+    Two sets of files are used in turn, so that a crash while writing a checkpoint leaves the previous one intact.
+
+    A checkpoint is written at the end of each epoch and, when training from `corpus_iterable`, after the first job
+    that finishes `every` seconds after the previous checkpoint. Jobs may finish out of order: training resumes after
+    the longest run of jobs from the start of the epoch that had all finished at that time, so jobs still running
+    in other threads, and jobs that finished before an earlier one, are trained again.
+
+    """
+    def __init__(self, path_prefix, every=600.0):
+        """
+
+        Parameters
+        ----------
+        path_prefix : str
+            Path prefix of the checkpoint files.
+        every : float, optional
+            Minimum number of seconds between two checkpoints within an epoch. If None, only checkpoint at the end
+            of each epoch.
+
+        """
+        self.path_prefix = path_prefix
+        self.every = every
+        self.lock = threading.Lock()
+        self.slot = 0
+        self.buffers = None
+        self.last_checkpoint = None
+
+    def on_train_begin(self, model):
+        """Allocate the checkpoint files, or reuse the ones of a checkpoint we are resuming from."""
+        if os.path.isfile(self.path_prefix + '.state'):
+            # keep the last good checkpoint, overwrite the other set of files first
+            self.slot = 1 - utils.unpickle(self.path_prefix + '.state')['slot']
+        self.buffers = []
+        for slot in range(2):
+            buffers = {}
+            for name, array in _checkpoint_arrays(model).items():
+                fname = self._array_fname(self.path_prefix, name, slot)
+                buffer = np.load(fname, mmap_mode='r+') if os.path.isfile(fname) else None
+                if buffer is None or buffer.shape != array.shape or buffer.dtype != array.dtype:
+                    buffer = np.lib.format.open_memmap(fname, mode='w+', dtype=array.dtype, shape=array.shape)
+                buffers[name] = buffer
+            self.buffers.append(buffers)
+        self.last_checkpoint = default_timer()
+
+    def on_batch_end(self, model):
+        """Write a checkpoint if `every` seconds have passed since the last one."""
+        if self.every is None or default_timer() - self.last_checkpoint < self.every:
+            return
+        if not self.lock.acquire(False):
+            return  # another worker thread is writing it
+        try:
+            if default_timer() - self.last_checkpoint >= self.every:
+                self.save(model, *model.epoch_progress)
+        finally:
+            self.lock.release()
+
+    def on_epoch_end(self, model):
+        """Write a checkpoint of the finished epoch."""
+        with self.lock:
+            self.save(model, model.epoch_progress[0] + 1, 0, 0)
+
+    def on_train_end(self, model):
+        self.buffers = None
+
+    def save(self, model, epoch, examples, words):
+        """Write the current weights of `model` into the next set of checkpoint files.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec` or subclass
+            Model being trained.
+        epoch : int
+            Epoch to resume training from.
+        examples : int
+            Number of examples (sentences or documents) already trained in `epoch`.
+        words : int
+            Number of raw words in these examples.
+
+        """
+        start = default_timer()
+        buffers = self.buffers[self.slot]
+        for name, array in _checkpoint_arrays(model).items():
+            buffers[name][...] = array
+            buffers[name].flush()
+        state = {
+            'slot': self.slot, 'epoch': epoch, 'examples': examples, 'words': words,
+            'random_state': model.random.get_state(), 'running_training_loss': model.running_training_loss,
+        }
+        utils.pickle(state, self.path_prefix + '.state.tmp')
+        os.replace(self.path_prefix + '.state.tmp', self.path_prefix + '.state')  # atomic switch to the new files
+        self.slot = 1 - self.slot
+        self.last_checkpoint = default_timer()
+        logger.info(
+            "saved checkpoint %s at epoch %i after %i examples in %.2fs",
+            self.path_prefix, epoch, examples, self.last_checkpoint - start,
+        )
+
+    @staticmethod
+    def restore(model, path_prefix):
+        """Load the weights and random state of the last checkpoint saved under `path_prefix` into `model`.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec` or subclass
+            Model with the same vocabulary and settings as the checkpointed one.
+        path_prefix : str
+            Path prefix of the checkpoint files.
+
+        Returns
+        -------
+        (int, int, int)
+            The epoch to resume from, and the number of examples and raw words already trained in it.
+
+        """
+        state = utils.unpickle(path_prefix + '.state')
+        for name, array in _checkpoint_arrays(model).items():
+            saved = np.load(TrainingCheckpoint._array_fname(path_prefix, name, state['slot']), mmap_mode='r')
+            if saved.shape != array.shape:
+                raise ValueError(
+                    "checkpoint %s does not match the model: %s has shape %s, expected %s"
+                    % (path_prefix, name, saved.shape, array.shape)
+                )
+            array[...] = saved
+        if hasattr(model.wv, 'adjust_vectors'):
+            model.wv.adjust_vectors()  # FastText word vectors are computed from the trained ones
+        model.random.set_state(state['random_state'])
+        model.running_training_loss = state['running_training_loss']
+        logger.info(
+            "resuming from checkpoint %s at epoch %i after %i examples", path_prefix, state['epoch'], state['examples'],
+        )
+        return state['epoch'], state['examples'], state['words']
+
+    @staticmethod
+    def _array_fname(path_prefix, name, slot):
+        return '%s.%s.%i.npy' % (path_prefix, name, slot)
+
+
+def _checkpoint_arrays(model):
+    """Get the weight matrices updated by training `model`, by name."""
+    arrays = {}
+    for owner_name, owner, attrs in [
+            ('', model, ('syn1', 'syn1neg')),
+            ('wv.', model.wv, ('vectors', 'vectors_vocab', 'vectors_ngrams')),
+            ('dv.', getattr(model, 'dv', None), ('vectors',))]:
+        for attr in attrs:
+            if getattr(owner, attr, None) is not None:
+                arrays[owner_name + attr] = getattr(owner, attr)
+    return arrays
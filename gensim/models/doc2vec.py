@@ -63,21 +63,30 @@ Infer vector for a new document:
 
     >>> vector = model.infer_vector(["system", "response"])
 
+Infer vectors for many new documents at once, in several threads:
+
+.. sourcecode:: pycon
+
+    >>> vectors = model.infer_vectors([["system", "response"], ["graph", "trees"]], workers=2)
+
 """
 
 import logging
 import os
+import threading
+from queue import Queue
 from collections import namedtuple, defaultdict
 from collections.abc import Iterable
 from timeit import default_timer
 
 from dataclasses import dataclass
-from numpy import zeros, float32 as REAL, vstack, integer, dtype
+from numpy import float32 as REAL, vstack, integer, dtype
 import numpy as np
 
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
 from gensim.utils import deprecated
 from gensim.models import Word2Vec, FAST_VERSION  # noqa: F401
+from gensim.models.word2vec import WordIdCorpus
 from gensim.models.keyedvectors import KeyedVectors, pseudorandom_weak_vector
 
 logger = logging.getLogger(__name__)
@@ -431,7 +440,7 @@ class Doc2Vec(Word2Vec):
 
     def train(self, corpus_iterable=None, corpus_file=None, total_examples=None, total_words=None,
               epochs=None, start_alpha=None, end_alpha=None,
-              word_count=0, queue_factor=2, report_delay=1.0, callbacks=(),
+              word_count=0, queue_factor=2, report_delay=1.0, callbacks=(), resume_from=None,
               **kwargs):
         """Update the model's neural weights.
 
@@ -452,11 +461,12 @@ class Doc2Vec(Word2Vec):
             Can be simply a list of elements, but for larger corpora,consider an iterable that streams
             the documents directly from disk/network. If you don't supply `documents` (or `corpus_file`), the model is
             left uninitialized -- use if you plan to initialize it in some other way.
-        corpus_file : str, optional
+        corpus_file : {str, :class:`~gensim.models.word2vec.WordIdCorpus`}, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
             You may use this argument instead of `documents` to get performance boost. Only one of `documents` or
             `corpus_file` arguments need to be passed (not both of them). Documents' tags are assigned automatically
             and are equal to line number, as in :class:`~gensim.models.doc2vec.TaggedLineDocument`.
+            A corpus converted to word ids is tagged by row number instead.
         total_examples : int, optional
             Count of documents.
         total_words : int, optional
@@ -483,6 +493,9 @@ class Doc2Vec(Word2Vec):
             Seconds to wait before reporting progress.
         callbacks : :obj: `list` of :obj: `~gensim.models.callbacks.CallbackAny2Vec`, optional
             List of callbacks that need to be executed/run at specific stages during training.
+        resume_from : str, optional
+            Path prefix of a :class:`~gensim.models.callbacks.TrainingCheckpoint` saved by an interrupted call
+            of `train()` with the same arguments. Load its weights and continue training where it stopped.
 
         """
         if corpus_file is None and corpus_iterable is None:
@@ -491,13 +504,16 @@ class Doc2Vec(Word2Vec):
         if corpus_file is not None and corpus_iterable is not None:
             raise TypeError("Both corpus_file and corpus_iterable must not be provided at the same time")
 
-        if corpus_iterable is None and not os.path.isfile(corpus_file):
+        if corpus_iterable is None and not (isinstance(corpus_file, WordIdCorpus) or os.path.isfile(corpus_file)):
             raise TypeError("Parameter corpus_file must be a valid path to a file, got %r instead" % corpus_file)
 
         if corpus_iterable is not None and not isinstance(corpus_iterable, Iterable):
             raise TypeError("corpus_iterable must be an iterable of TaggedDocument, got %r instead" % corpus_iterable)
 
-        if corpus_file is not None:
+        if isinstance(corpus_file, WordIdCorpus):
+            # each worker reads its own range of rows, tagged with their row numbers
+            kwargs['offsets'] = kwargs['start_doctags'] = [0] * self.workers
+        elif corpus_file is not None:
             # Calculate offsets for each worker along with initial doctags (doctag ~ document/line number in a file)
             offsets, start_doctags = self._get_offsets_and_start_doctags_for_corpusfile(corpus_file, self.workers)
             kwargs['offsets'] = offsets
@@ -507,7 +523,8 @@ class Doc2Vec(Word2Vec):
             corpus_iterable=corpus_iterable, corpus_file=corpus_file,
             total_examples=total_examples, total_words=total_words,
             epochs=epochs, start_alpha=start_alpha, end_alpha=end_alpha, word_count=word_count,
-            queue_factor=queue_factor, report_delay=report_delay, callbacks=callbacks, **kwargs)
+            queue_factor=queue_factor, report_delay=report_delay, callbacks=callbacks, resume_from=resume_from,
+            **kwargs)
 
     @classmethod
     def _get_offsets_and_start_doctags_for_corpusfile(cls, corpus_file, workers):
@@ -608,21 +625,109 @@ class Doc2Vec(Word2Vec):
             The inferred paragraph vector for the new document.
 
         """
-        if isinstance(doc_words, str):  # a common mistake; fail with a nicer error
-            raise TypeError("Parameter doc_words of infer_vector() must be a list of strings (not a single string).")
-
         alpha = alpha or self.alpha
         min_alpha = min_alpha or self.min_alpha
         epochs = epochs or self.epochs
 
-        doctag_vectors = pseudorandom_weak_vector(self.dv.vector_size, seed_string=' '.join(doc_words))
-        doctag_vectors = doctag_vectors.reshape(1, self.dv.vector_size)
+        doctag_vectors = np.empty((1, self.dv.vector_size), dtype=REAL)
+        work, neu1 = self._get_thread_working_mem()
+        self._infer_document(doc_words, doctag_vectors, alpha, min_alpha, epochs, work, neu1)
+        return doctag_vectors[0]
 
+    def infer_vectors(self, documents, alpha=None, min_alpha=None, epochs=None, workers=None, out=None):
+        """Infer vectors for many post-bulk training documents, in several threads.
+
+        Gives the same vectors as calling :meth:`~gensim.models.doc2vec.Doc2Vec.infer_vector` on each document, but
+        spreads the documents over worker threads. Each thread reuses its own working memory, and the inference
+        kernels release the GIL, so that all cores are used.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            The documents for which the vector representations will be inferred. Their number must be known,
+            with `len(documents)` or from the number of rows of `out`.
+        alpha : float, optional
+            The initial learning rate. If unspecified, value from model initialization will be reused.
+        min_alpha : float, optional
+            Learning rate will linearly drop to `min_alpha` over all inference epochs. If unspecified,
+            value from model initialization will be reused.
+        epochs : int, optional
+            Number of times to train each document. If unspecified, the `epochs` value
+            from model initialization will be reused.
+        workers : int, optional
+            Number of worker threads. If unspecified, value from model initialization will be reused.
+        out : numpy.ndarray, optional
+            C-contiguous float32 matrix with a row for each document, to write the vectors into.
+            If unspecified, a new matrix is allocated.
+
+        Returns
+        -------
+        numpy.ndarray
+            The inferred vector of each document, one per row.
+
+        """
+        alpha = alpha or self.alpha
+        min_alpha = min_alpha or self.min_alpha
+        epochs = epochs or self.epochs
+        workers = workers or self.workers
+
+        if out is None:
+            out = np.empty((len(documents), self.dv.vector_size), dtype=REAL)
+        elif out.dtype != REAL or out.ndim != 2 or out.shape[1] != self.dv.vector_size \
+                or not out.flags.c_contiguous:
+            raise ValueError(
+                "out must be a C-contiguous %s matrix with %i columns" % (dtype(REAL), self.dv.vector_size))
+
+        job_queue = Queue(maxsize=2 * workers)
+        errors = []
+
+        def worker_loop():
+            work, neu1 = self._get_thread_working_mem()
+            while True:
+                job = job_queue.get()
+                if job is None:
+                    break
+                if errors:
+                    continue  # drain the queue, so that the producer doesn't block
+                start, job_documents = job
+                try:
+                    for index, doc_words in enumerate(job_documents, start):
+                        self._infer_document(doc_words, out[index:index + 1], alpha, min_alpha, epochs, work, neu1)
+                except Exception as err:
+                    errors.append(err)
+
+        threads = [threading.Thread(target=worker_loop) for _ in range(workers)]
+        for thread in threads:
+            thread.daemon = True  # make interrupting the process with ctrl+c easier
+            thread.start()
+
+        count = 0
+        try:
+            for job_documents in utils.chunkize_serial(documents, chunksize=100):
+                if count + len(job_documents) > len(out):
+                    raise ValueError("more documents than rows in out (%i)" % len(out))
+                job_queue.put((count, job_documents))
+                count += len(job_documents)
+        finally:
+            for _ in threads:
+                job_queue.put(None)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+        if count != len(out):
+            raise ValueError("%i documents for %i rows in out" % (count, len(out)))
+        return out
+
+    def _infer_document(self, doc_words, doctag_vectors, alpha, min_alpha, epochs, work, neu1):
+        """Train a new document vector into `doctag_vectors`, a 1-row matrix, with frozen words and weights."""
+        if isinstance(doc_words, str):  # a common mistake; fail with a nicer error
+            raise TypeError("Parameter doc_words of infer_vector() must be a list of strings (not a single string).")
+
+        doctag_vectors[0] = pseudorandom_weak_vector(self.dv.vector_size, seed_string=' '.join(doc_words))
         doctags_lockf = np.ones(1, dtype=REAL)
         doctag_indexes = [0]
-        work = zeros(self.layer1_size, dtype=REAL)
-        if not self.sg:
-            neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
 
         alpha_delta = (alpha - min_alpha) / max(epochs - 1, 1)
 
@@ -644,8 +749,6 @@ class Doc2Vec(Word2Vec):
                 )
             alpha -= alpha_delta
 
-        return doctag_vectors[0]
-
     def __getitem__(self, tag):
         """Get the vector representation of (possible multi-term) tag.
 
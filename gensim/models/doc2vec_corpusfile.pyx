@@ -43,6 +43,7 @@ from gensim.models.word2vec_corpusfile cimport (
     VocabItem,
     CythonVocab,
     CythonLineSentence,
+    CythonWordIdStream,
     get_alpha,
     get_next_alpha,
     cvocab_t
@@ -50,6 +51,7 @@ from gensim.models.word2vec_corpusfile cimport (
 
 DEF MAX_DOCUMENT_LEN = 10000
 
+cdef np.uint32_t UNKNOWN_WORD_ID = 0xFFFFFFFF  # out-of-vocabulary marker in a WordIdCorpus
 cdef int ONE = 1
 cdef REAL_t ONEF = <REAL_t>1.0
 
@@ -94,6 +96,47 @@ cdef void prepare_c_structures_for_batch(
         effective_words[0] += 1
 
 
+cdef void prepare_c_structures_for_id_document(
+        np.uint32_t *doc_ids, long long doc_len, int sample, int hs, int window, long long *total_words,
+        int *effective_words, unsigned long long *next_random, VocabItem *items,
+        np.uint32_t *indexes, int *codelens, np.uint8_t **codes, np.uint32_t **points,
+        np.uint32_t *reduced_windows, int *document_len, int train_words,
+        int docvecs_count, int doc_tag,
+    ) nogil:
+    """Same as `prepare_c_structures_for_batch`, for a document read from a word id stream."""
+    cdef VocabItem *predict_word
+    cdef long long j
+    cdef int i = 0
+
+    total_words[0] += doc_len
+
+    for j in range(doc_len):
+        if doc_ids[j] == UNKNOWN_WORD_ID:  # shrink document to leave out word
+            continue  # leaving i unchanged
+
+        predict_word = &items[doc_ids[j]]
+        if sample and predict_word.sample_int < random_int32(next_random):
+            continue
+        indexes[i] = predict_word.index
+        if hs:
+            codelens[i] = predict_word.code_len
+            codes[i] = predict_word.code
+            points[i] = predict_word.point
+
+        effective_words[0] += 1
+        i += 1
+        if i == MAX_DOCUMENT_LEN:
+            break
+    document_len[0] = i
+
+    if train_words and reduced_windows != NULL:
+        for i in range(document_len[0]):
+            reduced_windows[i] = random_int32(next_random) % window
+
+    if doc_tag < docvecs_count:
+        effective_words[0] += 1
+
+
 def d2v_train_epoch_dbow(
         model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
         _expected_words, work, neu1, docvecs_count, word_vectors=None, words_lockf=None,
@@ -108,8 +151,9 @@ def d2v_train_epoch_dbow(
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`,
+        in which case `start_doctag` is ignored and each document is tagged with its row number.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -152,7 +196,9 @@ def d2v_train_epoch_dbow(
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, document_len
@@ -162,6 +208,8 @@ def d2v_train_epoch_dbow(
     cdef int sent_idx, idx_start, idx_end
 
     cdef vector[string] doc_words
+    cdef np.uint32_t *doc_ids
+    cdef long long doc_len
     cdef long long _doc_tag = start_doctag
 
     init_d2v_config(
@@ -171,19 +219,35 @@ def d2v_train_epoch_dbow(
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
+            if from_ids:
+                _doc_tag = id_stream.row
+                doc_ids = id_stream.read_document(&doc_len)
+            else:
+                doc_words = input_stream.read_sentence()
+                doc_len = doc_words.size()
 
-            if doc_words.empty():
+            if doc_len == 0:
                 continue
 
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
-                c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if from_ids:
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points,
+                    c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
+                    c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 if c.train_words:  # simultaneous skip-gram wordvec-training
@@ -250,8 +314,9 @@ def d2v_train_epoch_dm(
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`,
+        in which case `start_doctag` is ignored and each document is tagged with its row number.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -291,7 +356,9 @@ def d2v_train_epoch_dm(
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k, m, document_len
@@ -302,6 +369,8 @@ def d2v_train_epoch_dm(
     cdef REAL_t count, inv_count = 1.0
 
     cdef vector[string] doc_words
+    cdef np.uint32_t *doc_ids
+    cdef long long doc_len
     cdef long long _doc_tag = start_doctag
 
     init_d2v_config(
@@ -311,19 +380,35 @@ def d2v_train_epoch_dm(
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
+            if from_ids:
+                _doc_tag = id_stream.row
+                doc_ids = id_stream.read_document(&doc_len)
+            else:
+                doc_words = input_stream.read_sentence()
+                doc_len = doc_words.size()
 
-            if doc_words.empty():
+            if doc_len == 0:
                 continue
 
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
-                vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
-                &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if from_ids:
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points,
+                    c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+                    vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+                    &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 j = i - c.window + c.reduced_windows[i]
@@ -404,8 +489,9 @@ def d2v_train_epoch_dm_concat(
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`,
+        in which case `start_doctag` is ignored and each document is tagged with its row number.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -445,7 +531,9 @@ def d2v_train_epoch_dm_concat(
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k, m, n, document_len
@@ -455,6 +543,8 @@ def d2v_train_epoch_dm_concat(
     cdef int sent_idx, idx_start, idx_end
 
     cdef vector[string] doc_words
+    cdef np.uint32_t *doc_ids
+    cdef long long doc_len
     cdef long long _doc_tag = start_doctag
 
     init_d2v_config(
@@ -464,11 +554,21 @@ def d2v_train_epoch_dm_concat(
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
+            if from_ids:
+                _doc_tag = id_stream.row
+                doc_ids = id_stream.read_document(&doc_len)
+            else:
+                doc_words = input_stream.read_sentence()
+                doc_len = doc_words.size()
 
             # FIXME? These next 2 lines look fishy to me (gojomo). First, skipping to
             # 'total_documents' (end) seems it'd do nothing useful. Second, assigning
@@ -480,17 +580,24 @@ def d2v_train_epoch_dm_concat(
             # whole duplicate-logic of corpus_file mode removed in favor of an approach
             # with less duplication. So I'm not sure anything is broken & it's far from
             # a near-term priority - thus leaving this note.
-            _doc_tag = total_documents
+            if not from_ids:
+                _doc_tag = total_documents
             c.doctag_len = _doc_tag < c.docvecs_count
 
              # skip doc either empty or without expected number of tags
-            if doc_words.empty() or c.expected_doctag_len != c.doctag_len:
+            if doc_len == 0 or c.expected_doctag_len != c.doctag_len:
                 continue
 
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
-                c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if from_ids:
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes,
+                    c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
+                    c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 j = i - c.window      # negative OK: will pad with null word
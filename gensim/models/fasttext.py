@@ -260,7 +260,7 @@ import numpy as np
 from numpy import ones, vstack, float32 as REAL
 
 import gensim.models._fasttext_bin
-from gensim.models.word2vec import Word2Vec
+from gensim.models.word2vec import Word2Vec, WordIdCorpus
 from gensim.models.keyedvectors import KeyedVectors
 from gensim import utils
 from gensim.utils import deprecated
@@ -640,7 +640,7 @@ class FastText(Word2Vec):
 
     def train(self, corpus_iterable=None, corpus_file=None, total_examples=None, total_words=None,
               epochs=None, start_alpha=None, end_alpha=None,
-              word_count=0, queue_factor=2, report_delay=1.0, callbacks=(), **kwargs):
+              word_count=0, queue_factor=2, report_delay=1.0, callbacks=(), resume_from=None, **kwargs):
         """Update the model's neural weights from a sequence of sentences (can be a once-only generator stream).
         For FastText, each sentence must be a list of unicode strings.
 
@@ -661,8 +661,9 @@ class FastText(Word2Vec):
             consider an iterable that streams the sentences directly from disk/network.
             See :class:`~gensim.models.word2vec.BrownCorpus`, :class:`~gensim.models.word2vec.Text8Corpus`
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
-        corpus_file : str, optional
-            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        corpus_file : {str, :class:`~gensim.models.word2vec.WordIdCorpus`}, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a corpus converted
+            to word ids.
             If you use this argument instead of `sentences`, you must provide `total_words` argument as well. Only one
             of `sentences` or `corpus_file` arguments need to be passed (not both of them).
         total_examples : int
@@ -691,6 +692,9 @@ class FastText(Word2Vec):
             Seconds to wait before reporting progress.
         callbacks : :obj: `list` of :obj: `~gensim.models.callbacks.CallbackAny2Vec`
             List of callbacks that need to be executed/run at specific stages during training.
+        resume_from : str, optional
+            Path prefix of a :class:`~gensim.models.callbacks.TrainingCheckpoint` saved by an interrupted call
+            of `train()` with the same arguments. Load its weights and continue training where it stopped.
 
         Examples
         --------
@@ -711,7 +715,7 @@ class FastText(Word2Vec):
         if corpus_file is not None and corpus_iterable is not None:
             raise TypeError("Both corpus_file and corpus_iterable must not be provided at the same time")
 
-        if corpus_iterable is None and not os.path.isfile(corpus_file):
+        if corpus_iterable is None and not (isinstance(corpus_file, WordIdCorpus) or os.path.isfile(corpus_file)):
             raise TypeError("Parameter corpus_file must be a valid path to a file, got %r instead" % corpus_file)
 
         if corpus_iterable is not None and not isinstance(corpus_iterable, Iterable):
@@ -721,7 +725,7 @@ class FastText(Word2Vec):
             corpus_iterable=corpus_iterable, corpus_file=corpus_file,
             total_examples=total_examples, total_words=total_words,
             epochs=epochs, start_alpha=start_alpha, end_alpha=end_alpha, word_count=word_count,
-            queue_factor=queue_factor, report_delay=report_delay, callbacks=callbacks)
+            queue_factor=queue_factor, report_delay=report_delay, callbacks=callbacks, resume_from=resume_from)
         self.wv.adjust_vectors()
 
     @deprecated(
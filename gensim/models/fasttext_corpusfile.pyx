@@ -32,6 +32,7 @@ from gensim.models.word2vec_corpusfile cimport (
     VocabItem,
     CythonVocab,
     CythonLineSentence,
+    CythonWordIdStream,
     get_alpha,
     get_next_alpha,
     cvocab_t
@@ -40,6 +41,7 @@ from gensim.models.word2vec_corpusfile cimport (
 ctypedef np.float32_t REAL_t
 DEF MAX_SENTENCE_LEN = 10000
 DEF MAX_SUBWORDS = 1000
+cdef np.uint32_t UNKNOWN_WORD_ID = 0xFFFFFFFF  # out-of-vocabulary marker in a WordIdCorpus
 
 
 cdef void prepare_c_structures_for_batch(
@@ -92,6 +94,60 @@ cdef void prepare_c_structures_for_batch(
         reduced_windows[i] = random_int32(next_random) % window
 
 
+cdef long long prepare_c_structures_for_id_batch(
+        CythonWordIdStream stream, int sample, int hs, int window, long long *total_words,
+        int *effective_words, int *effective_sentences, unsigned long long *next_random, VocabItem *items,
+        int *sentence_idx, np.uint32_t *indexes, int *codelens, np.uint8_t **codes, np.uint32_t **points,
+        np.uint32_t *reduced_windows, int *subwords_idx_len, np.uint32_t **subwords_idx) nogil:
+    """Same as `prepare_c_structures_for_batch`, but read up to MAX_SENTENCE_LEN word ids from `stream`.
+
+    Returns the number of sentences read.
+
+    """
+    cdef VocabItem *word
+    cdef np.uint32_t *sent
+    cdef long long sent_len, batch_words = 0, num_sentences = 0
+
+    sentence_idx[0] = 0  # indices of the first sentence always start at 0
+    while not stream.is_eof():
+        if batch_words and batch_words + stream.next_sentence_length() > MAX_SENTENCE_LEN:
+            break
+        sent = stream.read_sentence(&sent_len)
+        num_sentences += 1
+        if sent_len == 0:
+            continue  # ignore empty sentences; leave effective_sentences unchanged
+        batch_words += sent_len
+        total_words[0] += sent_len
+
+        for i in range(sent_len):
+            # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+            if sent[i] == UNKNOWN_WORD_ID:
+                continue
+
+            word = &items[sent[i]]
+            if sample and word.sample_int < random_int32(next_random):
+                continue
+            indexes[effective_words[0]] = word.index
+            subwords_idx_len[effective_words[0]] = word.subword_idx_len
+            subwords_idx[effective_words[0]] = word.subword_idx
+
+            if hs:
+                codelens[effective_words[0]] = word.code_len
+                codes[effective_words[0]] = word.code
+                points[effective_words[0]] = word.point
+
+            effective_words[0] += 1
+
+        effective_sentences[0] += 1
+        sentence_idx[effective_sentences[0]] = effective_words[0]
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i in range(effective_words[0]):
+        reduced_windows[i] = random_int32(next_random) % window
+
+    return num_sentences
+
+
 def train_epoch_sg(
         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
@@ -102,8 +158,8 @@ def train_epoch_sg(
     ----------
     model : :class:`~gensim.models.fasttext.FastText`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -128,8 +184,11 @@ def train_epoch_sg(
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
+    cdef long long num_sentences
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
@@ -143,17 +202,29 @@ def train_epoch_sg(
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
+            if from_ids:
+                num_sentences = prepare_c_structures_for_id_batch(
+                    id_stream, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_items_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
 
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
-                c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -173,7 +244,7 @@ def train_epoch_sg(
                         if c.negative:
                             fasttext_fast_sentence_sg_neg(&c, i, j)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
@@ -192,8 +263,8 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     ----------
     model : :class:`~gensim.models.fasttext.FastText`
         The FastText model instance to train.
-    corpus_file : str
-        Path to a corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -218,8 +289,11 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
+    cdef long long num_sentences
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
@@ -233,17 +307,29 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
+            if from_ids:
+                num_sentences = prepare_c_structures_for_id_batch(
+                    id_stream, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_items_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
 
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
-                c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -261,7 +347,7 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
                     if c.negative:
                         fasttext_fast_sentence_cbow_neg(&c, i, j, k)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
@@ -52,6 +52,7 @@ The model can be updated (trained) with new documents via
 from __future__ import with_statement
 
 import logging
+import multiprocessing
 import time
 import warnings
 
@@ -68,6 +69,7 @@ logger = logging.getLogger(__name__)
 
 meanchangethresh = 0.00001
 rhot_bound = 0.0
+e_step_batch_size = 2 ** 21  # max number of (document x word x topic) entries of a single batched E step
 
 
 def expect_log_sticks(sticks):
@@ -141,6 +143,172 @@ def lda_e_step(doc_word_ids, doc_word_counts, alpha, beta, max_iter=100):
     return likelihood, gamma
 
 
+def _log_normalize(x):
+    """Normalize `x` in log space along its last axis, like :func:`~gensim.matutils.ret_log_normalize_vec` does
+    along the rows of a matrix.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Array of log values.
+
+    Returns
+    -------
+    numpy.ndarray
+        Log values of `x`, normalized so that their exponentials sum up to 1 along the last axis.
+
+    """
+    log_shift = 100.0 - np.log(x.shape[-1] + 1.0) - np.max(x, -1)
+    log_norm = np.log(np.sum(np.exp(x + log_shift[..., np.newaxis]), -1)) - log_shift
+    return x - log_norm[..., np.newaxis]
+
+
+def _expect_log_sticks_batch(sticks):
+    """Same as :func:`~gensim.models.hdpmodel.expect_log_sticks`, for sticks of shape (documents, 2, K - 1)."""
+    dig_sum = psi(np.sum(sticks, 1))
+    ElogW = psi(sticks[:, 0]) - dig_sum
+    Elog1_W = psi(sticks[:, 1]) - dig_sum
+
+    Elogsticks = np.zeros((sticks.shape[0], sticks.shape[2] + 1))
+    Elogsticks[:, :-1] = ElogW
+    Elogsticks[:, 1:] += np.cumsum(Elog1_W, 1)
+    return Elogsticks
+
+
+def batch_e_step(Elogbeta, Elogsticks_1st, docs, K, alpha, var_converge, max_iter=100):
+    """Performs the E step of :meth:`~gensim.models.hdpmodel.HdpModel.doc_e_step` for many documents at once.
+
+    Documents of similar lengths are padded to the same length and iterated together, as arrays of shape
+    (documents, words, topics), each document until it converges on its own. The results are the same as those of
+    :meth:`~gensim.models.hdpmodel.HdpModel.doc_e_step` up to rounding, which can still make a document whose
+    likelihood stalls stop at a different iteration.
+
+    Parameters
+    ----------
+    Elogbeta : numpy.ndarray
+        Expected log topic-word probabilities of shape (T, number of words), of the words in `docs` only.
+    Elogsticks_1st : numpy.ndarray
+        Computed Elogsticks value by stick-breaking process.
+    docs : list of (numpy.ndarray, numpy.ndarray)
+        Column indices into `Elogbeta` and counts of the words of each document.
+    K : int
+        Second level truncation level.
+    alpha : float
+        Second level concentration.
+    var_converge : float
+        Lower bound on the right side of convergence.
+    max_iter : int, optional
+        Maximum number of iterations per document.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        The likelihood of each document, and the sufficient statistics of the top level sticks (shape (T, ))
+        and of the topics (same shape as `Elogbeta`) for all of `docs`.
+
+    """
+    T = Elogbeta.shape[0]
+    likelihoods = np.zeros(len(docs))
+    var_sticks_ss = np.zeros(T)
+    var_beta_ss = np.zeros(Elogbeta.shape)
+
+    lengths = np.array([len(ids) for ids, _ in docs], dtype=np.intp)
+    order = [d for d in np.argsort(lengths, kind='mergesort') if lengths[d] > 0]
+    start = 0
+    while start < len(order):
+        # group documents of similar lengths, so that padding them to the same length wastes little
+        end = start + 1
+        while end < len(order) and (end + 1 - start) * lengths[order[end]] * T <= e_step_batch_size:
+            end += 1
+        batch = order[start:end]
+        start = end
+
+        num_docs, length = len(batch), lengths[batch[-1]]
+        ids = np.zeros((num_docs, length), dtype=np.intp)
+        counts = np.zeros((num_docs, length))
+        for i, d in enumerate(batch):
+            ids[i, :lengths[d]], counts[i, :lengths[d]] = docs[d]
+        mask = np.arange(length) < lengths[batch][:, np.newaxis]
+
+        Elogbeta_docs = Elogbeta.T[ids]  # (documents, words, T)
+        Elogbeta_counts = Elogbeta_docs * counts[:, :, np.newaxis]
+
+        # `phi.T * Elogbeta_counts` of the uniform initial phi; later, of the phi of the previous iteration
+        phi = np.ones((num_docs, length, K)) * 1.0 / K
+        phi_Elogbeta = np.matmul(phi.transpose(0, 2, 1), Elogbeta_counts)
+        Elogsticks_2nd = np.zeros((num_docs, K))
+        old_likelihood = np.full(num_docs, -1e200)
+        left = np.array(batch)  # documents that haven't converged yet; the arrays above only keep those
+
+        iter = 0
+        # same updates as in HdpModel.doc_e_step, for all documents at once
+        while len(left):
+            # var_phi
+            var_phi = phi_Elogbeta + Elogsticks_1st if iter >= 3 else phi_Elogbeta
+            log_var_phi = _log_normalize(var_phi)
+            var_phi = np.exp(log_var_phi)
+
+            # phi
+            phi = np.matmul(Elogbeta_docs, var_phi.transpose(0, 2, 1))
+            if iter >= 3:
+                phi += Elogsticks_2nd[:, np.newaxis, :]
+            log_phi = _log_normalize(phi)
+            phi = np.exp(log_phi)
+
+            # v
+            phi_all = phi * counts[:, :, np.newaxis]
+            v = np.zeros((len(left), 2, K - 1))
+            v[:, 0] = 1.0 + np.sum(phi_all[:, :, :K - 1], 1)
+            phi_cum = np.flip(np.sum(phi_all[:, :, 1:], 1), 1)
+            v[:, 1] = alpha + np.flip(np.cumsum(phi_cum, 1), 1)
+            Elogsticks_2nd = _expect_log_sticks_batch(v)
+            phi_Elogbeta = np.matmul(phi.transpose(0, 2, 1), Elogbeta_counts)
+
+            # compute likelihood
+            likelihood = np.sum((Elogsticks_1st - log_var_phi) * var_phi, (1, 2))
+            likelihood += (K - 1) * np.log(alpha)
+            dig_sum = psi(np.sum(v, 1))
+            likelihood += np.sum(
+                (np.array([1.0, alpha])[:, np.newaxis] - v) * (psi(v) - dig_sum[:, np.newaxis, :]), (1, 2)
+            )
+            likelihood -= np.sum(gammaln(np.sum(v, 1)), 1) - np.sum(gammaln(v), (1, 2))
+            likelihood += np.sum(
+                (Elogsticks_2nd[:, np.newaxis, :] - log_phi) * phi * mask[:, :, np.newaxis], (1, 2)
+            )
+            likelihood += np.sum(var_phi * phi_Elogbeta, (1, 2))  # the data part
+
+            converge = (likelihood - old_likelihood) / np.abs(old_likelihood)
+            if np.any(converge < -0.000001):
+                logger.warning('likelihood is decreasing!')
+            iter += 1
+
+            keep = (converge < 0.0) | (converge > var_converge)
+            if iter >= max_iter:
+                keep[:] = False
+            if np.all(keep):
+                old_likelihood = likelihood
+                continue
+
+            # update the suff stats with the documents that are done
+            done = ~keep
+            likelihoods[left[done]] = likelihood[done]
+            var_sticks_ss += np.sum(var_phi[done], (0, 1))
+            beta_ss = np.matmul(phi_all[done], var_phi[done])  # (documents, words, T)
+            np.add.at(var_beta_ss.T, ids[done][mask[done]], beta_ss[mask[done]])
+
+            left, old_likelihood = left[keep], likelihood[keep]
+            ids, counts, mask = ids[keep], counts[keep], mask[keep]
+            Elogbeta_docs, Elogbeta_counts = Elogbeta_docs[keep], Elogbeta_counts[keep]
+            phi_Elogbeta, Elogsticks_2nd = phi_Elogbeta[keep], Elogsticks_2nd[keep]
+
+    return likelihoods, var_sticks_ss, var_beta_ss
+
+
+def _batch_e_step_job(args):
+    """Run :func:`~gensim.models.hdpmodel.batch_e_step` with a tuple of arguments, in a worker process."""
+    return batch_e_step(*args)
+
+
 class SuffStats(object):
     """Stores sufficient statistics for the current chunk of document(s) whenever Hdp model is updated with new corpus.
     These stats are used when updating lambda and top level sticks. The statistics include number of documents in the
@@ -296,7 +464,7 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
     def __init__(self, corpus, id2word, max_chunks=None, max_time=None,
                  chunksize=256, kappa=1.0, tau=64.0, K=15, T=150, alpha=1,
                  gamma=1, eta=0.01, scale=1.0, var_converge=0.0001,
-                 outputdir=None, random_state=None):
+                 outputdir=None, random_state=None, workers=1):
         """
 
         Parameters
@@ -336,6 +504,9 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         random_state : {None, int, array_like, :class:`~np.random.RandomState`, optional}
             Adds a little random jitter to randomize results around same alpha when trying to fetch a closest
             corresponding lda model from :meth:`~gensim.models.hdpmodel.HdpModel.suggested_lda_model`
+        workers : int, optional
+            Number of worker processes for training. With more than one, the documents of each chunk are split
+            between the processes, and their sufficient statistics merged before updating the topics.
 
         """
         self.corpus = corpus
@@ -344,6 +515,7 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         self.max_chunks = max_chunks
         self.max_time = max_time
         self.outputdir = outputdir
+        self.workers = workers
 
         self.random_state = utils.get_random_state(random_state)
 
@@ -465,27 +637,36 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         chunks_processed = 0
         start_time = time.perf_counter()
 
-        while True:
-            for chunk in utils.grouper(corpus, self.chunksize):
-                self.update_chunk(chunk)
-                self.m_num_docs_processed += len(chunk)
-                chunks_processed += 1
-
-                if self.update_finished(start_time, chunks_processed, self.m_num_docs_processed):
-                    self.update_expectations()
-                    alpha, beta = self.hdp_to_lda()
-                    self.lda_alpha = alpha
-                    self.lda_beta = beta
-                    self.print_topics(20)
-                    if self.outputdir:
-                        self.save_topics()
-                    return
-
-                elif chunks_processed % save_freq == 0:
-                    self.update_expectations()
-                    # self.save_topics(self.m_num_docs_processed)
-                    self.print_topics(20)
-                    logger.info('PROGRESS: finished document %i of %i', self.m_num_docs_processed, self.m_D)
+        workers = getattr(self, 'workers', 1)
+        pool = None
+        if workers > 1:
+            logger.info("training HDP model using %i processes", workers)
+            pool = multiprocessing.Pool(workers)
+        try:
+            while True:
+                for chunk in utils.grouper(corpus, self.chunksize):
+                    self.update_chunk(chunk, pool=pool)
+                    self.m_num_docs_processed += len(chunk)
+                    chunks_processed += 1
+
+                    if self.update_finished(start_time, chunks_processed, self.m_num_docs_processed):
+                        self.update_expectations()
+                        alpha, beta = self.hdp_to_lda()
+                        self.lda_alpha = alpha
+                        self.lda_beta = beta
+                        self.print_topics(20)
+                        if self.outputdir:
+                            self.save_topics()
+                        return
+
+                    elif chunks_processed % save_freq == 0:
+                        self.update_expectations()
+                        # self.save_topics(self.m_num_docs_processed)
+                        self.print_topics(20)
+                        logger.info('PROGRESS: finished document %i of %i', self.m_num_docs_processed, self.m_D)
+        finally:
+            if pool is not None:
+                pool.terminate()
 
     def update_finished(self, start_time, chunks_processed, docs_processed):
         """Flag to determine whether the model has been updated with the new corpus or not.
@@ -517,7 +698,7 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             # no limits and whole corpus has been processed once
             or (not self.max_chunks and not self.max_time and docs_processed >= self.m_D))
 
-    def update_chunk(self, chunk, update=True, opt_o=True):
+    def update_chunk(self, chunk, update=True, opt_o=True, pool=None):
         """Performs lazy update on necessary columns of lambda and variational inference for documents in the chunk.
 
         Parameters
@@ -529,6 +710,8 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         opt_o : bool, optional
             Passed as argument to :meth:`~gensim.models.hdpmodel.HdpModel.update_lambda`.
             If True then the topics will be ordered, False otherwise.
+        pool : :class:`multiprocessing.pool.Pool`, optional
+            Worker processes to split the documents of the chunk between.
 
         Returns
         -------
@@ -558,19 +741,38 @@ class HdpModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         Elogsticks_1st = expect_log_sticks(self.m_var_sticks)  # global sticks
 
-        # run variational inference on some new docs
-        score = 0.0
-        count = 0
-        for doc in chunk:
-            if len(doc) > 0:
-                doc_word_ids, doc_word_counts = zip(*doc)
-                doc_score = self.doc_e_step(
-                    ss, Elogsticks_1st,
-                    unique_words, doc_word_ids,
-                    doc_word_counts, self.m_var_converge
+        # run variational inference on some new docs, all at once
+        docs = [
+            (np.array([unique_words[word_id] for word_id, _ in doc], dtype=np.intp),
+             np.array([cnt for _, cnt in doc], dtype=np.float64))
+            for doc in chunk if len(doc) > 0
+        ]
+        count = sum(cnt for doc in chunk for _, cnt in doc)
+        Elogbeta = self.m_Elogbeta[:, word_list]
+        if pool is None:
+            likelihoods, var_sticks_ss, var_beta_ss = batch_e_step(
+                Elogbeta, Elogsticks_1st, docs, self.m_K, self.m_alpha, self.m_var_converge
+            )
+            score = np.sum(likelihoods)
+            ss.m_var_sticks_ss += var_sticks_ss
+            ss.m_var_beta_ss += var_beta_ss
+        else:
+            # each process gets a part of the documents, and only the columns of their words
+            jobs, job_words = [], []
+            num_parts = max(1, min(getattr(self, 'workers', 1), len(docs)))
+            for part in np.array_split(np.arange(len(docs)), num_parts):
+                part_docs = [docs[d] for d in part]
+                words = np.unique(np.concatenate([ids for ids, _ in part_docs] or [np.zeros(0, dtype=np.intp)]))
+                part_docs = [(np.searchsorted(words, ids), cnts) for ids, cnts in part_docs]
+                jobs.append(
+                    (Elogbeta[:, words], Elogsticks_1st, part_docs, self.m_K, self.m_alpha, self.m_var_converge)
                 )
-                count += sum(doc_word_counts)
-                score += doc_score
+                job_words.append(words)
+            score = 0.0
+            for words, (likelihoods, var_sticks_ss, var_beta_ss) in zip(job_words, pool.map(_batch_e_step_job, jobs)):
+                score += np.sum(likelihoods)
+                ss.m_var_sticks_ss += var_sticks_ss
+                ss.m_var_beta_ss[:, words] += var_beta_ss
 
         if update:
             self.update_lambda(ss, word_list, opt_o)
@@ -178,9 +178,9 @@ from numpy import (
 )
 import numpy as np
 from scipy import stats
+from scipy.spatial.distance import cdist
 
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
-from gensim.corpora.dictionary import Dictionary
 from gensim.utils import deprecated
 
 
@@ -213,6 +213,7 @@ class KeyedVectors(utils.SaveLoad):
 
         self.vectors = zeros((count, vector_size), dtype=dtype)  # formerly known as syn0
         self.norms = None
+        self.normed_vectors = None  # optional cache of unit-normalized vectors, see fill_normed_vectors()
 
         # "expandos" are extra attributes stored for each key: {attribute_name} => numpy array of values of
         # this attribute, with one array value for each vector key.
@@ -239,6 +240,8 @@ class KeyedVectors(utils.SaveLoad):
         # ensure at least a 'None' in 'norms' to force recalc
         if not hasattr(self, 'norms'):
             self.norms = None
+        if not hasattr(self, 'normed_vectors'):
+            self.normed_vectors = None
         # ensure at least an empty 'expandos'
         if not hasattr(self, 'expandos'):
             self.expandos = {}
@@ -431,7 +434,10 @@ class KeyedVectors(utils.SaveLoad):
         index = self.get_index(key)
         if norm:
             self.fill_norms()
-            result = self.vectors[index] / self.norms[index]
+            if self.normed_vectors is not None:
+                result = self.normed_vectors[index]
+            else:
+                result = self.vectors[index] / self.norms[index]
         else:
             result = self.vectors[index]
 
@@ -481,6 +487,7 @@ class KeyedVectors(utils.SaveLoad):
             self.key_to_index[key] = target_index
             self.vectors[target_index] = vector
             self.next_index += 1
+            self.norms = None
         return target_index
 
     def add_vectors(self, keys, weights, extras=None, replace=False):
@@ -532,6 +539,7 @@ class KeyedVectors(utils.SaveLoad):
             self.vectors[in_vocab_idxs] = weights[in_vocab_mask]
             for attr, extra in extras:
                 self.expandos[attr][in_vocab_idxs] = extra[in_vocab_mask]
+        self.norms = None  # force recalculation of norms & any normed vectors cache on next use
 
     def __setitem__(self, keys, weights):
         """Add keys and theirs vectors in a manual way.
@@ -606,6 +614,10 @@ class KeyedVectors(utils.SaveLoad):
         To see which key corresponds to which vector = which array row, refer
         to the :attr:`~gensim.models.keyedvectors.KeyedVectors.index_to_key` attribute.
 
+        If the unit-normalized vectors have been cached with
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.fill_normed_vectors`, that cached array is returned
+        as-is, without any copying.
+
         Returns
         -------
         numpy.ndarray:
@@ -614,6 +626,8 @@ class KeyedVectors(utils.SaveLoad):
 
         """
         self.fill_norms()
+        if self.normed_vectors is not None:
+            return self.normed_vectors
         return self.vectors / self.norms[..., np.newaxis]
 
     def fill_norms(self, force=False):
@@ -622,10 +636,46 @@ class KeyedVectors(utils.SaveLoad):
 
         Any code which modifies vectors should ensure the accompanying norms are
         either recalculated or 'None', to trigger a full recalculation later on-request.
+        Recalculating the norms also discards any stale cache of unit-normalized vectors
+        previously created by :meth:`~gensim.models.keyedvectors.KeyedVectors.fill_normed_vectors`.
 
         """
         if self.norms is None or force:
             self.norms = np.linalg.norm(self.vectors, axis=1)
+            self.normed_vectors = None
+
+    def fill_normed_vectors(self, force=False):
+        """Ensure a cached `float32` copy of all vectors, scaled to unit length, is available.
+
+        Similarity queries such as :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar` then
+        score against this cache directly, instead of dividing all vectors by their norms on every query.
+        The cache costs as much RAM as the (`float32`) vectors themselves.
+
+        The cache is stored by :meth:`~gensim.models.keyedvectors.KeyedVectors.save` together with the norms.
+        Large arrays are stored in separate ``.npy`` files, so loading with ``KeyedVectors.load(fname, mmap='r')``
+        lets multiple processes share a single, page-cached copy of the normalized vectors:
+
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import common_texts, get_tmpfile
+            >>> from gensim.models import Word2Vec, KeyedVectors
+            >>>
+            >>> wv = Word2Vec(common_texts, vector_size=10, min_count=1).wv
+            >>> wv.fill_normed_vectors()
+            >>> wv.save(get_tmpfile("normed.kv"), separately=['vectors', 'normed_vectors'])
+            >>> wv = KeyedVectors.load(get_tmpfile("normed.kv"), mmap='r')  # no norms to recompute
+
+        Parameters
+        ----------
+        force : bool, optional
+            Recompute the cache (and norms) even if already present.
+
+        """
+        self.fill_norms(force=force)
+        if self.normed_vectors is None:
+            normed_vectors = np.empty(self.vectors.shape, dtype=REAL)
+            np.divide(self.vectors, self.norms[..., np.newaxis], out=normed_vectors, casting='unsafe')
+            self.normed_vectors = normed_vectors
 
     @property
     def index2entity(self):
@@ -736,11 +786,6 @@ class KeyedVectors(utils.SaveLoad):
         if isinstance(topn, Integral) and topn < 1:
             return []
 
-        if positive is None:
-            positive = []
-        if negative is None:
-            negative = []
-
         self.fill_norms()
         clip_end = clip_end or len(self.vectors)
 
@@ -748,6 +793,47 @@ class KeyedVectors(utils.SaveLoad):
             clip_start = 0
             clip_end = restrict_vocab
 
+        mean, all_keys = self._weighted_mean(positive, negative)
+
+        if indexer is not None and isinstance(topn, int):
+            return indexer.most_similar(mean, topn)
+
+        if self.normed_vectors is not None:
+            dists = dot(self.normed_vectors[clip_start:clip_end], mean)
+        else:
+            dists = dot(self.vectors[clip_start:clip_end], mean) / self.norms[clip_start:clip_end]
+        if not topn:
+            return dists
+        best = matutils.argsort(dists, topn=topn + len(all_keys), reverse=True)
+        # ignore (don't return) keys from the input
+        result = [
+            (self.index_to_key[sim + clip_start], float(dists[sim]))
+            for sim in best if (sim + clip_start) not in all_keys
+        ]
+        return result[:topn]
+
+    def _weighted_mean(self, positive=None, negative=None):
+        """Compute the unit-normalized weighted mean of the `positive` and `negative` query items.
+
+        Parameters
+        ----------
+        positive : list of (str or int or ndarray or (key, weight)), optional
+            Items that contribute positively, as accepted by
+            :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar`.
+        negative : list of (str or int or ndarray or (key, weight)), optional
+            Items that contribute negatively.
+
+        Returns
+        -------
+        (numpy.ndarray, set of int)
+            The unit-length mean vector, and indexes of the input keys (to be excluded from results).
+
+        """
+        if positive is None:
+            positive = []
+        if negative is None:
+            negative = []
+
         if isinstance(positive, KEY_TYPES) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
             positive = [positive]
@@ -774,20 +860,84 @@ class KeyedVectors(utils.SaveLoad):
         if not mean:
             raise ValueError("cannot compute similarity with no input")
         mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
+        return mean, all_keys
 
-        if indexer is not None and isinstance(topn, int):
-            return indexer.most_similar(mean, topn)
+    def most_similar_batch(self, queries, topn=10, clip_start=0, clip_end=None, restrict_vocab=None):
+        """Find the top-N most similar keys for many queries at once.
+
+        All queries are scored against the vectors with a single matrix-matrix product, and the
+        top-N candidates of every query are then selected with one batched partial sort. This is
+        much faster than calling :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar`
+        in a loop.
+
+        Parameters
+        ----------
+        queries : {list of (list, list), numpy.ndarray}
+            Either a list of `(positive, negative)` pairs, each in the format accepted by the `positive`
+            and `negative` parameters of :meth:`~gensim.models.keyedvectors.KeyedVectors.most_similar`,
+            or a 2D array with one query vector per row.
+        topn : int or None, optional
+            Number of top-N similar keys to return for each query, when `topn` is int. When `topn` is None,
+            then similarities for all keys are returned.
+        clip_start : int
+            Start clipping index.
+        clip_end : int
+            End clipping index.
+        restrict_vocab : int, optional
+            Optional integer which limits the range of vectors which are searched for most-similar values.
+            If specified, overrides any values of ``clip_start`` or ``clip_end``.
+
+        Returns
+        -------
+        list of list of (str, float) or numpy.ndarray
+            When `topn` is int, one sequence of (key, similarity) per query, with keys from each query excluded.
+            When `topn` is None, a 2D array of shape ``(number_of_queries, number_of_keys)``
+            holding the similarities of each query to all keys.
 
-        dists = dot(self.vectors[clip_start:clip_end], mean) / self.norms[clip_start:clip_end]
+        """
+        if isinstance(queries, ndarray):
+            if queries.ndim != 2:
+                raise ValueError("expected a 2D array of query vectors, got shape %s" % (queries.shape, ))
+            norms = np.linalg.norm(queries, axis=1)
+            norms[norms == 0.0] = 1.0  # leave zero vectors unchanged, like matutils.unitvec
+            means = (queries / norms[:, np.newaxis]).astype(REAL)
+            excluded = [set() for _ in range(len(means))]
+        else:
+            means, excluded = [], []
+            for positive, negative in queries:
+                mean, all_keys = self._weighted_mean(positive, negative)
+                means.append(mean)
+                excluded.append(all_keys)
+            means = array(means, dtype=REAL).reshape(len(means), self.vector_size)
+
+        if isinstance(topn, Integral) and topn < 1:
+            return [[] for _ in range(len(means))]
+
+        self.fill_norms()
+        clip_end = clip_end or len(self.vectors)
+
+        if restrict_vocab:
+            clip_start = 0
+            clip_end = restrict_vocab
+
+        if self.normed_vectors is not None:
+            dists = dot(means, self.normed_vectors[clip_start:clip_end].T)
+        else:
+            dists = dot(means, self.vectors[clip_start:clip_end].T)
+            dists /= self.norms[clip_start:clip_end]
         if not topn:
             return dists
-        best = matutils.argsort(dists, topn=topn + len(all_keys), reverse=True)
-        # ignore (don't return) keys from the input
-        result = [
-            (self.index_to_key[sim + clip_start], float(dists[sim]))
-            for sim in best if (sim + clip_start) not in all_keys
-        ]
-        return result[:topn]
+        num_excluded = max([len(all_keys) for all_keys in excluded] + [0])
+        best = matutils.argsort_rows(dists, topn=topn + num_excluded, reverse=True)
+        result = []
+        for query_no, all_keys in enumerate(excluded):
+            # ignore (don't return) keys from the input
+            sims = [
+                (self.index_to_key[sim + clip_start], float(dists[query_no, sim]))
+                for sim in best[query_no] if (sim + clip_start) not in all_keys
+            ]
+            result.append(sims[:topn])
+        return result
 
     def similar_by_word(self, word, topn=10, restrict_vocab=None):
         """Compatibility alias for similar_by_key()"""
@@ -882,72 +1032,126 @@ class KeyedVectors(utils.SaveLoad):
             If `pyemd <https://pypi.org/project/pyemd/>`_  isn't installed.
 
         """
+        return float(self.wmdistance_many(document1, [document2])[0])
+
+    def _wmd_nbow(self, document):
+        """Get the unique in-vocabulary tokens of `document`, with their unit-normed vectors and nBOW weights.
 
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+
+        Returns
+        -------
+        (list of str, numpy.ndarray, numpy.ndarray, int)
+            Unique tokens, 2D array of their unit-normed vectors, their normalized frequencies in `document`
+            and the number of out-of-vocabulary words removed from `document`.
+
+        """
+        counts = {}
+        for token in document:
+            if token in self:
+                counts[token] = counts.get(token, 0) + 1
+        tokens = list(counts)
+        doc_len = sum(counts.values())
+        num_oov = len(document) - doc_len
+        if not tokens:
+            return tokens, zeros((0, self.vector_size), dtype=double), zeros(0, dtype=double), num_oov
+        vectors = vstack([self.get_vector(token, norm=True) for token in tokens]).astype(double)
+        weights = array([counts[token] for token in tokens], dtype=double) / doc_len
+        return tokens, vectors, weights, num_oov
+
+    def wmdistance_many(self, query, documents):
+        """Compute the Word Mover's Distance between the `query` document and each of the `documents`.
+
+        The `query` tokens are looked up and normalized only once, and the distance matrix between the
+        words of each pair of documents is computed in bulk, so this is much faster than calling
+        :meth:`~gensim.models.keyedvectors.KeyedVectors.wmdistance` in a loop, e.g. when re-ranking
+        many candidate documents for a single query.
+
+        Parameters
+        ----------
+        query : list of str
+            Input document.
+        documents : iterable of list of str
+            Documents to compute the distance from `query` to.
+
+        Returns
+        -------
+        numpy.ndarray
+            Word Mover's distances between `query` and each document in `documents`, as a 1D float array.
+
+        Warnings
+        --------
+        This method only works if `pyemd <https://pypi.org/project/pyemd/>`_ is installed.
+
+        If the query or a document has no words that exist in the vocab, `float('inf')` (i.e. infinity)
+        will be returned for that pair.
+
+        Raises
+        ------
+        ImportError
+            If `pyemd <https://pypi.org/project/pyemd/>`_  isn't installed.
+
+        """
         # If pyemd C extension is available, import it.
         # If pyemd is attempted to be used, but isn't installed, ImportError will be raised in wmdistance
         from pyemd import emd
 
-        # Remove out-of-vocabulary words.
-        len_pre_oov1 = len(document1)
-        len_pre_oov2 = len(document2)
-        document1 = [token for token in document1 if token in self]
-        document2 = [token for token in document2 if token in self]
-        diff1 = len_pre_oov1 - len(document1)
-        diff2 = len_pre_oov2 - len(document2)
-        if diff1 > 0 or diff2 > 0:
-            logger.info('Removed %d and %d OOV words from document 1 and 2 (respectively).', diff1, diff2)
-
-        if not document1 or not document2:
-            logger.info(
-                "At least one of the documents had no words that were in the vocabulary. "
-                "Aborting (returning inf)."
-            )
-            return float('inf')
-
-        dictionary = Dictionary(documents=[document1, document2])
-        vocab_len = len(dictionary)
+        query_tokens, query_vectors, query_weights, query_oov = self._wmd_nbow(query)
+        query_index = {token: i for i, token in enumerate(query_tokens)}
+        num_query = len(query_tokens)
 
-        if vocab_len == 1:
-            # Both documents are composed by a single unique token
-            return 0.0
+        result = []
+        for document in documents:
+            doc_tokens, doc_vectors, doc_weights, doc_oov = self._wmd_nbow(document)
+            if query_oov > 0 or doc_oov > 0:
+                logger.info('Removed %d and %d OOV words from document 1 and 2 (respectively).', query_oov, doc_oov)
 
-        # Sets for faster look-up.
-        docset1 = set(document1)
-        docset2 = set(document2)
-
-        # Compute distance matrix.
-        distance_matrix = zeros((vocab_len, vocab_len), dtype=double)
-        for i, t1 in dictionary.items():
-            if t1 not in docset1:
+            if not query_tokens or not doc_tokens:
+                logger.info(
+                    "At least one of the documents had no words that were in the vocabulary. "
+                    "Aborting (returning inf)."
+                )
+                result.append(float('inf'))
                 continue
 
-            for j, t2 in dictionary.items():
-                if t2 not in docset2 or distance_matrix[i, j] != 0.0:
-                    continue
-
-                # Compute Euclidean distance between unit-normed word vectors.
-                distance_matrix[i, j] = distance_matrix[j, i] = np.sqrt(
-                    np_sum((self.get_vector(t1, norm=True) - self.get_vector(t2, norm=True))**2))
+            # Position of each document token in the union vocabulary: query tokens first, then any new ones.
+            doc_positions, vocab_len = [], num_query
+            for token in doc_tokens:
+                position = query_index.get(token)
+                if position is None:
+                    position = vocab_len
+                    vocab_len += 1
+                doc_positions.append(position)
+
+            if vocab_len == 1:
+                # Both documents are composed by a single unique token
+                result.append(0.0)
+                continue
 
-        if np_sum(distance_matrix) == 0.0:
-            # `emd` gets stuck if the distance matrix contains only zeros.
-            logger.info('The distance matrix is all zeros. Aborting (returning inf).')
-            return float('inf')
+            # Compute Euclidean distances between unit-normed word vectors, for all (query, document) word pairs.
+            distance_matrix = zeros((vocab_len, vocab_len), dtype=double)
+            pair_distances = cdist(query_vectors, doc_vectors)
+            distance_matrix[:num_query, doc_positions] = pair_distances
+            distance_matrix[doc_positions, :num_query] = pair_distances.T
 
-        def nbow(document):
-            d = zeros(vocab_len, dtype=double)
-            nbow = dictionary.doc2bow(document)  # Word frequencies.
-            doc_len = len(document)
-            for idx, freq in nbow:
-                d[idx] = freq / float(doc_len)  # Normalized word frequencies.
-            return d
+            if np_sum(distance_matrix) == 0.0:
+                # `emd` gets stuck if the distance matrix contains only zeros.
+                logger.info('The distance matrix is all zeros. Aborting (returning inf).')
+                result.append(float('inf'))
+                continue
 
-        # Compute nBOW representation of documents.
-        d1 = nbow(document1)
-        d2 = nbow(document2)
+            # Compute nBOW representation of documents.
+            d1 = zeros(vocab_len, dtype=double)
+            d1[:num_query] = query_weights
+            d2 = zeros(vocab_len, dtype=double)
+            d2[doc_positions] = doc_weights
 
-        # Compute WMD.
-        return emd(d1, d2, distance_matrix)
+            # Compute WMD.
+            result.append(emd(d1, d2, distance_matrix))
+        return array(result, dtype=double)
 
     def most_similar_cosmul(self, positive=None, negative=None, topn=10):
         """Find the top-N most similar words, using the multiplicative combination objective,
@@ -1014,8 +1218,12 @@ class KeyedVectors(utils.SaveLoad):
 
         # equation (4) of Levy & Goldberg "Linguistic Regularities...",
         # with distances shifted to [0,1] per footnote (7)
-        pos_dists = [((1 + dot(self.vectors, term) / self.norms) / 2) for term in positive]
-        neg_dists = [((1 + dot(self.vectors, term) / self.norms) / 2) for term in negative]
+        if self.normed_vectors is not None:
+            pos_dists = [((1 + dot(self.normed_vectors, term)) / 2) for term in positive]
+            neg_dists = [((1 + dot(self.normed_vectors, term)) / 2) for term in negative]
+        else:
+            pos_dists = [((1 + dot(self.vectors, term) / self.norms) / 2) for term in positive]
+            neg_dists = [((1 + dot(self.vectors, term) / self.norms) / 2) for term in negative]
         dists = prod(pos_dists, axis=0) / (prod(neg_dists, axis=0) + 0.000001)
 
         if not topn:
@@ -1475,6 +1683,7 @@ class KeyedVectors(utils.SaveLoad):
         self.fill_norms()
         self.vectors /= self.norms[..., np.newaxis]
         self.norms = np.ones((len(self.vectors),))
+        self.normed_vectors = None  # now redundant with `vectors`
 
     def relative_cosine_similarity(self, wa, wb, topn=10):
         """Compute the relative cosine similarity between two words given top-n similar words,
@@ -90,20 +90,29 @@ import numbers
 import os
 
 import numpy as np
+import scipy.sparse
 import six
 from scipy.special import gammaln, psi  # gamma function utils
 from scipy.special import polygamma
 from six.moves import range
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from gensim import interfaces, utils, matutils
 from gensim.matutils import (
     kullback_leibler, hellinger, jaccard_distance, jensen_shannon,
-    dirichlet_expectation, logsumexp, mean_absolute_difference
+    dirichlet_expectation, mean_absolute_difference
 )
 from gensim.models import basemodel, CoherenceModel
 from gensim.models.callbacks import Callback
 
+try:
+    from gensim.models.ldamodel_inner import e_step_chunk
+    FAST_INFERENCE = True
+except ImportError:
+    # fall back to the pure Python E step in `LdaModel.inference`
+    FAST_INFERENCE = False
+
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +156,82 @@ def update_dir_prior(prior, N, logphat, rho):
     return prior
 
 
+def chunk2csr(chunk, dtype=np.float32):
+    """Convert a chunk of BoW documents into the arrays of a CSR matrix.
+
+    Parameters
+    ----------
+    chunk : {list of list of (int, float), :class:`~gensim.models.ldamodel.HeldOutCorpus`}
+        Documents in BoW format.
+    dtype : numpy.dtype, optional
+        Data type of the returned counts.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        Offsets of the documents into the other two arrays (of length `len(chunk) + 1`), term ids and term counts.
+
+    """
+    if isinstance(chunk, HeldOutCorpus):
+        return chunk.indptr, chunk.ids, chunk.counts.astype(dtype, copy=False)
+    indptr = np.zeros(len(chunk) + 1, dtype=np.intp)
+    indptr[1:] = np.cumsum([len(doc) for doc in chunk])
+    ids = np.fromiter((idx for doc in chunk for idx, _ in doc), dtype=np.intp, count=indptr[-1])
+    counts = np.fromiter((cnt for doc in chunk for _, cnt in doc), dtype=dtype, count=indptr[-1])
+    return indptr, ids, counts
+
+
+class HeldOutCorpus(object):
+    """In-memory corpus for repeated evaluation of :class:`~gensim.models.ldamodel.LdaModel`, such as monitoring
+    :meth:`~gensim.models.ldamodel.LdaModel.log_perplexity` during training.
+
+    The documents are converted to CSR arrays once, instead of on every evaluation. The gammas inferred by each
+    :meth:`~gensim.models.ldamodel.LdaModel.bound` are kept as well, and used as the starting point of the next
+    inference, which then converges in fewer iterations as long as the model didn't change much.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import common_corpus, common_dictionary
+        >>> from gensim.models.ldamodel import LdaModel, HeldOutCorpus
+        >>>
+        >>> heldout = HeldOutCorpus(common_corpus[:3])
+        >>> model = LdaModel(common_corpus[3:], id2word=common_dictionary, num_topics=2)
+        >>> for _ in range(3):
+        ...     model.update(common_corpus[3:])
+        ...     perwordbound = model.log_perplexity(heldout)
+
+    """
+    def __init__(self, corpus):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Documents in BoW format.
+
+        """
+        lengths, ids, counts = [], [], []
+        for doc in corpus:
+            lengths.append(len(doc))
+            ids.extend(int(idx) for idx, _ in doc)
+            counts.extend(cnt for _, cnt in doc)
+        self.indptr = np.zeros(len(lengths) + 1, dtype=np.intp)
+        self.indptr[1:] = np.cumsum(lengths)
+        self.ids = np.array(ids, dtype=np.intp)
+        self.counts = np.array(counts, dtype=np.float64)
+        self.num_words = self.counts.sum()
+        self.gamma = None  # gammas inferred by the latest evaluation
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __iter__(self):
+        for start, end in zip(self.indptr[:-1].tolist(), self.indptr[1:].tolist()):
+            yield list(zip(self.ids[start:end].tolist(), self.counts[start:end].tolist()))
+
+
 class LdaState(utils.SaveLoad):
     """Encapsulate information for distributed computation of :class:`~gensim.models.ldamodel.LdaModel` objects.
 
@@ -194,6 +279,25 @@ class LdaState(utils.SaveLoad):
         self.sstats += other.sstats
         self.numdocs += other.numdocs
 
+    def merge_columns(self, ids, sstats, numdocs=0):
+        """Merge the sufficient statistics of an E step that only involved the terms `ids`.
+
+        Cheaper than :meth:`~gensim.models.ldamodel.LdaState.merge` with a full state, when the E step covered
+        only a small fraction of a large vocabulary.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Ids of the terms, without duplicates.
+        sstats : numpy.ndarray
+            Sufficient statistics of these terms, of shape (number of topics, `len(ids)`).
+        numdocs : int, optional
+            Number of documents of the E step.
+
+        """
+        self.sstats[:, ids] += sstats
+        self.numdocs += numdocs
+
     def blend(self, rhot, other, targetsize=None):
         """Merge the current state with another one using a weighted average for the sufficient statistics.
 
@@ -366,8 +470,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         id2word : {dict of (int, str), :class:`gensim.corpora.dictionary.Dictionary`}
             Mapping from word IDs to words. It is used to determine the vocabulary size, as well as for
             debugging and topic printing.
-        distributed : bool, optional
-            Whether distributed computing should be used to accelerate training.
+        distributed : {bool, :class:`~gensim.models.socket_dispatcher.SocketDispatcher`}, optional
+            Whether distributed computing should be used to accelerate training. True uses the Pyro4 dispatcher
+            (:mod:`gensim.models.lda_dispatcher`); alternatively pass a dispatcher object to use instead.
         chunksize :  int, optional
             Number of documents to be used in each training chunk.
         passes : int, optional
@@ -490,20 +595,28 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 raise NotImplementedError("auto-optimizing alpha not implemented in distributed LDA")
             # set up distributed version
             try:
-                import Pyro4
-                if ns_conf is None:
-                    ns_conf = {}
-
-                with utils.getNS(**ns_conf) as ns:
-                    from gensim.models.lda_dispatcher import LDA_DISPATCHER_PREFIX
-                    self.dispatcher = Pyro4.Proxy(ns.list(prefix=LDA_DISPATCHER_PREFIX)[LDA_DISPATCHER_PREFIX])
-                    logger.debug("looking for dispatcher at %s" % str(self.dispatcher._pyroUri))
+                if distributed is True:
+                    import Pyro4
+                    if ns_conf is None:
+                        ns_conf = {}
+
+                    with utils.getNS(**ns_conf) as ns:
+                        from gensim.models.lda_dispatcher import LDA_DISPATCHER_PREFIX
+                        self.dispatcher = Pyro4.Proxy(ns.list(prefix=LDA_DISPATCHER_PREFIX)[LDA_DISPATCHER_PREFIX])
+                        logger.debug("looking for dispatcher at %s" % str(self.dispatcher._pyroUri))
+                        self.dispatcher.initialize(
+                            id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
+                            alpha=alpha, eta=eta, distributed=False
+                        )
+                else:
+                    # a dispatcher object, such as gensim.models.socket_dispatcher.SocketDispatcher
+                    self.dispatcher = distributed
                     self.dispatcher.initialize(
-                        id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
-                        alpha=alpha, eta=eta, distributed=False
+                        'lda', id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
+                        alpha=alpha, eta=eta, distributed=False, dtype=self.dtype
                     )
-                    self.numworkers = len(self.dispatcher.getworkers())
-                    logger.info("using distributed version with %i workers", self.numworkers)
+                self.numworkers = len(self.dispatcher.getworkers())
+                logger.info("using distributed version with %i workers", self.numworkers)
             except Exception as err:
                 logger.error("failed to initialize distributed LDA (%s)", err)
                 raise RuntimeError("failed to initialize distributed LDA (%s)" % err)
@@ -623,7 +736,7 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         self.state = None
         self.Elogbeta = None
 
-    def inference(self, chunk, collect_sstats=False):
+    def inference(self, chunk, collect_sstats=False, gamma=None):
         """Given a chunk of sparse document vectors, estimate gamma (parameters controlling the topic weights)
         for each document in the chunk.
 
@@ -640,6 +753,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         collect_sstats : bool, optional
             If set to True, also collect (and return) sufficient statistics needed to update the model's topic-word
             distributions.
+        gamma : numpy.ndarray, optional
+            Initial gamma matrix, such as the result of an earlier inference on the same chunk. If not supplied,
+            it is initialized randomly.
 
         Returns
         -------
@@ -647,6 +763,23 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             The first element is always returned and it corresponds to the states gamma matrix. The second element is
             only returned if `collect_sstats` == True and corresponds to the sufficient statistics for the M step.
 
+        """
+        gamma, ids, sstats = self._inference(chunk, collect_sstats=collect_sstats, gamma=gamma)
+        if collect_sstats:
+            sstats_columns, sstats = sstats, np.zeros_like(self.expElogbeta, dtype=self.dtype)
+            sstats[:, ids] = sstats_columns
+        return gamma, sstats
+
+    def _inference(self, chunk, collect_sstats=False, gamma=None):
+        """Implement :meth:`~gensim.models.ldamodel.LdaModel.inference`, with the sufficient statistics restricted
+        to the terms that occur in `chunk`.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, {numpy.ndarray, None})
+            The gamma matrix, the sorted ids of the terms in `chunk`, and the columns of the sufficient statistics
+            for those terms, of shape (`self.num_topics`, `len(ids)`), if `collect_sstats` == True.
+
         """
         try:
             len(chunk)
@@ -657,63 +790,76 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             logger.debug("performing inference on a chunk of %i documents", len(chunk))
 
         # Initialize the variational distribution q(theta|gamma) for the chunk
-        gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics)).astype(self.dtype, copy=False)
+        if gamma is None:
+            gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics))
+            gamma = gamma.astype(self.dtype, copy=False)
+        else:
+            gamma = np.array(gamma, dtype=self.dtype)
         Elogtheta = dirichlet_expectation(gamma)
         expElogtheta = np.exp(Elogtheta)
 
         assert Elogtheta.dtype == self.dtype
         assert expElogtheta.dtype == self.dtype
 
+        # A chunk only touches a few of the terms: work with the columns of those terms only, renumbered
+        # to 0..len(ids)-1, so that the cost of the sufficient statistics doesn't depend on the vocabulary size.
+        indptr, chunk_ids, cts = chunk2csr(chunk, self.dtype)
+        ids, chunk_ids = np.unique(chunk_ids, return_inverse=True)
+        chunk_ids = chunk_ids.astype(np.intp, copy=False)
+        expElogbeta = np.ascontiguousarray(self.expElogbeta[:, ids])
+
         if collect_sstats:
-            sstats = np.zeros_like(self.expElogbeta, dtype=self.dtype)
+            sstats = np.zeros(expElogbeta.shape, dtype=self.dtype)
         else:
             sstats = None
         converged = 0
 
-        # Now, for each document d update that document's gamma and phi
-        # Inference code copied from Hoffman's `onlineldavb.py` (esp. the
-        # Lee&Seung trick which speeds things up by an order of magnitude, compared
-        # to Blei's original LDA-C code, cool!).
-        integer_types = six.integer_types + (np.integer,)
-        epsilon = np.finfo(self.dtype).eps
-        for d, doc in enumerate(chunk):
-            if len(doc) > 0 and not isinstance(doc[0][0], integer_types):
-                # make sure the term IDs are ints, otherwise np will get upset
-                ids = [int(idx) for idx, _ in doc]
-            else:
-                ids = [idx for idx, _ in doc]
-            cts = np.fromiter((cnt for _, cnt in doc), dtype=self.dtype, count=len(doc))
-            gammad = gamma[d, :]
-            Elogthetad = Elogtheta[d, :]
-            expElogthetad = expElogtheta[d, :]
-            expElogbetad = self.expElogbeta[:, ids]
-
-            # The optimal phi_{dwk} is proportional to expElogthetad_k * expElogbetad_w.
-            # phinorm is the normalizer.
-            # TODO treat zeros explicitly, instead of adding epsilon?
-            phinorm = np.dot(expElogthetad, expElogbetad) + epsilon
-
-            # Iterate between gamma and phi until convergence
-            for _ in range(self.iterations):
-                lastgamma = gammad
-                # We represent phi implicitly to save memory and time.
-                # Substituting the value of the optimal phi back into
-                # the update for gamma gives this update. Cf. Lee&Seung 2001.
-                gammad = self.alpha + expElogthetad * np.dot(cts / phinorm, expElogbetad.T)
-                Elogthetad = dirichlet_expectation(gammad)
-                expElogthetad = np.exp(Elogthetad)
+        if FAST_INFERENCE and self.dtype in (np.float32, np.float64):
+            # Same E step as below, run over the whole chunk in compiled code without the GIL.
+            converged = e_step_chunk(
+                gamma, expElogbeta, self.alpha, indptr, chunk_ids, cts,
+                self.iterations, self.gamma_threshold, sstats
+            )
+        else:
+            # Now, for each document d update that document's gamma and phi
+            # Inference code copied from Hoffman's `onlineldavb.py` (esp. the
+            # Lee&Seung trick which speeds things up by an order of magnitude, compared
+            # to Blei's original LDA-C code, cool!).
+            epsilon = np.finfo(self.dtype).eps
+            for d in range(len(chunk)):
+                docids = chunk_ids[indptr[d]:indptr[d + 1]]
+                doccts = cts[indptr[d]:indptr[d + 1]]
+                gammad = gamma[d, :]
+                Elogthetad = Elogtheta[d, :]
+                expElogthetad = expElogtheta[d, :]
+                expElogbetad = expElogbeta[:, docids]
+
+                # The optimal phi_{dwk} is proportional to expElogthetad_k * expElogbetad_w.
+                # phinorm is the normalizer.
+                # TODO treat zeros explicitly, instead of adding epsilon?
                 phinorm = np.dot(expElogthetad, expElogbetad) + epsilon
-                # If gamma hasn't changed much, we're done.
-                meanchange = mean_absolute_difference(gammad, lastgamma)
-                if meanchange < self.gamma_threshold:
-                    converged += 1
-                    break
-            gamma[d, :] = gammad
-            assert gammad.dtype == self.dtype
-            if collect_sstats:
-                # Contribution of document d to the expected sufficient
-                # statistics for the M step.
-                sstats[:, ids] += np.outer(expElogthetad.T, cts / phinorm)
+
+                # Iterate between gamma and phi until convergence
+                for _ in range(self.iterations):
+                    lastgamma = gammad
+                    # We represent phi implicitly to save memory and time.
+                    # Substituting the value of the optimal phi back into
+                    # the update for gamma gives this update. Cf. Lee&Seung 2001.
+                    gammad = self.alpha + expElogthetad * np.dot(doccts / phinorm, expElogbetad.T)
+                    Elogthetad = dirichlet_expectation(gammad)
+                    expElogthetad = np.exp(Elogthetad)
+                    phinorm = np.dot(expElogthetad, expElogbetad) + epsilon
+                    # If gamma hasn't changed much, we're done.
+                    meanchange = mean_absolute_difference(gammad, lastgamma)
+                    if meanchange < self.gamma_threshold:
+                        converged += 1
+                        break
+                gamma[d, :] = gammad
+                assert gammad.dtype == self.dtype
+                if collect_sstats:
+                    # Contribution of document d to the expected sufficient
+                    # statistics for the M step.
+                    sstats[:, docids] += np.outer(expElogthetad.T, doccts / phinorm)
 
         if len(chunk) > 1:
             logger.debug("%i/%i documents converged within %i iterations", converged, len(chunk), self.iterations)
@@ -723,11 +869,11 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             # M step, so that
             # sstats[k, w] = \sum_d n_{dw} * phi_{dwk}
             # = \sum_d n_{dw} * exp{Elogtheta_{dk} + Elogbeta_{kw}} / phinorm_{dw}.
-            sstats *= self.expElogbeta
+            sstats *= expElogbeta
             assert sstats.dtype == self.dtype
 
         assert gamma.dtype == self.dtype
-        return gamma, sstats
+        return gamma, ids, sstats
 
     def do_estep(self, chunk, state=None):
         """Perform inference on a chunk of documents, and accumulate the collected sufficient statistics.
@@ -748,9 +894,8 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         """
         if state is None:
             state = self.state
-        gamma, sstats = self.inference(chunk, collect_sstats=True)
-        state.sstats += sstats
-        state.numdocs += gamma.shape[0]  # avoids calling len(chunk) on a generator
+        gamma, ids, sstats = self._inference(chunk, collect_sstats=True)
+        state.merge_columns(ids, sstats, gamma.shape[0])  # avoids calling len(chunk) on a generator
         assert gamma.dtype == self.dtype
         return gamma
 
@@ -812,8 +957,9 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         Parameters
         ----------
-        chunk : list of list of (int, float)
-            The corpus chunk on which the inference step will be performed.
+        chunk : {list of list of (int, float), :class:`~gensim.models.ldamodel.HeldOutCorpus`}
+            The corpus chunk on which the inference step will be performed. Evaluating the same documents repeatedly
+            is faster with a :class:`~gensim.models.ldamodel.HeldOutCorpus`.
         total_docs : int, optional
             Number of docs used for evaluation of the perplexity.
 
@@ -823,11 +969,19 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             The variational bound score calculated for each word.
 
         """
+        return self._log_perplexity(chunk, total_docs, self.bound)
+
+    def _log_perplexity(self, chunk, total_docs, bound):
+        """Implement :meth:`~gensim.models.ldamodel.LdaModel.log_perplexity`, with a given `bound` function
+        (of the same signature as :meth:`~gensim.models.ldamodel.LdaModel.bound`)."""
         if total_docs is None:
             total_docs = len(chunk)
-        corpus_words = sum(cnt for document in chunk for _, cnt in document)
+        if isinstance(chunk, HeldOutCorpus):
+            corpus_words = chunk.num_words
+        else:
+            corpus_words = sum(cnt for document in chunk for _, cnt in document)
         subsample_ratio = 1.0 * total_docs / len(chunk)
-        perwordbound = self.bound(chunk, subsample_ratio=subsample_ratio) / (subsample_ratio * corpus_words)
+        perwordbound = bound(chunk, subsample_ratio=subsample_ratio) / (subsample_ratio * corpus_words)
         logger.info(
             "%.3f per-word bound, %.1f perplexity estimate based on a held-out corpus of %i documents with %i words",
             perwordbound, np.exp2(-perwordbound), len(chunk), corpus_words
@@ -1069,9 +1223,10 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         Parameters
         ----------
-        corpus : iterable of list of (int, float), optional
+        corpus : {iterable of list of (int, float), :class:`~gensim.models.ldamodel.HeldOutCorpus`}, optional
             Stream of document vectors or sparse matrix of shape (`num_documents`, `num_terms`) used to estimate the
-            variational bounds.
+            variational bounds. For a :class:`~gensim.models.ldamodel.HeldOutCorpus`, the inference is warm-started
+            from the gammas of its previous evaluation.
         gamma : numpy.ndarray, optional
             Topic weight variational parameters for each document. If not supplied, it will be inferred from the model.
         subsample_ratio : float, optional
@@ -1089,25 +1244,26 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         _lambda = self.state.get_lambda()
         Elogbeta = dirichlet_expectation(_lambda)
 
-        for d, doc in enumerate(corpus):  # stream the input doc-by-doc, in case it's too large to fit in RAM
-            if d % self.chunksize == 0:
-                logger.debug("bound: at document #%i", d)
+        if isinstance(corpus, HeldOutCorpus):
             if gamma is None:
-                gammad, _ = self.inference([doc])
-            else:
-                gammad = gamma[d]
-            Elogthetad = dirichlet_expectation(gammad)
-
-            assert gammad.dtype == self.dtype
-            assert Elogthetad.dtype == self.dtype
-
-            # E[log p(doc | theta, beta)]
-            score += sum(cnt * logsumexp(Elogthetad + Elogbeta[:, int(id)]) for id, cnt in doc)
-
-            # E[log p(theta | alpha) - log q(theta | gamma)]; assumes alpha is a vector
-            score += np.sum((self.alpha - gammad) * Elogthetad)
-            score += np.sum(gammaln(gammad) - gammaln(self.alpha))
-            score += gammaln(np.sum(self.alpha)) - gammaln(np.sum(gammad))
+                # warm-start from the previous evaluation, unless that was a different model
+                warm_gamma = corpus.gamma
+                if warm_gamma is not None and warm_gamma.shape != (len(corpus), self.num_topics):
+                    warm_gamma = None
+                gamma, _ = self.inference(corpus, gamma=warm_gamma)
+                corpus.gamma = gamma
+            score += self._bound_chunk(corpus, gamma, Elogbeta)
+        else:
+            doc_no = 0
+            # stream the input chunk-by-chunk, in case it's too large to fit in RAM
+            for chunk in utils.grouper(corpus, self.chunksize):
+                logger.debug("bound: at document #%i", doc_no)
+                if gamma is None:
+                    gammachunk, _ = self.inference(chunk)
+                else:
+                    gammachunk = gamma[doc_no:doc_no + len(chunk)]
+                score += self._bound_chunk(chunk, gammachunk, Elogbeta)
+                doc_no += len(chunk)
 
         # Compensate likelihood for when `corpus` above is only a sample of the whole corpus. This ensures
         # that the likelihood is always roughly on the same scale.
@@ -1126,6 +1282,48 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         return score
 
+    def _bound_chunk(self, chunk, gamma, Elogbeta):
+        """Get the per-document terms of :meth:`~gensim.models.ldamodel.LdaModel.bound` for a chunk of documents.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), :class:`~gensim.models.ldamodel.HeldOutCorpus`}
+            Documents in BoW format.
+        gamma : numpy.ndarray
+            Topic weight variational parameters for each document of the chunk.
+        Elogbeta : numpy.ndarray
+            Expected value of the log of the topics.
+
+        Returns
+        -------
+        float
+            Sum of the document scores.
+
+        """
+        indptr, ids, cts = chunk2csr(chunk, self.dtype)
+        score = 0.0
+        # blocks of at most `chunksize` documents, to limit the memory taken by the (words x topics) arrays
+        for start in range(0, len(indptr) - 1, self.chunksize):
+            end = min(start + self.chunksize, len(indptr) - 1)
+            gammablock = gamma[start:end]
+            Elogtheta = dirichlet_expectation(gammablock)
+            assert gammablock.dtype == self.dtype
+            assert Elogtheta.dtype == self.dtype
+
+            # E[log p(doc | theta, beta)], with logsumexp over the topics of each word of each document
+            blockids = ids[indptr[start]:indptr[end]]
+            rows = np.repeat(np.arange(end - start), np.diff(indptr[start:end + 1]))
+            word_scores = Elogtheta[rows] + Elogbeta[:, blockids].T
+            max_scores = word_scores.max(axis=1) if len(rows) else np.zeros(0, dtype=self.dtype)
+            word_scores = np.log(np.exp(word_scores - max_scores[:, np.newaxis]).sum(axis=1)) + max_scores
+            score += np.dot(cts[indptr[start]:indptr[end]], word_scores)
+
+            # E[log p(theta | alpha) - log q(theta | gamma)]; assumes alpha is a vector
+            score += np.sum((self.alpha - gammablock) * Elogtheta)
+            score += np.sum(gammaln(gammablock) - gammaln(self.alpha))
+            score += np.sum(gammaln(np.sum(self.alpha)) - gammaln(np.sum(gammablock, axis=1)))
+        return score
+
     def show_topics(self, num_topics=10, num_words=10, log=False, formatted=True):
         """Get a representation for selected topics.
 
@@ -1368,6 +1566,120 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         return document_topics, word_topic, word_phi  # returns 2-tuple
 
+    def get_document_topics_batch(self, corpus, chunksize=None, workers=1, minimum_probability=None,
+                                  minimum_phi_value=None, per_word_topics=False, dense=False):
+        """Get the topic distributions of all documents in a corpus, as one matrix.
+
+        Unlike :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics`, which infers one document at a time,
+        the corpus is streamed through :meth:`~gensim.models.ldamodel.LdaModel.inference` in chunks, and
+        the results are kept in arrays rather than per-document lists.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Stream of documents in BOW format.
+        chunksize : int, optional
+            Number of documents to infer at once, defaults to the model's `chunksize`.
+        workers : int, optional
+            Number of threads to infer the chunks with, concurrently. Useful when the compiled E step
+            (:mod:`gensim.models.ldamodel_inner`) is available, as it runs without the GIL. The results
+            don't depend on it: the initial gamma of each chunk is drawn from the model's random state in
+            the calling thread, in the order of the chunks.
+        minimum_probability : float, optional
+            Topic probabilities lower than this threshold are set to zero.
+        minimum_phi_value : float, optional
+            If `per_word_topics` is True, phi values lower than this threshold are set to zero.
+        per_word_topics : bool, optional
+            If True, also return the phi values of each word of each document, see "Returns".
+        dense : bool, optional
+            If True, return the document topics as a dense array rather than a sparse matrix.
+
+        Returns
+        -------
+        {:class:`scipy.sparse.csr_matrix`, numpy.ndarray}
+            Topic distributions, of shape (number of documents, `num_topics`).
+        numpy.ndarray, optional
+            Offsets of the documents' words in the matrix of phi values below, of shape (number of documents + 1, ):
+            the words of document `d` are the rows `offsets[d]:offsets[d + 1]`, in the order of the document's BOW.
+            Only returned if `per_word_topics` is True.
+        :class:`scipy.sparse.csr_matrix`, optional
+            Phi values multiplied by the feature length, of shape (total number of words, `num_topics`), for
+            all words of all documents. Same values as the `word_phi` returned by
+            :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics`. Only returned if `per_word_topics` is True.
+
+        """
+        if minimum_probability is None:
+            minimum_probability = self.minimum_probability
+        minimum_probability = max(minimum_probability, 1e-8)  # never allow zero values in sparse output
+
+        if minimum_phi_value is None:
+            minimum_phi_value = self.minimum_probability
+        minimum_phi_value = max(minimum_phi_value, 1e-8)  # never allow zero values in sparse output
+
+        def infer(chunk, gamma):
+            return self._get_chunk_topics(
+                chunk, gamma, minimum_probability, minimum_phi_value, per_word_topics, dense)
+
+        def chunks_with_gamma():
+            for chunk in utils.grouper(corpus, chunksize or self.chunksize):
+                gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics))
+                yield chunk, gamma.astype(self.dtype, copy=False)
+
+        if workers > 1:
+            results, pending = [], deque()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for chunk, gamma in chunks_with_gamma():
+                    # keep only a few chunks in flight, so the corpus is streamed rather than read all at once
+                    if len(pending) >= 2 * workers:
+                        results.append(pending.popleft().result())
+                    pending.append(executor.submit(infer, chunk, gamma))
+                results.extend(future.result() for future in pending)
+        else:
+            results = [infer(chunk, gamma) for chunk, gamma in chunks_with_gamma()]
+
+        if not results:
+            empty = np.zeros((0, self.num_topics), dtype=self.dtype)
+            sparse_empty = scipy.sparse.csr_matrix(empty)
+            results = [(empty if dense else sparse_empty, np.zeros(0, dtype=np.intp), sparse_empty)]
+
+        doc_topics = [result[0] for result in results]
+        doc_topics = np.vstack(doc_topics) if dense else scipy.sparse.vstack(doc_topics, format='csr')
+        if not per_word_topics:
+            return doc_topics
+
+        offsets = np.zeros(doc_topics.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.concatenate([result[1] for result in results]), out=offsets[1:])
+        word_phis = scipy.sparse.vstack([result[2] for result in results], format='csr')
+        return doc_topics, offsets, word_phis
+
+    def _get_chunk_topics(self, chunk, gamma, minimum_probability, minimum_phi_value, per_word_topics, dense):
+        """Infer the topics of a single chunk, for :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics_batch`,
+        starting from the initial `gamma`.
+
+        Returns
+        -------
+        ({:class:`scipy.sparse.csr_matrix`, numpy.ndarray}, numpy.ndarray, :class:`scipy.sparse.csr_matrix`)
+            Topic distributions of the documents, and if `per_word_topics` is set, the number of words in each
+            document and the phi values of all words (None otherwise).
+
+        """
+        gamma, _ = self.inference(chunk, gamma=gamma)
+        doc_topics = gamma / gamma.sum(axis=1)[:, np.newaxis]  # normalize distributions
+        doc_topics[doc_topics < minimum_probability] = 0
+        if not dense:
+            doc_topics = scipy.sparse.csr_matrix(doc_topics)
+        if not per_word_topics:
+            return doc_topics, None, None
+
+        # phi_{dwk} = n_{dw} * expElogtheta_{dk} * expElogbeta_{kw} / phinorm_{dw}, for all words of all documents
+        indptr, ids, cts = chunk2csr(chunk, self.dtype)
+        lengths = np.diff(indptr)
+        expElogtheta = np.exp(dirichlet_expectation(gamma))
+        phis = np.repeat(expElogtheta, lengths, axis=0) * self.expElogbeta[:, ids].T
+        phis *= (cts / (phis.sum(axis=1) + np.finfo(self.dtype).eps))[:, np.newaxis]
+        phis[phis < minimum_phi_value] = 0
+        return doc_topics, lengths, scipy.sparse.csr_matrix(phis)
+
     def get_term_topics(self, word_id, minimum_probability=None):
         """Get the most relevant topics to the given word.
 
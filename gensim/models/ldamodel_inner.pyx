@@ -0,0 +1,188 @@
+#!/usr/bin/env cython
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# cython: embedsignature=True
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Optimized E step for :class:`~gensim.models.ldamodel.LdaModel`, used by
+:meth:`~gensim.models.ldamodel.LdaModel.inference` when compiled.
+
+The whole chunk is processed without holding the GIL, so several chunks may be inferred from different threads
+at once, as long as each thread collects its sufficient statistics into its own array.
+
+"""
+
+import numpy as np
+from libc.math cimport exp, fabs
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+
+from gensim._matutils cimport DTYPE_t, _digamma
+
+
+def e_step_chunk(gamma, expElogbeta, alpha, indptr, indices, counts, int iterations, double gamma_threshold,
+                 sstats=None):
+    """Run the variational E step on a CSR-encoded chunk of documents.
+
+    Same algorithm and convergence criterion as the pure Python loop in
+    :meth:`~gensim.models.ldamodel.LdaModel.inference`.
+
+    Parameters
+    ----------
+    gamma : numpy.ndarray
+        Initial topic weights of shape (num_documents, num_topics), C-contiguous float32 or float64.
+        Updated in place.
+    expElogbeta : numpy.ndarray
+        Topics of shape (num_topics, num_terms), same dtype as `gamma`.
+    alpha : numpy.ndarray
+        Document-topic prior of shape (num_topics, ).
+    indptr : numpy.ndarray
+        Offsets of the documents into `indices` and `counts`, of shape (num_documents + 1, ), dtype `numpy.intp`.
+    indices : numpy.ndarray
+        Term ids of all documents, concatenated, dtype `numpy.intp`.
+    counts : numpy.ndarray
+        Term counts matching `indices`, same dtype as `gamma`.
+    iterations : int
+        Maximum number of iterations per document.
+    gamma_threshold : float
+        Minimum mean change of a document's gamma to continue iterating.
+    sstats : numpy.ndarray, optional
+        If given, array of the same shape as `expElogbeta` to add the (not yet `expElogbeta`-scaled) sufficient
+        statistics into.
+
+    Returns
+    -------
+    int
+        Number of documents that converged within `iterations`.
+
+    """
+    dtype = gamma.dtype
+    if dtype != np.float32 and dtype != np.float64:
+        raise TypeError("unsupported dtype %s, expected float32 or float64" % dtype)
+    expElogbeta = np.ascontiguousarray(expElogbeta, dtype=dtype)
+    alpha = np.ascontiguousarray(alpha, dtype=dtype)
+    counts = np.ascontiguousarray(counts, dtype=dtype)
+    collect_sstats = sstats is not None
+    if not collect_sstats:
+        sstats = np.zeros((1, 1), dtype=dtype)  # placeholder, never written to
+
+    cdef int converged
+    if dtype == np.float64:
+        converged = _e_step_chunk[double](
+            gamma, expElogbeta, alpha, indptr, indices, counts,
+            iterations, gamma_threshold, np.finfo(dtype).eps, sstats, collect_sstats,
+        )
+    else:
+        converged = _e_step_chunk[float](
+            gamma, expElogbeta, alpha, indptr, indices, counts,
+            iterations, gamma_threshold, np.finfo(dtype).eps, sstats, collect_sstats,
+        )
+    return converged
+
+
+cdef void _exp_dirichlet_expectation(const DTYPE_t *alpha, DTYPE_t *out, Py_ssize_t size) nogil:
+    """Compute `exp(dirichlet_expectation(alpha))` of a single parameter vector into `out`."""
+    cdef DTYPE_t sum_alpha = 0.0
+    cdef DTYPE_t psi_sum_alpha
+    cdef Py_ssize_t i
+
+    for i in range(size):
+        sum_alpha += alpha[i]
+    psi_sum_alpha = _digamma(sum_alpha)
+    for i in range(size):
+        out[i] = <DTYPE_t>exp(_digamma(alpha[i]) - psi_sum_alpha)
+
+
+cdef void _phinorm(
+        const DTYPE_t *expElogthetad, const DTYPE_t[:, ::1] expElogbeta, const Py_ssize_t *ids, Py_ssize_t length,
+        DTYPE_t epsilon, DTYPE_t *out) nogil:
+    """Normalizer of the implicit `phi` for each word of a document, `dot(expElogthetad, expElogbetad) + eps`."""
+    cdef Py_ssize_t k, w
+    cdef Py_ssize_t num_topics = expElogbeta.shape[0]
+    cdef DTYPE_t total
+
+    for w in range(length):
+        total = 0.0
+        for k in range(num_topics):
+            total += expElogthetad[k] * expElogbeta[k, ids[w]]
+        out[w] = total + epsilon
+
+
+cdef int _e_step_chunk(
+        DTYPE_t[:, ::1] gamma, const DTYPE_t[:, ::1] expElogbeta, const DTYPE_t[::1] alpha,
+        const Py_ssize_t[::1] indptr, const Py_ssize_t[::1] indices, const DTYPE_t[::1] counts,
+        int iterations, DTYPE_t gamma_threshold, DTYPE_t epsilon,
+        DTYPE_t[:, ::1] sstats, bint collect_sstats) except -1:
+    cdef Py_ssize_t num_docs = gamma.shape[0]
+    cdef Py_ssize_t num_topics = gamma.shape[1]
+    cdef Py_ssize_t max_length = 1
+    cdef Py_ssize_t d, k, w, start, length
+    cdef int converged = 0, iteration
+    cdef DTYPE_t total, meanchange
+    cdef DTYPE_t *gammad
+    cdef DTYPE_t *lastgamma
+    cdef DTYPE_t *expElogthetad
+    cdef DTYPE_t *phinorm
+    cdef const Py_ssize_t *ids
+
+    for d in range(num_docs):
+        if indptr[d + 1] - indptr[d] > max_length:
+            max_length = indptr[d + 1] - indptr[d]
+
+    gammad = <DTYPE_t *>malloc(num_topics * sizeof(DTYPE_t))
+    lastgamma = <DTYPE_t *>malloc(num_topics * sizeof(DTYPE_t))
+    expElogthetad = <DTYPE_t *>malloc(num_topics * sizeof(DTYPE_t))
+    phinorm = <DTYPE_t *>malloc(max_length * sizeof(DTYPE_t))
+    if gammad == NULL or lastgamma == NULL or expElogthetad == NULL or phinorm == NULL:
+        free(gammad)
+        free(lastgamma)
+        free(expElogthetad)
+        free(phinorm)
+        raise MemoryError()
+
+    with nogil:
+        for d in range(num_docs):
+            start = indptr[d]
+            length = indptr[d + 1] - start
+            ids = &indices[start] if length > 0 else NULL
+
+            memcpy(gammad, &gamma[d, 0], num_topics * sizeof(DTYPE_t))
+            _exp_dirichlet_expectation(gammad, expElogthetad, num_topics)
+            _phinorm(expElogthetad, expElogbeta, ids, length, epsilon, phinorm)
+
+            # Iterate between gamma and the implicit phi until convergence, see LdaModel.inference.
+            for iteration in range(iterations):
+                memcpy(lastgamma, gammad, num_topics * sizeof(DTYPE_t))
+                for w in range(length):
+                    phinorm[w] = counts[start + w] / phinorm[w]
+                for k in range(num_topics):
+                    total = 0.0
+                    for w in range(length):
+                        total += phinorm[w] * expElogbeta[k, ids[w]]
+                    gammad[k] = alpha[k] + expElogthetad[k] * total
+                _exp_dirichlet_expectation(gammad, expElogthetad, num_topics)
+                _phinorm(expElogthetad, expElogbeta, ids, length, epsilon, phinorm)
+
+                meanchange = 0.0
+                for k in range(num_topics):
+                    meanchange += fabs(gammad[k] - lastgamma[k])
+                meanchange /= num_topics
+                if meanchange < gamma_threshold:
+                    converged += 1
+                    break
+
+            memcpy(&gamma[d, 0], gammad, num_topics * sizeof(DTYPE_t))
+            if collect_sstats:
+                for w in range(length):
+                    total = counts[start + w] / phinorm[w]
+                    for k in range(num_topics):
+                        sstats[k, ids[w]] += expElogthetad[k] * total
+
+    free(gammad)
+    free(lastgamma)
+    free(expElogthetad)
+    free(phinorm)
+    return converged
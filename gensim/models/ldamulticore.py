@@ -83,7 +83,9 @@ Query, or update the model using new, unseen documents
 
 """
 
+import ctypes
 import logging
+from collections import deque
 
 import numpy as np
 
@@ -93,6 +95,7 @@ from gensim.models.ldamodel import LdaModel, LdaState
 import six
 from six.moves import queue, range
 from multiprocessing import Pool, Queue, cpu_count
+from multiprocessing.sharedctypes import RawArray
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +109,7 @@ class LdaMulticore(LdaModel):
                  chunksize=2000, passes=1, batch=False, alpha='symmetric',
                  eta=None, decay=0.5, offset=1.0, eval_every=10, iterations=50,
                  gamma_threshold=0.001, random_state=None, minimum_probability=0.01,
-                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32):
+                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32, shared_memory=False):
         """
 
         Parameters
@@ -168,10 +171,17 @@ class LdaMulticore(LdaModel):
             each word, along with their phi values multiplied by the feature length (i.e. word count).
         dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
             Data-type to use during calculations inside model. All inputs are also converted.
+        shared_memory : bool, optional
+            If True, the worker processes read the topics (`expElogbeta`) from a block of shared memory, refreshed
+            once per M step, instead of receiving a pickled copy of the model state with every chunk. Workers then
+            send back only the sufficient statistics of the terms that occur in their chunk. This saves a lot of
+            inter-process communication for large models (many topics x large vocabulary), at the cost of workers
+            waiting for the outstanding chunks to finish before each M step.
 
         """
         self.workers = max(1, cpu_count() - 1) if workers is None else workers
         self.batch = batch
+        self.shared_memory = shared_memory
 
         if isinstance(alpha, six.string_types) and alpha == 'auto':
             raise NotImplementedError("auto-tuning alpha not implemented in multicore LDA; use plain LdaModel.")
@@ -252,12 +262,40 @@ class LdaMulticore(LdaModel):
         job_queue = Queue(maxsize=2 * self.workers)
         result_queue = Queue()
 
+        shared_memory = getattr(self, 'shared_memory', False)
+        if shared_memory:
+            # topics shared with all workers, rewritten after each M step
+            shared_buffer = RawArray(ctypes.c_char, self.expElogbeta.nbytes)
+            shared_expElogbeta = np.frombuffer(shared_buffer, dtype=self.dtype).reshape(self.expElogbeta.shape)
+            shared_expElogbeta[:] = np.exp(self.state.get_Elogbeta())  # same as `sync_state` in the workers
+        else:
+            shared_buffer = None
+
         # rho is the "speed" of updating; TODO try other fncs
         # pass_ + num_updates handles increasing the starting t for each pass,
         # while allowing it to "reset" on the first pass of each update
         def rho():
             return pow(self.offset + pass_ + (self.num_updates / self.chunksize), -self.decay)
 
+        eval_gammas = {}
+        # training results received while waiting for an evaluation, merged by the next `process_result_queue`
+        pending_results = deque()
+
+        def next_result():
+            """Get the next result, first those put aside by `parallel_bound`, then the next one of the workers."""
+            return pending_results.popleft() if pending_results else result_queue.get()
+
+        def merge_result(job_result):
+            """Merge the result of a single job into `other`, the accumulated state."""
+            job_no, result = job_result
+            if isinstance(job_no, tuple):
+                # gamma of an evaluation job, see `parallel_bound`
+                eval_gammas[job_no[1]] = result
+                return
+            numdocs, ids, sstats = result
+            other.merge_columns(ids, sstats, numdocs)
+            queue_size[0] -= 1
+
         def process_result_queue(force=False):
             """
             Clear the result queue, merging all intermediate results, and update the
@@ -265,19 +303,47 @@ class LdaMulticore(LdaModel):
 
             """
             merged_new = False
-            while not result_queue.empty():
-                other.merge(result_queue.get())
-                queue_size[0] -= 1
+            while pending_results or not result_queue.empty():
+                merge_result(next_result())
                 merged_new = True
 
             if (force and merged_new and queue_size[0] == 0) or (other.numdocs >= updateafter):
+                if shared_memory:
+                    # no worker may be reading the shared topics while they're being updated
+                    while queue_size[0] > 0:
+                        merge_result(next_result())
                 self.do_mstep(rho(), other, pass_ > 0)
+                if shared_memory:
+                    shared_expElogbeta[:] = self.expElogbeta
                 other.reset()
                 if eval_every > 0 and (force or (self.num_updates / updateafter) % eval_every == 0):
-                    self.log_perplexity(chunk, total_docs=lencorpus)
+                    self._log_perplexity(chunk, lencorpus, parallel_bound)
+
+        def parallel_bound(chunk, subsample_ratio=1.0):
+            """
+            Same as `self.bound(chunk)`, with the inference of the chunk distributed
+            over the workers, in between their training jobs.
+
+            """
+            pieces = np.linspace(0, len(chunk), min(self.workers, len(chunk)) + 1).astype(int)
+            # initialize the gammas here, so that evaluating doesn't change the random state of the workers
+            gamma = self.random_state.gamma(100., 1. / 100., (len(chunk), self.num_topics)).astype(self.dtype)
+            eval_gammas.clear()
+            for i, (start, end) in enumerate(zip(pieces[:-1], pieces[1:])):
+                job = (chunk[start:end], gamma[start:end])
+                job_queue.put((('eval', i), job, None if shared_memory else self.state))
+            while len(eval_gammas) < len(pieces) - 1:
+                job_result = result_queue.get()
+                if isinstance(job_result[0], tuple):
+                    merge_result(job_result)
+                else:
+                    # merging it here could leave the last documents of a pass without an M step
+                    pending_results.append(job_result)
+            gamma = np.vstack([eval_gammas[i] for i in range(len(pieces) - 1)])
+            return self.bound(chunk, gamma=gamma, subsample_ratio=subsample_ratio)
 
         logger.info("training LDA model using %i processes", self.workers)
-        pool = Pool(self.workers, worker_e_step, (job_queue, result_queue, self))
+        pool = Pool(self.workers, worker_e_step, (job_queue, result_queue, self, shared_buffer))
         for pass_ in range(self.passes):
             queue_size, reallen = [0], 0
             other = LdaState(self.eta, self.state.sstats.shape)
@@ -289,7 +355,7 @@ class LdaMulticore(LdaModel):
                 # put the chunk into the workers' input job queue
                 while True:
                     try:
-                        job_queue.put((chunk_no, chunk, self.state), block=False)
+                        job_queue.put((chunk_no, chunk, None if shared_memory else self.state), block=False)
                         queue_size[0] += 1
                         logger.info(
                             "PROGRESS: pass %i, dispatched chunk #%i = documents up to #%i/%i, "
@@ -316,30 +382,48 @@ class LdaMulticore(LdaModel):
         pool.terminate()
 
 
-def worker_e_step(input_queue, result_queue, worker_lda):
+def worker_e_step(input_queue, result_queue, worker_lda, shared_expElogbeta=None):
     """Perform E-step for each job.
 
     Parameters
     ----------
     input_queue : queue of (int, list of (int, float), :class:`~gensim.models.lda_worker.Worker`)
         Each element is a job characterized by its ID, the corpus chunk to be processed in BOW format and the worker
-        responsible for processing it.
-    result_queue : queue of :class:`~gensim.models.ldamodel.LdaState`
-        After the worker finished the job, the state of the resulting (trained) worker model is appended to this queue.
+        responsible for processing it. Jobs with an ID of `('eval', int)` only infer the gamma of their chunk,
+        for evaluating the model; their chunk comes along with the initial gamma.
+    result_queue : queue of (int, (int, numpy.ndarray, numpy.ndarray))
+        After the worker finished the job, its ID and the result are appended to this queue. The result is the
+        number of documents, the ids of the terms in the chunk and the sufficient statistics of those terms
+        (or the gamma, for evaluation jobs).
     worker_lda : :class:`~gensim.models.ldamulticore.LdaMulticore`
         LDA instance which performed e step
+    shared_expElogbeta : :class:`multiprocessing.sharedctypes.RawArray`, optional
+        Topics in shared memory, for `shared_memory=True`. Jobs then come without a state.
     """
     logger.debug("worker process entering E-step loop")
+    if shared_expElogbeta is not None:
+        worker_lda.state = None
+        worker_lda.expElogbeta = np.frombuffer(shared_expElogbeta, dtype=worker_lda.dtype).reshape(
+            worker_lda.num_topics, worker_lda.num_terms
+        )
     while True:
         logger.debug("getting a new job")
         chunk_no, chunk, w_state = input_queue.get()
-        logger.debug("processing chunk #%i of %i documents", chunk_no, len(chunk))
-        worker_lda.state = w_state
-        worker_lda.sync_state()
-        worker_lda.state.reset()
-        worker_lda.do_estep(chunk)  # TODO: auto-tune alpha?
+        if w_state is not None:
+            worker_lda.state = w_state
+            worker_lda.sync_state()
+            worker_lda.state = None
+        if isinstance(chunk_no, tuple):
+            # evaluation job: only the gamma of the chunk is needed
+            chunk, gamma = chunk
+            logger.debug("evaluating chunk of %i documents", len(chunk))
+            result, _ = worker_lda.inference(chunk, gamma=gamma)
+        else:
+            logger.debug("processing chunk #%i of %i documents", chunk_no, len(chunk))
+            # only the columns of terms present in the chunk can be non-zero: send back just those
+            gamma, ids, sstats = worker_lda._inference(chunk, collect_sstats=True)  # TODO: auto-tune alpha?
+            result = (gamma.shape[0], ids, sstats)
         del chunk
         logger.debug("processed chunk, queuing the result")
-        result_queue.put(worker_lda.state)
-        worker_lda.state = None
+        result_queue.put((chunk_no, result))
         logger.debug("result put")
@@ -15,7 +15,8 @@ TODO: The next steps to take this forward would be:
 #. See if LdaPost can be replaced by LdaModel completely without breaking anything.
 #. Heavy lifting going on in the Sslm class - efforts can be made to cythonise mathematical methods, in particular,
    update_obs and the optimization takes a lot time.
-#. Try and make it distributed, especially around the E and M step.
+#. Try and make it distributed, especially around the E and M step. The E and M steps can already be run in
+   several processes on a single machine, see the `workers` parameter of :class:`LdaSeqModel`.
 #. Remove all C/C++ coding style/syntax.
 
 Examples
@@ -52,6 +53,9 @@ Access the document embeddings generated from the DTM
 
 """
 
+from collections import deque
+import multiprocessing
+
 from gensim import utils, matutils
 from gensim.models import ldamodel
 import numpy as np
@@ -67,7 +71,8 @@ class LdaSeqModel(utils.SaveLoad):
     """Estimate Dynamic Topic Model parameters based on a training corpus."""
     def __init__(self, corpus=None, time_slice=None, id2word=None, alphas=0.01, num_topics=10,
                  initialize='gensim', sstats=None, lda_model=None, obs_variance=0.5, chain_variance=0.005, passes=10,
-                 random_state=None, lda_inference_max_iter=25, em_min_iter=6, em_max_iter=20, chunksize=100):
+                 random_state=None, lda_inference_max_iter=25, em_min_iter=6, em_max_iter=20, chunksize=100,
+                 workers=1):
         """
 
         Parameters
@@ -115,9 +120,14 @@ class LdaSeqModel(utils.SaveLoad):
             Maximum number of iterations until converge of the Expectation-Maximization algorithm.
         chunksize : int, optional
             Number of documents in the corpus do be processed in in a chunk.
+        workers : int, optional
+            Number of processes used for training. If greater than 1, the topic chains are fitted in parallel in
+            the M step, and chunks of `chunksize` documents are inferred in parallel in the E step.
+            The fitted model is the same as with a single process.
 
         """
         self.id2word = id2word
+        self.workers = workers
         if corpus is None and self.id2word is None:
             raise ValueError(
                 'at least one of corpus/id2word must be specified, to establish input space dimensionality'
@@ -256,56 +266,67 @@ class LdaSeqModel(utils.SaveLoad):
         convergence = LDASQE_EM_THRESHOLD + 1
         iter_ = 0
 
-        while iter_ < em_min_iter or ((convergence > LDASQE_EM_THRESHOLD) and iter_ <= em_max_iter):
-
-            logger.info(" EM iter %i", iter_)
-            logger.info("E Step")
-            # TODO: bound is initialized to 0
-            old_bound = bound
-
-            # initiate sufficient statistics
-            topic_suffstats = []
-            for topic in range(num_topics):
-                topic_suffstats.append(np.zeros((vocab_len, data_len)))
-
-            # set up variables
-            gammas = np.zeros((corpus_len, num_topics))
-            lhoods = np.zeros((corpus_len, num_topics + 1))
-            # compute the likelihood of a sequential corpus under an LDA
-            # seq model and find the evidence lower bound. This is the E - Step
-            bound, gammas = \
-                self.lda_seq_infer(corpus, topic_suffstats, gammas, lhoods, iter_, lda_inference_max_iter, chunksize)
-            self.gammas = gammas
+        workers = getattr(self, 'workers', 1)
+        pool = None
+        if workers > 1:
+            logger.info("training DTM model using %i processes", workers)
+            lda = ldamodel.LdaModel(num_topics=num_topics, alpha=self.alphas, id2word=self.id2word, dtype=np.float64)
+            pool = multiprocessing.Pool(workers, _init_lda_seq_worker, (lda,))
+        try:
+            while iter_ < em_min_iter or ((convergence > LDASQE_EM_THRESHOLD) and iter_ <= em_max_iter):
+
+                logger.info(" EM iter %i", iter_)
+                logger.info("E Step")
+                # TODO: bound is initialized to 0
+                old_bound = bound
+
+                # initiate sufficient statistics
+                topic_suffstats = []
+                for topic in range(num_topics):
+                    topic_suffstats.append(np.zeros((vocab_len, data_len)))
+
+                # set up variables
+                gammas = np.zeros((corpus_len, num_topics))
+                lhoods = np.zeros((corpus_len, num_topics + 1))
+                # compute the likelihood of a sequential corpus under an LDA
+                # seq model and find the evidence lower bound. This is the E - Step
+                bound, gammas = self.lda_seq_infer(
+                    corpus, topic_suffstats, gammas, lhoods, iter_, lda_inference_max_iter, chunksize, pool=pool
+                )
+                self.gammas = gammas
 
-            logger.info("M Step")
+                logger.info("M Step")
 
-            # fit the variational distribution. This is the M - Step
-            topic_bound = self.fit_lda_seq_topics(topic_suffstats)
-            bound += topic_bound
+                # fit the variational distribution. This is the M - Step
+                topic_bound = self.fit_lda_seq_topics(topic_suffstats, pool=pool)
+                bound += topic_bound
 
-            if (bound - old_bound) < 0:
-                # if max_iter is too low, increase iterations.
-                if lda_inference_max_iter < LOWER_ITER:
-                    lda_inference_max_iter *= ITER_MULT_LOW
-                logger.info("Bound went down, increasing iterations to %i", lda_inference_max_iter)
+                if (bound - old_bound) < 0:
+                    # if max_iter is too low, increase iterations.
+                    if lda_inference_max_iter < LOWER_ITER:
+                        lda_inference_max_iter *= ITER_MULT_LOW
+                    logger.info("Bound went down, increasing iterations to %i", lda_inference_max_iter)
 
-            # check for convergence
-            convergence = np.fabs((bound - old_bound) / old_bound)
+                # check for convergence
+                convergence = np.fabs((bound - old_bound) / old_bound)
 
-            if convergence < LDASQE_EM_THRESHOLD:
+                if convergence < LDASQE_EM_THRESHOLD:
 
-                lda_inference_max_iter = MAX_ITER
-                logger.info("Starting final iterations, max iter is %i", lda_inference_max_iter)
-                convergence = 1.0
+                    lda_inference_max_iter = MAX_ITER
+                    logger.info("Starting final iterations, max iter is %i", lda_inference_max_iter)
+                    convergence = 1.0
 
-            logger.info("iteration %i iteration lda seq bound is %f convergence is %f", iter_, bound, convergence)
+                logger.info("iteration %i iteration lda seq bound is %f convergence is %f", iter_, bound, convergence)
 
-            iter_ += 1
+                iter_ += 1
+        finally:
+            if pool is not None:
+                pool.terminate()
 
         return bound
 
     def lda_seq_infer(self, corpus, topic_suffstats, gammas, lhoods,
-                      iter_, lda_inference_max_iter, chunksize):
+                      iter_, lda_inference_max_iter, chunksize, pool=None):
         """Inference (or E-step) for the lower bound EM optimization.
 
         This is used to set up the gensim :class:`~gensim.models.ldamodel.LdaModel` to be used for each time-slice.
@@ -329,6 +350,9 @@ class LdaSeqModel(utils.SaveLoad):
             Maximum number of iterations for the inference step of LDA.
         chunksize : int
             Number of documents to be processed in each chunk.
+        pool : :class:`multiprocessing.pool.Pool`, optional
+            Pool of worker processes, initialized with :func:`~gensim.models.ldaseqmodel._init_lda_seq_worker`,
+            used to infer the chunks of documents in parallel.
 
         Returns
         -------
@@ -350,7 +374,7 @@ class LdaSeqModel(utils.SaveLoad):
         if model == "DTM":
             bound, gammas = self.inferDTMseq(
                 corpus, topic_suffstats, gammas, lhoods, lda,
-                ldapost, iter_, bound, lda_inference_max_iter, chunksize
+                ldapost, iter_, bound, lda_inference_max_iter, chunksize, pool=pool
             )
         elif model == "DIM":
             self.InfluenceTotalFixed(corpus)
@@ -362,7 +386,7 @@ class LdaSeqModel(utils.SaveLoad):
         return bound, gammas
 
     def inferDTMseq(self, corpus, topic_suffstats, gammas, lhoods, lda,
-                    ldapost, iter_, bound, lda_inference_max_iter, chunksize):
+                    ldapost, iter_, bound, lda_inference_max_iter, chunksize, pool=None):
         """Compute the likelihood of a sequential corpus under an LDA seq model, and reports the likelihood bound.
 
         Parameters
@@ -388,6 +412,10 @@ class LdaSeqModel(utils.SaveLoad):
             Maximum number of iterations for the inference step of LDA.
         chunksize : int
             Number of documents to be processed in each chunk.
+        pool : :class:`multiprocessing.pool.Pool`, optional
+            Pool of worker processes, initialized with :func:`~gensim.models.ldaseqmodel._init_lda_seq_worker`.
+            If given, each chunk of documents is inferred in a worker process, and `lda`, `ldapost` and `lhoods`
+            are left untouched.
 
         Returns
         -------
@@ -397,6 +425,11 @@ class LdaSeqModel(utils.SaveLoad):
             the posterior.
 
         """
+        if pool is not None:
+            return self._parallel_infer_dtm_seq(
+                corpus, topic_suffstats, gammas, bound, lda_inference_max_iter, chunksize, pool
+            )
+
         doc_index = 0  # overall doc_index in corpus
         time = 0  # current time-slice
         doc_num = 0  # doc-index in current time-slice
@@ -440,6 +473,57 @@ class LdaSeqModel(utils.SaveLoad):
 
         return bound, gammas
 
+    def _parallel_infer_dtm_seq(self, corpus, topic_suffstats, gammas, bound, lda_inference_max_iter, chunksize, pool):
+        """Infer the posterior of every document like :meth:`~gensim.models.ldaseqmodel.LdaSeqModel.inferDTMseq`,
+        but send each chunk of documents to a worker process.
+
+        The results are merged in the original document order, so that the sufficient statistics and the bound are
+        summed up exactly like in the serial version.
+
+        """
+        time_slice = np.cumsum(np.array(self.time_slice))
+        pending = deque()
+        doc_index = 0  # overall doc_index in corpus
+        time = 0  # current time-slice
+
+        for chunk in utils.grouper(corpus, chunksize):
+            chunk_start = doc_index
+            times = []
+            for doc in chunk:
+                # this is used to update the time_slice exactly like the serial version does
+                if doc_index > time_slice[time]:
+                    time += 1
+                times.append(time)
+                doc_index += 1
+
+            # the topic-word values of the time slices in this chunk, as in `make_lda_seq_slice`
+            topics = {
+                t: np.column_stack([chain.e_log_prob[:, t] for chain in self.topic_chains]) for t in set(times)
+            }
+            job = (chunk, times, topics, lda_inference_max_iter)
+            pending.append((chunk_start, pool.apply_async(_infer_dtm_chunk, job)))
+            while len(pending) >= 2 * getattr(self, 'workers', 1):
+                chunk_start, result = pending.popleft()
+                bound = self._merge_dtm_chunk(result.get(), chunk_start, topic_suffstats, gammas, bound)
+
+        while pending:
+            chunk_start, result = pending.popleft()
+            bound = self._merge_dtm_chunk(result.get(), chunk_start, topic_suffstats, gammas, bound)
+        return bound, gammas
+
+    def _merge_dtm_chunk(self, results, chunk_start, topic_suffstats, gammas, bound):
+        """Add the posteriors of a chunk of documents, inferred by :func:`~gensim.models.ldaseqmodel._infer_dtm_chunk`,
+        to the sufficient statistics, variational parameters and bound of the E step.
+
+        """
+        for doc_index, (time, ids, gamma, doc_lhood, doc_sstats) in enumerate(results, chunk_start):
+            # same as `LdaPost.update_lda_seq_ss`, repeated word ids included
+            for k in range(self.num_topics):
+                np.add.at(topic_suffstats[k][:, time], ids, doc_sstats[:, k])
+            gammas[doc_index] = gamma
+            bound += doc_lhood
+        return bound
+
     def make_lda_seq_slice(self, lda, time):
         """Update the LDA model topic-word values using time slices.
 
@@ -463,13 +547,16 @@ class LdaSeqModel(utils.SaveLoad):
         lda.alpha = np.copy(self.alphas)
         return lda
 
-    def fit_lda_seq_topics(self, topic_suffstats):
+    def fit_lda_seq_topics(self, topic_suffstats, pool=None):
         """Fit the sequential model topic-wise.
 
         Parameters
         ----------
         topic_suffstats : numpy.ndarray
             Sufficient statistics of the current model, expected shape (`self.vocab_len`, `num_topics`).
+        pool : :class:`multiprocessing.pool.Pool`, optional
+            Pool of worker processes. If given, the topic chains are fitted in parallel, and replaced by their
+            fitted copies.
 
         Returns
         -------
@@ -479,6 +566,14 @@ class LdaSeqModel(utils.SaveLoad):
         """
         lhood = 0
 
+        if pool is not None:
+            jobs = [(chain, topic_suffstats[k]) for k, chain in enumerate(self.topic_chains)]
+            for k, (chain, lhood_term) in enumerate(pool.imap(_fit_sslm_job, jobs)):
+                logger.info("Fitted topic number %i", k)
+                self.topic_chains[k] = chain
+                lhood += lhood_term
+            return lhood
+
         for k, chain in enumerate(self.topic_chains):
             logger.info("Fitting topic number %i", k)
             lhood_term = sslm.fit_sslm(chain, topic_suffstats[k])
@@ -764,8 +859,8 @@ class sslm(utils.SaveLoad):
 
         Parameters
         ----------
-        word: int
-            The word's ID.
+        word: {int, None}
+            The word's ID. If None, the recurrence is run for the whole vocabulary at once.
         chain_variance : float
             Gaussian parameter defined in the beta distribution to dictate how the beta values evolve over time.
 
@@ -773,14 +868,17 @@ class sslm(utils.SaveLoad):
         -------
         (numpy.ndarray, numpy.ndarray)
             The first returned value is the variance of each word in each time slice, the second value is the
-            inferred posterior variance for the same pairs.
+            inferred posterior variance for the same pairs. Both are views into `self.variance` and
+            `self.fwd_variance`, which are updated in place.
 
         """
         INIT_VARIANCE_CONST = 1000
 
         T = self.num_time_slices
-        variance = self.variance[word]
-        fwd_variance = self.fwd_variance[word]
+        rows = slice(None) if word is None else word
+        # transposed, so that indexing by time gives the values of all requested words at once
+        variance = self.variance[rows].T
+        fwd_variance = self.fwd_variance[rows].T
         # forward pass. Set initial variance very high
         fwd_variance[0] = chain_variance * INIT_VARIANCE_CONST
         for t in range(1, T + 1):
@@ -793,13 +891,12 @@ class sslm(utils.SaveLoad):
         # backward pass
         variance[T] = fwd_variance[T]
         for t in range(T - 1, -1, -1):
-            if fwd_variance[t] > 0.0:
+            with np.errstate(divide='ignore', invalid='ignore'):
                 c = np.power((fwd_variance[t] / (fwd_variance[t] + chain_variance)), 2)
-            else:
-                c = 0
+            c = np.where(fwd_variance[t] > 0.0, c, 0)
             variance[t] = (c * (variance[t + 1] - chain_variance)) + ((1 - c) * fwd_variance[t])
 
-        return variance, fwd_variance
+        return variance.T, fwd_variance.T
 
     def compute_post_mean(self, word, chain_variance):
         """Get the mean, based on the `Variational Kalman Filtering approach for Approximate Inference (section 3.1)
@@ -823,8 +920,8 @@ class sslm(utils.SaveLoad):
 
         Parameters
         ----------
-        word: int
-            The word's ID.
+        word: {int, None}
+            The word's ID. If None, the recurrence is run for the whole vocabulary at once.
         chain_variance : float
             Gaussian parameter defined in the beta distribution to dictate how the beta values evolve over time.
 
@@ -832,14 +929,17 @@ class sslm(utils.SaveLoad):
         -------
         (numpy.ndarray, numpy.ndarray)
             The first returned value is the mean of each word in each time slice, the second value is the
-            inferred posterior mean for the same pairs.
+            inferred posterior mean for the same pairs. Both are views into `self.mean` and `self.fwd_mean`,
+            which are updated in place.
 
         """
         T = self.num_time_slices
-        obs = self.obs[word]
-        fwd_variance = self.fwd_variance[word]
-        mean = self.mean[word]
-        fwd_mean = self.fwd_mean[word]
+        rows = slice(None) if word is None else word
+        # transposed, so that indexing by time gives the values of all requested words at once
+        obs = self.obs[rows].T
+        fwd_variance = self.fwd_variance[rows].T
+        mean = self.mean[rows].T
+        fwd_mean = self.fwd_mean[rows].T
 
         # forward
         fwd_mean[0] = 0
@@ -855,7 +955,7 @@ class sslm(utils.SaveLoad):
             else:
                 c = chain_variance / (fwd_variance[t] + chain_variance)
             mean[t] = c * fwd_mean[t] + (1 - c) * mean[t + 1]
-        return mean, fwd_mean
+        return mean.T, fwd_mean.T
 
     def compute_expected_log_prob(self):
         """Compute the expected log probability given values of m.
@@ -870,8 +970,7 @@ class sslm(utils.SaveLoad):
             The expected value for the log probabilities for each word and time slice.
 
         """
-        for (w, t), val in np.ndenumerate(self.e_log_prob):
-            self.e_log_prob[w][t] = self.mean[w][t + 1] - np.log(self.zeta[t])
+        self.e_log_prob[:] = self.mean[:, 1:] - np.log(self.zeta)
         return self.e_log_prob
 
     def sslm_counts_init(self, obs_variance, chain_variance, sstats):
@@ -907,9 +1006,8 @@ class sslm(utils.SaveLoad):
         self.chain_variance = chain_variance
 
         # compute post variance, mean
-        for w in range(W):
-            self.variance[w], self.fwd_variance[w] = self.compute_post_variance(w, self.chain_variance)
-            self.mean[w], self.fwd_mean[w] = self.compute_post_mean(w, self.chain_variance)
+        self.compute_post_variance(None, self.chain_variance)
+        self.compute_post_mean(None, self.chain_variance)
 
         self.zeta = self.update_zeta()
         self.e_log_prob = self.compute_expected_log_prob()
@@ -934,7 +1032,6 @@ class sslm(utils.SaveLoad):
             The lower bound for the true posterior achieved using the fitted approximate distribution.
 
         """
-        W = self.vocab_len
         bound = 0
         old_bound = 0
         sslm_fit_threshold = 1e-6
@@ -942,8 +1039,7 @@ class sslm(utils.SaveLoad):
         converged = sslm_fit_threshold + 1
 
         # computing variance, fwd_variance
-        self.variance, self.fwd_variance = \
-            (np.array(x) for x in zip(*(self.compute_post_variance(w, self.chain_variance) for w in range(W))))
+        self.compute_post_variance(None, self.chain_variance)
 
         # column sum of sstats
         totals = sstats.sum(axis=0)
@@ -992,47 +1088,33 @@ class sslm(utils.SaveLoad):
             The maximized lower bound.
 
         """
-        w = self.vocab_len
-        t = self.num_time_slices
-
-        term_1 = 0
-        term_2 = 0
-        term_3 = 0
-
-        val = 0
-        ent = 0
+        T = self.num_time_slices
 
         chain_variance = self.chain_variance
         # computing mean, fwd_mean
-        self.mean, self.fwd_mean = \
-            (np.array(x) for x in zip(*(self.compute_post_mean(w, self.chain_variance) for w in range(w))))
+        self.compute_post_mean(None, chain_variance)
         self.zeta = self.update_zeta()
 
-        val = sum(self.variance[w][0] - self.variance[w][t] for w in range(w)) / 2 * chain_variance
+        val = np.sum(self.variance[:, 0] - self.variance[:, T]) / 2 * chain_variance
 
         logger.info("Computing bound, all times")
 
-        for t in range(1, t + 1):
-            term_1 = 0.0
-            term_2 = 0.0
-            ent = 0.0
-            for w in range(w):
-
-                m = self.mean[w][t]
-                prev_m = self.mean[w][t - 1]
-
-                v = self.variance[w][t]
-
-                # w_phi_l is only used in Document Influence Model; the values are always zero in this case
-                # w_phi_l = sslm.w_phi_l[w][t - 1]
-                # exp_i = np.exp(-prev_m)
-                # term_1 += (np.power(m - prev_m - (w_phi_l * exp_i), 2) / (2 * chain_variance)) -
-                # (v / chain_variance) - np.log(chain_variance)
-
-                term_1 += \
-                    (np.power(m - prev_m, 2) / (2 * chain_variance)) - (v / chain_variance) - np.log(chain_variance)
-                term_2 += sstats[w][t - 1] * m
-                ent += np.log(v) / 2  # note the 2pi's cancel with term1 (see doc)
+        for t in range(1, T + 1):
+            m = self.mean[:, t]
+            prev_m = self.mean[:, t - 1]
+            v = self.variance[:, t]
+
+            # w_phi_l is only used in Document Influence Model; the values are always zero in this case
+            # w_phi_l = sslm.w_phi_l[:, t - 1]
+            # exp_i = np.exp(-prev_m)
+            # term_1 = np.sum((np.power(m - prev_m - (w_phi_l * exp_i), 2) / (2 * chain_variance)) -
+            # (v / chain_variance) - np.log(chain_variance))
+
+            term_1 = np.sum(
+                (np.power(m - prev_m, 2) / (2 * chain_variance)) - (v / chain_variance) - np.log(chain_variance)
+            )
+            term_2 = np.dot(sstats[:, t - 1], m)
+            ent = np.sum(np.log(v)) / 2  # note the 2pi's cancel with term1 (see doc)
 
             term_3 = -totals[t - 1] * np.log(self.zeta[t - 1])
             val += term_2 + term_3 + ent - term_1
@@ -1525,6 +1607,79 @@ class LdaPost(utils.SaveLoad):
         return topic_suffstats
 
 
+# the following functions are run in the worker processes of a multiprocess LdaSeqModel.
+_worker_lda = None
+
+
+def _init_lda_seq_worker(lda):
+    """Keep the :class:`~gensim.models.ldamodel.LdaModel` whose topics are set for each document in a worker process.
+
+    Parameters
+    ----------
+    lda : :class:`~gensim.models.ldamodel.LdaModel`
+        Model with the number of topics and the `alpha` of the DTM model.
+
+    """
+    global _worker_lda
+    _worker_lda = lda
+
+
+def _infer_dtm_chunk(chunk, times, topics, lda_inference_max_iter):
+    """Fit the posterior of a chunk of documents, see :meth:`~gensim.models.ldaseqmodel.LdaSeqModel.inferDTMseq`.
+
+    Parameters
+    ----------
+    chunk : list of list of (int, float)
+        The documents in BOW format.
+    times : list of int
+        The time slice of each document.
+    topics : dict of (int, numpy.ndarray)
+        Topic-word values of each time slice in `times`, shape (`vocab_len`, `num_topics`).
+    lda_inference_max_iter : int
+        Maximum number of iterations for the inference step of LDA.
+
+    Returns
+    -------
+    list of (int, numpy.ndarray, numpy.ndarray, float, numpy.ndarray)
+        For each document: its time slice, its word ids, its dirichlet variational parameters, its lower bound,
+        and its contribution to the sufficient statistics of each word id and topic.
+
+    """
+    lda = _worker_lda
+    ldapost = LdaPost(max_doc_len=max(len(doc) for doc in chunk), num_topics=lda.num_topics, lda=lda)
+    results = []
+    for doc_num, (doc, time) in enumerate(zip(chunk, times)):
+        lda.topics = topics[time]
+        ldapost.gamma = np.zeros(lda.num_topics)
+        ldapost.lhood = np.zeros(lda.num_topics + 1)
+        ldapost.doc = doc
+        doc_lhood = LdaPost.fit_lda_post(ldapost, doc_num, time, None, lda_inference_max_iter=lda_inference_max_iter)
+        ids = np.array([word_id for word_id, count in doc], dtype=int)
+        counts = np.array([count for word_id, count in doc], dtype=np.float64)
+        results.append((time, ids, ldapost.gamma, doc_lhood, counts[:, None] * ldapost.phi[:len(doc)]))
+    return results
+
+
+def _fit_sslm_job(args):
+    """Fit a topic chain to its sufficient statistics in a worker process, see
+    :meth:`~gensim.models.ldaseqmodel.sslm.fit_sslm`.
+
+    Parameters
+    ----------
+    args : (:class:`~gensim.models.ldaseqmodel.sslm`, numpy.ndarray)
+        The topic chain, and its sufficient statistics.
+
+    Returns
+    -------
+    (:class:`~gensim.models.ldaseqmodel.sslm`, float)
+        The fitted topic chain, and its lower bound.
+
+    """
+    chain, sstats = args
+    bound = chain.fit_sslm(sstats)
+    return chain, bound
+
+
 # the following functions are used in update_obs as the objective function.
 def f_obs(x, *args):
     """Function which we are optimising for minimizing obs.
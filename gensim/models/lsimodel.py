@@ -21,7 +21,7 @@ combination of which effectively and transparently allows building LSI models fo
 * corpora that cannot be even temporarily stored: each document can only be
   seen once and must be processed immediately (one-pass algorithm)
 * distributed computing for very large corpora, making use of a cluster of
-  machines
+  machines, or of several cores of a single machine (the `workers` parameter)
 
 Wall-clock `performance on the English Wikipedia <http://radimrehurek.com/gensim/wiki.html>`_
 (2G corpus positions, 3.2M documents, 100K features, 0.5G non-zero entries in the final TF-IDF matrix),
@@ -60,14 +60,17 @@ Examples
 """
 
 import logging
+import multiprocessing
 import sys
+from collections import deque
 
 import numpy as np
 import scipy.linalg
 import scipy.sparse
 from scipy.sparse import sparsetools
+import six
 from six import iterkeys
-from six.moves import range
+from six.moves import queue, range
 
 from gensim import interfaces, matutils, utils
 from gensim.models import basemodel
@@ -355,7 +358,7 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
     def __init__(self, corpus=None, num_topics=200, id2word=None, chunksize=20000,
                  decay=1.0, distributed=False, onepass=True,
-                 power_iters=P2_EXTRA_ITERS, extra_samples=P2_EXTRA_DIMS, dtype=np.float64):
+                 power_iters=P2_EXTRA_ITERS, extra_samples=P2_EXTRA_DIMS, dtype=np.float64, workers=1):
         """Construct an `LsiModel` object.
 
         Either `corpus` or `id2word` must be supplied in order to train the model.
@@ -372,8 +375,9 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Number of documents to be used in each training chunk.
         decay : float, optional
             Weight of existing observations relatively to new ones.
-        distributed : bool, optional
-            If True - distributed mode (parallel execution on several machines) will be used.
+        distributed : {bool, :class:`~gensim.models.socket_dispatcher.SocketDispatcher`}, optional
+            If True - distributed mode (parallel execution on several machines) will be used, through the Pyro4
+            dispatcher (:mod:`gensim.models.lsi_dispatcher`). Alternatively pass a dispatcher object to use instead.
         onepass : bool, optional
             Whether the one-pass algorithm should be used for training.
             Pass `False` to force a multi-pass stochastic algorithm.
@@ -384,6 +388,11 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Extra samples to be used besides the rank `k`. Can improve accuracy.
         dtype : type, optional
             Enforces a type for elements of the decomposed matrix.
+        workers : int, optional
+            Number of worker processes for training on this machine, in serial (non-distributed) mode.
+            The one-pass algorithm decomposes several chunks at once and merges them in order; the multi-pass
+            algorithm multiplies the chunks of each pass in parallel, see
+            :func:`~gensim.models.lsimodel.stochastic_svd`.
 
         """
         self.id2word = id2word
@@ -397,6 +406,7 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         self.onepass = onepass
         self.extra_samples, self.power_iters = extra_samples, power_iters
         self.dtype = dtype
+        self.workers = int(workers)
 
         if corpus is None and self.id2word is None:
             raise ValueError(
@@ -426,13 +436,23 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                     "run either distributed one-pass, or serial randomized."
                 )
             try:
-                import Pyro4
-                dispatcher = Pyro4.Proxy('PYRONAME:gensim.lsi_dispatcher')
-                logger.debug("looking for dispatcher at %s", str(dispatcher._pyroUri))
-                dispatcher.initialize(
-                    id2word=self.id2word, num_topics=num_topics, chunksize=chunksize, decay=decay,
-                    power_iters=self.power_iters, extra_samples=self.extra_samples, distributed=False, onepass=onepass
-                )
+                if distributed is True:
+                    import Pyro4
+                    dispatcher = Pyro4.Proxy('PYRONAME:gensim.lsi_dispatcher')
+                    logger.debug("looking for dispatcher at %s", str(dispatcher._pyroUri))
+                    dispatcher.initialize(
+                        id2word=self.id2word, num_topics=num_topics, chunksize=chunksize, decay=decay,
+                        power_iters=self.power_iters, extra_samples=self.extra_samples, distributed=False,
+                        onepass=onepass
+                    )
+                else:
+                    # a dispatcher object, such as gensim.models.socket_dispatcher.SocketDispatcher
+                    dispatcher = distributed
+                    dispatcher.initialize(
+                        'lsi', id2word=self.id2word, num_topics=num_topics, chunksize=chunksize, decay=decay,
+                        power_iters=self.power_iters, extra_samples=self.extra_samples, distributed=False,
+                        onepass=onepass, dtype=self.dtype
+                    )
                 self.dispatcher = dispatcher
                 self.numworkers = len(dispatcher.getworkers())
                 logger.info("using distributed version with %i workers", self.numworkers)
@@ -478,44 +498,68 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 update.u, update.s = stochastic_svd(
                     corpus, self.num_topics,
                     num_terms=self.num_terms, chunksize=chunksize,
-                    extra_dims=self.extra_samples, power_iters=self.power_iters, dtype=self.dtype
+                    extra_dims=self.extra_samples, power_iters=self.power_iters, dtype=self.dtype,
+                    workers=getattr(self, 'workers', 1)
                 )
                 self.projection.merge(update, decay=decay)
                 self.docs_processed += len(corpus) if hasattr(corpus, '__len__') else 0
             else:
                 # the one-pass algo
                 doc_no = 0
+                pool, pending = None, deque()
                 if self.dispatcher:
                     logger.info('initializing %s workers', self.numworkers)
                     self.dispatcher.reset()
-                for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
-                    logger.info("preparing a new chunk of documents")
-                    nnz = sum(len(doc) for doc in chunk)
-                    # construct the job as a sparse matrix, to minimize memory overhead
-                    # definitely avoid materializing it as a dense matrix!
-                    logger.debug("converting corpus to csc format")
-                    job = matutils.corpus2csc(
-                        chunk, num_docs=len(chunk), num_terms=self.num_terms, num_nnz=nnz, dtype=self.dtype)
-                    del chunk
-                    doc_no += job.shape[1]
-                    if self.dispatcher:
-                        # distributed version: add this job to the job queue, so workers can work on it
-                        logger.debug("creating job #%i", chunk_no)
-                        # put job into queue; this will eventually block, because the queue has a small finite size
-                        self.dispatcher.putjob(job)
-                        del job
-                        logger.info("dispatched documents up to #%s", doc_no)
-                    else:
-                        # serial version, there is only one "worker" (myself) => process the job directly
-                        update = Projection(
-                            self.num_terms, self.num_topics, job, extra_dims=self.extra_samples,
-                            power_iters=self.power_iters, dtype=self.dtype
-                        )
-                        del job
-                        self.projection.merge(update, decay=decay)
-                        del update
+                elif getattr(self, 'workers', 1) > 1:
+                    logger.info('decomposing chunks in %i processes', self.workers)
+                    pool = multiprocessing.Pool(self.workers)
+                try:
+                    for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+                        logger.info("preparing a new chunk of documents")
+                        nnz = sum(len(doc) for doc in chunk)
+                        # construct the job as a sparse matrix, to minimize memory overhead
+                        # definitely avoid materializing it as a dense matrix!
+                        logger.debug("converting corpus to csc format")
+                        job = matutils.corpus2csc(
+                            chunk, num_docs=len(chunk), num_terms=self.num_terms, num_nnz=nnz, dtype=self.dtype)
+                        del chunk
+                        doc_no += job.shape[1]
+                        if self.dispatcher:
+                            # distributed version: add this job to the job queue, so workers can work on it
+                            logger.debug("creating job #%i", chunk_no)
+                            # put job into queue; this will eventually block, because the queue has a small finite size
+                            self.dispatcher.putjob(job)
+                            del job
+                            logger.info("dispatched documents up to #%s", doc_no)
+                        elif pool is not None:
+                            # decompose chunks in parallel, but merge them in their original order
+                            pending.append(pool.apply_async(_decompose_chunk, (
+                                job, self.num_topics, self.extra_samples, self.power_iters, self.dtype,
+                                np.random.randint(2 ** 31 - 1)
+                            )))
+                            del job
+                            while len(pending) >= 2 * self.workers:
+                                self.projection.merge(pending.popleft().get(), decay=decay)
+                            logger.info("dispatched documents up to #%s", doc_no)
+                        else:
+                            # serial version, there is only one "worker" (myself) => process the job directly
+                            update = Projection(
+                                self.num_terms, self.num_topics, job, extra_dims=self.extra_samples,
+                                power_iters=self.power_iters, dtype=self.dtype
+                            )
+                            del job
+                            self.projection.merge(update, decay=decay)
+                            del update
+                            logger.info("processed documents up to #%s", doc_no)
+                            self.print_topics(5)
+
+                    if pool is not None:
+                        while pending:
+                            self.projection.merge(pending.popleft().get(), decay=decay)
                         logger.info("processed documents up to #%s", doc_no)
-                        self.print_topics(5)
+                finally:
+                    if pool is not None:
+                        pool.terminate()
 
                 # wait for all workers to finish (distributed version only)
                 if self.dispatcher:
@@ -579,9 +623,7 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         if not is_corpus:
             bow = [bow]
 
-        # convert input to scipy.sparse CSC, then do "sparse * dense = dense" multiplication
-        vec = matutils.corpus2csc(bow, num_terms=self.num_terms, dtype=self.projection.u.dtype)
-        topic_dist = (vec.T * self.projection.u[:, :self.num_topics]).T  # (x^T * u).T = u^-1 * x
+        topic_dist = self._project(bow, scaled=scaled).T
 
         # # convert input to dense, then do dense * dense multiplication
         # # ± same performance as above (BLAS dense * dense is better optimized than scipy.sparse),
@@ -601,9 +643,6 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             # convert back from matrix into a 1d vec
             topic_dist = topic_dist.reshape(-1)
 
-        if scaled:
-            topic_dist = (1.0 / self.projection.s[:self.num_topics]) * topic_dist  # s^-1 * u^-1 * x
-
         # convert a np array to gensim sparse vector = tuples of (feature_id, feature_weight),
         # with no zero weights.
         if not is_corpus:
@@ -614,6 +653,110 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             result = matutils.Dense2Corpus(topic_dist)
         return result
 
+    def _project(self, chunk, scaled=False):
+        """Get the latent representation of a chunk of documents, as a dense array.
+
+        Parameters
+        ----------
+        chunk : list of list of (int, float)
+            Documents in BoW format.
+        scaled : bool, optional
+            If True - topics will be scaled by the inverse of singular values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic weights of shape (`len(chunk)`, `self.num_topics`).
+
+        """
+        # convert input to scipy.sparse CSC, then do "sparse * dense = dense" multiplication
+        vec = matutils.corpus2csc(chunk, num_terms=self.num_terms, dtype=self.projection.u.dtype)
+        topic_dist = vec.T * self.projection.u[:, :self.num_topics]  # x^T * u = (u^-1 * x).T
+        if scaled:
+            topic_dist = topic_dist * (1.0 / self.projection.s[:self.num_topics])  # (s^-1 * u^-1 * x).T
+        return topic_dist
+
+    def iter_dense_chunks(self, corpus, chunksize=512, scaled=False):
+        """Get the latent representation of a streamed `corpus`, as dense arrays of `chunksize` documents each.
+
+        Unlike `lsi[corpus]`, no (topic id, weight) tuples are created for each document, which makes this the
+        faster way to project a large corpus, for example for indexing the vectors.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Documents in BoW format.
+        chunksize : int, optional
+            Number of documents to project at once.
+        scaled : bool, optional
+            If True - topics will be scaled by the inverse of singular values.
+
+        Yields
+        ------
+        numpy.ndarray
+            Topic weights of the next `chunksize` documents, of shape (number of documents, `self.num_topics`).
+
+        """
+        assert self.projection.u is not None, "decomposition not initialized yet"
+        for chunk in utils.grouper(corpus, chunksize):
+            yield self._project(chunk, scaled=scaled)
+
+    def transform_to_array(self, corpus, out=None, chunksize=512, scaled=False):
+        """Get the latent representation of a whole `corpus` as a single dense array, possibly mmapped.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Documents in BoW format.
+        out : {numpy.ndarray, str}, optional
+            Array of shape (number of documents, `self.num_topics`) to write the result into, such as a
+            :class:`numpy.memmap`, or the path of a `.npy` file to create and write into through a memory map,
+            see :func:`numpy.lib.format.open_memmap`. By default, a new array is allocated in memory.
+            Both the default and a path need `len(corpus)`.
+        chunksize : int, optional
+            Number of documents to project at once.
+        scaled : bool, optional
+            If True - topics will be scaled by the inverse of singular values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic weights of each document of `corpus`, of shape (number of documents, `self.num_topics`).
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import common_corpus, common_dictionary, get_tmpfile
+            >>> from gensim.models import LsiModel
+            >>>
+            >>> model = LsiModel(common_corpus, id2word=common_dictionary, num_topics=2)
+            >>> vectors = model.transform_to_array(common_corpus, out=get_tmpfile("lsi_vectors.npy"))
+            >>> vectors.shape
+            (9, 2)
+
+        """
+        if out is None or isinstance(out, six.string_types):
+            shape = (len(corpus), self.num_topics)
+            if out is None:
+                out = np.empty(shape, dtype=self.projection.u.dtype)
+            else:
+                out = np.lib.format.open_memmap(out, mode='w+', dtype=self.projection.u.dtype, shape=shape)
+        if out.shape[1:] != (self.num_topics,):
+            raise ValueError("expected output of %i columns, got %s" % (self.num_topics, str(out.shape)))
+
+        doc_no = 0
+        for topic_dist in self.iter_dense_chunks(corpus, chunksize=chunksize, scaled=scaled):
+            if doc_no + len(topic_dist) > len(out):
+                raise ValueError("output has room for %i documents only, the corpus is longer" % len(out))
+            out[doc_no:doc_no + len(topic_dist)] = topic_dist
+            doc_no += len(topic_dist)
+        if doc_no != len(out):
+            raise ValueError("output has %i rows, but the corpus has %i documents" % (len(out), doc_no))
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
     def get_topics(self):
         """Get the topic vectors.
 
@@ -859,7 +1002,7 @@ def print_debug(id2token, u, s, topics, num_words=10, num_neg=None):
 
 
 def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
-                   power_iters=0, dtype=np.float64, eps=1e-6):
+                   power_iters=0, dtype=np.float64, eps=1e-6, workers=1):
     """Run truncated Singular Value Decomposition (SVD) on a sparse input.
 
     Parameters
@@ -882,6 +1025,10 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         Enforces a type for elements of the decomposed matrix.
     eps: float, optional
         Percentage of the spectrum's energy to be discarded.
+    workers : int, optional
+        Number of worker processes for a streamed `corpus`. With more than one, the chunks of each pass are
+        multiplied in parallel, each worker summing up the products of its chunks. Every worker then needs
+        memory for a (`num_terms`, `rank + extra_dims`) matrix.
 
     Notes
     -----
@@ -941,6 +1088,17 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
             q = corpus.T * q
             q = [corpus * q]
             q, _ = matutils.qr_destroy(q)  # orthonormalize the range after each power iteration step
+    elif workers > 1:
+        # same passes as below, with the chunks of each pass multiplied by several processes
+        y, num_docs = _parallel_chunk_sum(corpus, num_terms, chunksize, dtype, 'range', samples, y.shape, workers)
+        y = [y]
+        q, _ = matutils.qr_destroy(y)  # orthonormalize the range
+
+        for power_iter in range(power_iters):
+            logger.info("running power iteration #%i", power_iter + 1)
+            q, _ = _parallel_chunk_sum(corpus, num_terms, chunksize, dtype, 'power', q, q.shape, workers)
+            q = [q]
+            q, _ = matutils.qr_destroy(q)  # orthonormalize the range
     else:
         num_docs = 0
         for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
@@ -987,6 +1145,13 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         logger.info("2nd phase: running dense svd on %s matrix", str(b.shape))
         u, s, vt = scipy.linalg.svd(b, full_matrices=False)
         del b, vt
+    elif workers > 1:
+        shape = (qt.shape[0], qt.shape[0])
+        logger.info("2nd phase: constructing %s covariance matrix", str(shape))
+        x, _ = _parallel_chunk_sum(corpus, num_terms, chunksize, dtype, 'covariance', qt, shape, workers)
+        logger.info("running dense decomposition on %s covariance matrix", str(x.shape))
+        u, s, vt = scipy.linalg.svd(x)
+        s = np.sqrt(s)
     else:
         # second phase: construct the covariance matrix X = B * B.T, where B = Q.T * A
         # again, construct X incrementally, in chunks of `chunksize` documents from the streaming
@@ -1016,3 +1181,135 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
     s = s[:keep]
     u = np.dot(q, u)
     return u.astype(dtype), s.astype(dtype)
+
+
+def _decompose_chunk(job, num_topics, extra_dims, power_iters, dtype, seed):
+    """Get the :class:`~gensim.models.lsimodel.Projection` of a single chunk, in a worker process of
+    :meth:`~gensim.models.lsimodel.LsiModel.add_documents`.
+
+    Parameters
+    ----------
+    job : scipy.sparse.csc_matrix
+        Chunk of documents as columns.
+    num_topics : int
+        Desired rank of the decomposition.
+    extra_dims : int
+        Extra samples to be used besides the rank `num_topics`.
+    power_iters : int
+        Number of power iteration steps to be used.
+    dtype : numpy.dtype
+        Enforces a type for elements of the decomposed matrix.
+    seed : int
+        Seed of the random projections, so that processes don't repeat each other's.
+
+    Returns
+    -------
+    :class:`~gensim.models.lsimodel.Projection`
+        Decomposition of `job`.
+
+    """
+    np.random.seed(seed)
+    return Projection(
+        job.shape[0], num_topics, job, extra_dims=extra_dims, power_iters=power_iters, dtype=dtype
+    )
+
+
+def _chunk_product(chunk, step, operand, seed=None):
+    """Get the contribution of a single chunk to one of the sums over the corpus in
+    :func:`~gensim.models.lsimodel.stochastic_svd`.
+
+    Parameters
+    ----------
+    chunk : scipy.sparse.csc_matrix
+        Chunk of documents as columns.
+    step : {'range', 'power', 'covariance'}
+        Which sum: the action matrix `A * O`, a power iteration `A * A.T * Q`, or the covariance matrix `B * B.T`.
+    operand : {int, numpy.ndarray}
+        Number of samples of `O`, `Q`, or `Q.T`, for the respective steps.
+    seed : int, optional
+        Seed of the random gaussian matrix `O` of this chunk.
+
+    Returns
+    -------
+    numpy.ndarray
+        The contribution of `chunk`.
+
+    """
+    if step == 'range':
+        o = np.random.RandomState(seed).normal(0.0, 1.0, (chunk.shape[1], operand)).astype(chunk.dtype)
+        return chunk * o
+    if step == 'power':
+        return chunk * (chunk.T * operand)
+    b = operand * chunk  # dense * sparse matrix multiply
+    return np.dot(b, b.T)
+
+
+def _chunk_sum_worker(step, operand, shape, dtype, jobs, results):
+    """Sum up the :func:`~gensim.models.lsimodel._chunk_product` of all chunks in `jobs`, until `None`."""
+    total = np.zeros(shape, dtype=dtype)
+    for chunk, seed in iter(jobs.get, None):
+        total += _chunk_product(chunk, step, operand, seed)
+    results.put(total)
+
+
+def _parallel_chunk_sum(corpus, num_terms, chunksize, dtype, step, operand, shape, workers):
+    """Sum up the :func:`~gensim.models.lsimodel._chunk_product` of all chunks of `corpus`, in `workers` processes.
+
+    Returns
+    -------
+    (numpy.ndarray, int)
+        The sum, and the number of documents in `corpus`.
+
+    """
+    jobs = multiprocessing.Queue(maxsize=2 * workers)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_chunk_sum_worker, args=(step, operand, shape, dtype, jobs, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.daemon = True
+        process.start()
+
+    def check_workers():
+        if any(process.exitcode not in (None, 0) for process in processes):
+            raise RuntimeError("a worker process of stochastic_svd failed")
+
+    def put_job(job):
+        # don't wait forever for workers that died
+        while True:
+            try:
+                return jobs.put(job, timeout=1.0)
+            except queue.Full:
+                check_workers()
+
+    num_docs, total = 0, None
+    try:
+        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+            logger.info('PROGRESS: at document #%i', chunk_no * chunksize)
+            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)  # documents = columns of sparse CSC
+            num_docs += chunk.shape[1]
+            seed = np.random.randint(2 ** 31 - 1) if step == 'range' else None
+            put_job((chunk, seed))
+        for _ in processes:
+            put_job(None)
+
+        for _ in processes:
+            while True:
+                try:
+                    result = results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    check_workers()
+            if total is None:
+                total = result
+            else:
+                total += result
+    except BaseException:
+        for process in processes:
+            process.terminate()
+        raise
+    finally:
+        for process in processes:
+            process.join()
+    return total, num_docs
@@ -0,0 +1,800 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Dispatcher for distributed :class:`~gensim.models.ldamodel.LdaModel` and :class:`~gensim.models.lsimodel.LsiModel`
+training over plain TCP sockets, without Pyro4 or a name server.
+
+The dispatcher listens on a socket, and workers connect to it: either worker processes started on this machine by the
+dispatcher itself, or workers started by hand on any machines that can reach the dispatcher. Chunks of documents and
+model states are sent as raw numpy arrays in a simple binary framing, with JSON metadata, rather than pickled through
+RPC.
+
+If a worker dies, its connection breaks, or it stops sending heartbeats for `timeout` seconds, its unfinished job, as
+well as the jobs it finished since the last model state was collected (their results die with the worker), are
+re-queued for the remaining workers.
+
+Warnings
+--------
+Model parameters are still sent as pickles when the workers are initialized. Unpickling data can run arbitrary code, so
+the dispatcher and each worker first prove to each other that they know the same secret `authkey`, with an HMAC
+challenge-response like :mod:`multiprocessing.connection`, and nothing is unpickled before that. The traffic itself is
+not encrypted: only run remote workers in a trusted network, and keep the `authkey` secret.
+
+How to use
+----------
+#. Train on 4 local worker processes:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.models import LdaModel
+    >>> from gensim.models.socket_dispatcher import SocketDispatcher
+    >>>
+    >>> dispatcher = SocketDispatcher(workers=4)
+    >>> model = LdaModel(common_corpus, id2word=common_dictionary, distributed=dispatcher)
+    >>> dispatcher.exit()
+
+#. Or train on workers on other machines. Create the dispatcher first, listening on the interface of the private
+   network, so that it waits for them ::
+
+    >>> dispatcher = SocketDispatcher(workers=8, host='10.0.0.1', port=5555, authkey=b'secret')  # waits for 8
+
+   and run a worker for each core of each machine, with the same key ::
+
+    GENSIM_DISPATCHER_AUTHKEY=secret python -m gensim.models.socket_dispatcher --host 10.0.0.1 --port 5555 &
+
+Command line arguments
+----------------------
+
+.. program-output:: python -m gensim.models.socket_dispatcher --help
+   :ellipsis: 0, -5
+
+"""
+
+import argparse
+import hmac
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import scipy.sparse
+from six.moves import queue
+
+logger = logging.getLogger(__name__)
+
+# How many jobs (=chunks of N documents) to keep "pre-fetched" in the queue, same as the Pyro4 dispatchers.
+MAX_JOBS_QUEUE = 10
+
+# Message types of the wire protocol.
+MSG_HELLO, MSG_INIT, MSG_RESET, MSG_JOB, MSG_GETSTATE, MSG_EXIT, MSG_DONE, MSG_STATE, MSG_ERROR, MSG_ALIVE = range(10)
+
+# Environment variable with the default `authkey` of workers started from the command line.
+AUTHKEY_ENV = 'GENSIM_DISPATCHER_AUTHKEY'
+# Size of the random challenges of the handshake, in bytes.
+_CHALLENGE_SIZE = 32
+
+# Message header: type, length of the JSON metadata, number of arrays that follow.
+_HEADER = struct.Struct('!BII')
+# Array header: length of the dtype string, number of dimensions; then the dtype string and the shape follow.
+_ARRAY_HEADER = struct.Struct('!BB')
+
+
+class WorkerError(Exception):
+    """A worker failed, or the connection to it broke."""
+
+
+def _recv_exactly(sock, size):
+    """Read exactly `size` bytes from `sock`, into a writable buffer.
+
+    Raises
+    ------
+    EOFError
+        If the connection was closed before `size` bytes arrived.
+
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    pos = 0
+    while pos < size:
+        received = sock.recv_into(view[pos:], size - pos)
+        if not received:
+            raise EOFError("connection closed by peer")
+        pos += received
+    return buf
+
+
+def _digest(authkey, challenge):
+    return hmac.new(authkey, challenge, 'sha256').digest()
+
+
+def _authenticate(sock, authkey, server):
+    """Mutual challenge-response: check that the peer on `sock` knows `authkey`, and prove that we know it too.
+
+    Only fixed-size random challenges and their HMAC digests are exchanged, nothing is decoded or unpickled.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Freshly connected socket.
+    authkey : bytes
+        Shared secret.
+    server : bool
+        Whether this is the dispatcher's end (which sends the first challenge) or the worker's.
+
+    Raises
+    ------
+    WorkerError
+        If the peer doesn't know `authkey`.
+
+    """
+    if server:
+        challenge = os.urandom(_CHALLENGE_SIZE)
+        sock.sendall(challenge)
+        response = bytes(_recv_exactly(sock, 2 * _CHALLENGE_SIZE))
+        if not hmac.compare_digest(response[:_CHALLENGE_SIZE], _digest(authkey, challenge)):
+            raise WorkerError("authentication of the worker failed, wrong authkey")
+        sock.sendall(_digest(authkey, response[_CHALLENGE_SIZE:]))
+    else:
+        challenge = os.urandom(_CHALLENGE_SIZE)
+        sock.sendall(_digest(authkey, bytes(_recv_exactly(sock, _CHALLENGE_SIZE))) + challenge)
+        if not hmac.compare_digest(bytes(_recv_exactly(sock, _CHALLENGE_SIZE)), _digest(authkey, challenge)):
+            raise WorkerError("authentication of the dispatcher failed, wrong authkey")
+
+
+def send_message(sock, msgtype, meta=None, arrays=()):
+    """Send one message: small metadata, as JSON, followed by any number of numpy arrays in raw binary form.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+    msgtype : int
+        One of the `MSG_*` constants.
+    meta : object, optional
+        Small JSON-serializable object. Tuples are received as lists.
+    arrays : sequence of numpy.ndarray, optional
+        Arrays to send; they are sent without copying or pickling.
+
+    """
+    meta = json.dumps(meta).encode('utf8')
+    sock.sendall(_HEADER.pack(msgtype, len(meta), len(arrays)) + meta)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        dtype = array.dtype.str.encode('ascii')
+        sock.sendall(
+            _ARRAY_HEADER.pack(len(dtype), array.ndim) + dtype + struct.pack('!%iQ' % array.ndim, *array.shape)
+        )
+        if array.size:  # memoryview can't cast arrays with a zero dimension, e.g. (n, 0)
+            sock.sendall(memoryview(array.reshape(-1)).cast('B'))
+
+
+def recv_message(sock):
+    """Receive one message sent by :func:`~gensim.models.socket_dispatcher.send_message`.
+
+    Returns
+    -------
+    (int, object, list of numpy.ndarray)
+        Message type, metadata and arrays.
+
+    """
+    msgtype, metalen, num_arrays = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    meta = json.loads(bytes(_recv_exactly(sock, metalen)).decode('utf8'))
+    arrays = []
+    for _ in range(num_arrays):
+        dtypelen, ndim = _ARRAY_HEADER.unpack(_recv_exactly(sock, _ARRAY_HEADER.size))
+        dtype = np.dtype(bytes(_recv_exactly(sock, dtypelen)).decode('ascii'))
+        shape = struct.unpack('!%iQ' % ndim, _recv_exactly(sock, 8 * ndim))
+        size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        arrays.append(np.frombuffer(_recv_exactly(sock, size), dtype=dtype).reshape(shape))
+    return msgtype, meta, arrays
+
+
+def encode_job(job):
+    """Encode a job (a chunk of BoW documents, or a sparse term-document matrix) into arrays.
+
+    Parameters
+    ----------
+    job : {list of list of (int, float), scipy.sparse.csc_matrix}
+        The job, as put into the dispatcher by :class:`~gensim.models.ldamodel.LdaModel` or
+        :class:`~gensim.models.lsimodel.LsiModel` respectively.
+
+    Returns
+    -------
+    (object, list of numpy.ndarray)
+        Metadata and arrays, to be sent with :func:`~gensim.models.socket_dispatcher.send_message`.
+
+    """
+    if scipy.sparse.issparse(job):
+        job = job.tocsc()
+        return ('csc', [int(size) for size in job.shape]), [job.data, job.indices, job.indptr]
+    lengths = np.fromiter((len(doc) for doc in job), dtype=np.int64, count=len(job))
+    ids = np.fromiter((int(termid) for doc in job for termid, _ in doc), dtype=np.int64, count=lengths.sum())
+    weights = np.fromiter((weight for doc in job for _, weight in doc), dtype=np.float64, count=len(ids))
+    return ('bow', None), [lengths, ids, weights]
+
+
+def decode_job(meta, arrays):
+    """Inverse of :func:`~gensim.models.socket_dispatcher.encode_job`."""
+    kind, shape = meta
+    if kind == 'csc':
+        return scipy.sparse.csc_matrix(tuple(arrays), shape=tuple(shape))
+    lengths, ids, weights = arrays
+    docs = list(zip(ids.tolist(), weights.tolist()))
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+    return [docs[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def encode_state(state):
+    """Encode the state of a model into arrays.
+
+    Parameters
+    ----------
+    state : {:class:`~gensim.models.ldamodel.LdaState`, :class:`~gensim.models.lsimodel.Projection`}
+        State of an LDA model, or projection of an LSI model.
+
+    Returns
+    -------
+    (object, list of numpy.ndarray)
+        Metadata and arrays, to be sent with :func:`~gensim.models.socket_dispatcher.send_message`.
+
+    """
+    from gensim.models.ldamodel import LdaState
+
+    if isinstance(state, LdaState):
+        # the states collected from workers only cover the terms of their jobs: send just those columns
+        ids = np.flatnonzero(state.sstats.any(axis=0))
+        if len(ids) < state.sstats.shape[1] // 2:
+            shape = [int(size) for size in state.sstats.shape]
+            return ('lda', (int(state.numdocs), shape)), [state.eta, ids, state.sstats[:, ids]]
+        return ('lda', (int(state.numdocs), None)), [state.eta, state.sstats]
+    extra_dims = None if state.extra_dims is None else int(state.extra_dims)
+    meta = ('lsi', (int(state.m), int(state.k), int(state.power_iters), extra_dims))
+    return meta, ([] if state.u is None else [state.u, state.s])
+
+
+def decode_state(meta, arrays):
+    """Inverse of :func:`~gensim.models.socket_dispatcher.encode_state`."""
+    from gensim.models.ldamodel import LdaState
+    from gensim.models.lsimodel import Projection
+
+    kind, params = meta
+    if kind == 'lda':
+        numdocs, shape = params
+        if shape is None:
+            eta, sstats = arrays
+            state = LdaState(eta, sstats.shape, sstats.dtype)
+            state.sstats = np.array(sstats)
+        else:
+            eta, ids, sstats = arrays
+            state = LdaState(eta, tuple(shape), sstats.dtype)
+            state.sstats[:, ids] = sstats
+        state.numdocs = numdocs
+        return state
+    m, k, power_iters, extra_dims = params
+    projection = Projection(m, k, power_iters=power_iters, extra_dims=extra_dims)
+    if arrays:
+        projection.u, projection.s = np.array(arrays[0]), np.array(arrays[1])
+    return projection
+
+
+class _WorkerConnection(object):
+    """Dispatcher's end of the connection to a single worker."""
+
+    def __init__(self, sock, address, timeout=None):
+        self.sock = sock
+        self.address = address
+        self.timeout = timeout
+        self.lock = threading.RLock()
+        self.done_jobs = []  # jobs finished since the worker's state was last collected
+        self.alive = True
+
+    def request(self, msgtype, meta=None, arrays=()):
+        """Send a message and wait for the worker's reply.
+
+        Raises
+        ------
+        WorkerError
+            If the worker failed or is unreachable.
+
+        """
+        with self.lock:
+            try:
+                self.sock.settimeout(self.timeout)
+                send_message(self.sock, msgtype, meta, arrays)
+                # a busy worker sends heartbeats, so that `timeout` doesn't limit how long a job may take
+                reply = recv_message(self.sock)
+                while reply[0] == MSG_ALIVE:
+                    reply = recv_message(self.sock)
+            except (socket.error, EOFError, struct.error, ValueError) as err:
+                raise WorkerError("worker at %s failed: %s" % (self.address, err))
+        if reply[0] == MSG_ERROR:
+            raise WorkerError("worker at %s failed: %s" % (self.address, reply[1]))
+        return reply
+
+    def close(self):
+        self.alive = False
+        try:
+            self.sock.close()
+        except socket.error:
+            pass
+
+
+class SocketDispatcher(object):
+    """Dispatcher of distributed LDA or LSI training to workers connected over TCP sockets.
+
+    Pass an instance as the `distributed` parameter of :class:`~gensim.models.ldamodel.LdaModel` or
+    :class:`~gensim.models.lsimodel.LsiModel`. It offers the same methods to the model as the Pyro4 dispatchers in
+    :mod:`gensim.models.lda_dispatcher` and :mod:`gensim.models.lsi_dispatcher`.
+
+    """
+    def __init__(
+            self, workers=None, host=None, port=0, maxsize=MAX_JOBS_QUEUE, timeout=60.0, connect_timeout=60,
+            authkey=None):
+        """Listen for workers, and wait until `workers` of them are connected.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of workers. Defaults to one less than the number of cores.
+        host : str, optional
+            Interface to listen on for remote workers, preferably that of a private network. If None, listen on
+            localhost only, and start the `workers` worker processes locally.
+        port : int, optional
+            Port to listen on; by default pick any free port.
+        maxsize : int, optional
+            Maximum number of jobs to be kept pre-fetched in the queue.
+        timeout : float, optional
+            Seconds without any answer or heartbeat from a busy worker before considering it failed. Busy workers
+            send a heartbeat every `timeout / 4` seconds, so this doesn't limit how long processing a job may take.
+            None means wait forever, relying on the connection breaking when the worker dies.
+        connect_timeout : float, optional
+            Seconds to wait for all workers to connect.
+        authkey : {bytes, str}, optional
+            Secret shared with the workers, required with remote workers. Local workers get a random one.
+
+        Raises
+        ------
+        ValueError
+            If remote workers are expected, but no `authkey` was given.
+        RuntimeError
+            If not all workers connected within `connect_timeout`.
+
+        """
+        if authkey is None:
+            if host is not None:
+                raise ValueError("an authkey is required to accept remote workers")
+            authkey = os.urandom(_CHALLENGE_SIZE)
+        self.authkey = authkey.encode('utf8') if isinstance(authkey, str) else bytes(authkey)
+        self.num_workers = max(1, multiprocessing.cpu_count() - 1) if workers is None else int(workers)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.workers = []
+        self.processes = []
+        self.kind = None
+        self.jobs = queue.Queue(maxsize=maxsize)
+        self.retries = deque()  # jobs of failed workers, to be processed before any new jobs
+        self.lock_update = threading.Lock()
+        self._jobsdone = 0
+        self._jobsreceived = 0
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1' if host is None else host, port))
+        self.server.listen(self.num_workers)
+        self.address = self.server.getsockname()
+
+        if host is None:
+            for _ in range(self.num_workers):
+                process = multiprocessing.Process(target=run_worker, args=self.address + (self.authkey,))
+                process.daemon = True
+                process.start()
+                self.processes.append(process)
+            logger.info("started %i local worker processes", self.num_workers)
+        else:
+            logger.info("waiting for %i workers to connect to %s:%i", self.num_workers, *self.address)
+
+        self.server.settimeout(connect_timeout)
+        try:
+            while len(self.workers) < self.num_workers:
+                sock, address = self.server.accept()
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(connect_timeout)
+                try:
+                    _authenticate(sock, self.authkey, server=True)
+                    msgtype, _, _ = recv_message(sock)
+                    if msgtype == MSG_HELLO:
+                        send_message(sock, MSG_HELLO, {'heartbeat': None if timeout is None else timeout / 4.0})
+                except (socket.error, EOFError, struct.error, ValueError, WorkerError) as err:
+                    logger.warning("ignoring connection from %s: %s", address, err)
+                    sock.close()
+                    continue
+                if msgtype != MSG_HELLO:
+                    logger.warning("ignoring unexpected connection from %s", address)
+                    sock.close()
+                    continue
+                logger.info("registering worker #%i at %s", len(self.workers), address)
+                self.workers.append(_WorkerConnection(sock, address, timeout))
+        except socket.timeout:
+            self.exit()
+            raise RuntimeError("only %i of %i workers connected within %s seconds" % (
+                len(self.workers), self.num_workers, connect_timeout
+            ))
+
+        for worker in self.workers:
+            thread = threading.Thread(target=self._feed_worker, args=(worker,))
+            thread.daemon = True
+            thread.start()
+
+    def initialize(self, kind, **model_params):
+        """Initialize all workers, and start sending them jobs.
+
+        Parameters
+        ----------
+        kind : {'lda', 'lsi'}
+            Type of model the workers train.
+        **model_params
+            Keyword parameters to initialize the workers' models with.
+
+        """
+        self.kind = kind
+        for worker in self.workers:
+            if not worker.alive:
+                continue
+            try:
+                # model parameters include e.g. the id2word mapping, which only pickle can serialize
+                params = np.frombuffer(pickle.dumps(model_params, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+                worker.request(MSG_INIT, kind, [params])
+            except WorkerError as err:
+                self._worker_failed(worker, err)
+        self._check_workers()
+
+    def getworkers(self):
+        """Get the addresses of all live workers.
+
+        Returns
+        -------
+        list of (str, int)
+            Host and port of each worker's connection.
+
+        """
+        return [worker.address for worker in self.workers if worker.alive]
+
+    def putjob(self, job):
+        """Add a job to the queue, blocking while the queue is full.
+
+        Parameters
+        ----------
+        job : {list of list of (int, float), scipy.sparse.csc_matrix}
+            Chunk of documents for LDA, or sparse term-document matrix for LSI.
+
+        Raises
+        ------
+        RuntimeError
+            If all workers have failed.
+
+        """
+        job = encode_job(job)
+        with self.lock_update:
+            self._jobsreceived += 1
+        while True:
+            self._check_workers()
+            try:
+                self.jobs.put(job, block=True, timeout=1)
+                break
+            except queue.Full:
+                continue
+        logger.debug("added a new job (len(queue)=%i items)", self.jobs.qsize())
+
+    def getstate(self):
+        """Wait for all jobs to finish, then merge the states of all workers.
+
+        Returns
+        -------
+        {:class:`~gensim.models.ldamodel.LdaState`, :class:`~gensim.models.lsimodel.Projection`}
+            Merged state.
+
+        Raises
+        ------
+        RuntimeError
+            If all workers have failed.
+
+        """
+        logger.info("end of input, waiting for all remaining jobs")
+        result = None
+        while True:
+            while self._jobsdone < self._jobsreceived:
+                self._check_workers()
+                time.sleep(0.01)
+
+            logger.info("merging states from %i workers", len(self.getworkers()))
+            for worker in self.workers:
+                if not worker.alive:
+                    continue
+                with worker.lock:
+                    try:
+                        _, meta, arrays = worker.request(MSG_GETSTATE)
+                    except WorkerError as err:
+                        self._worker_failed(worker, err)
+                        continue
+                    worker.done_jobs = []  # their results are safe in `result` now
+                state = decode_state(meta, arrays)
+                if result is None:
+                    result = state
+                else:
+                    result.merge(state)
+
+            # jobs of workers that failed meanwhile were re-queued => collect their results too
+            if self._jobsdone == self._jobsreceived:
+                self._check_workers()
+                return result
+
+    def reset(self, state=None):
+        """Reinitialize all workers for a new EM iteration, or a new pass of LSI.
+
+        Parameters
+        ----------
+        state : :class:`~gensim.models.ldamodel.LdaState`, optional
+            Current state of the LDA model. Not used for LSI.
+
+        """
+        meta, arrays = (None, []) if state is None else encode_state(state)
+        for workerid, worker in enumerate(self.workers):
+            if not worker.alive:
+                continue
+            logger.info("resetting worker #%i", workerid)
+            with worker.lock:
+                try:
+                    worker.request(MSG_RESET, meta, arrays)
+                except WorkerError as err:
+                    self._worker_failed(worker, err)
+                    continue
+                worker.done_jobs = []
+        with self.lock_update:
+            self._jobsdone = 0
+            self._jobsreceived = 0
+        self._check_workers()
+
+    def jobsdone(self):
+        """Get the number of jobs finished since the last reset.
+
+        Returns
+        -------
+        int
+            Number of jobs already completed.
+
+        """
+        return self._jobsdone
+
+    def exit(self):
+        """Terminate all workers and close the dispatcher's socket."""
+        for workerid, worker in enumerate(self.workers):
+            if worker.alive:
+                logger.info("terminating worker #%i", workerid)
+                try:
+                    with worker.lock:
+                        send_message(worker.sock, MSG_EXIT)
+                except socket.error:
+                    pass
+                worker.close()
+        self.server.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def _check_workers(self):
+        if not self.getworkers():
+            raise RuntimeError("all workers failed; see the log for details")
+
+    def _feed_worker(self, worker):
+        """Send jobs to `worker` one by one, until it fails or is closed. Runs in a thread per worker."""
+        while worker.alive:
+            try:
+                with self.lock_update:
+                    job = self.retries.popleft()
+            except IndexError:
+                try:
+                    job = self.jobs.get(block=True, timeout=1)
+                except queue.Empty:
+                    continue
+            with worker.lock:
+                try:
+                    worker.request(MSG_JOB, *job)
+                except WorkerError as err:
+                    with self.lock_update:
+                        self.retries.append(job)
+                    self._worker_failed(worker, err)
+                    return
+                with self.lock_update:
+                    worker.done_jobs.append(job)
+                    self._jobsdone += 1
+
+    def _worker_failed(self, worker, err):
+        """Drop a failed worker, and re-queue the jobs whose results died with it."""
+        with self.lock_update:
+            if not worker.alive:
+                return
+            logger.warning("%s; re-queueing %i jobs", err, len(worker.done_jobs))
+            worker.close()
+            self.retries.extend(worker.done_jobs)
+            self._jobsdone -= len(worker.done_jobs)
+            worker.done_jobs = []
+
+
+class _Worker(object):
+    """Worker's end: a model which processes the jobs it receives."""
+
+    def __init__(self):
+        self.model = None
+        self.kind = None
+        self.jobsdone = 0
+
+    def initialize(self, kind, model_params):
+        from gensim.models import ldamodel, lsimodel
+
+        logger.info("initializing %s worker", kind)
+        self.kind = kind
+        model_class = {'lda': ldamodel.LdaModel, 'lsi': lsimodel.LsiModel}[kind]
+        self.model = model_class(**model_params)
+
+    def reset(self, state):
+        if self.kind == 'lda':
+            self.model.state = state
+            self.model.sync_state()
+            self.model.state.reset()
+        else:
+            self.model.projection = self.model.projection.empty_like()
+
+    def processjob(self, job):
+        logger.debug("starting to process job #%i", self.jobsdone)
+        if self.kind == 'lda':
+            self.model.do_estep(job)
+        else:
+            self.model.add_documents(job)
+        self.jobsdone += 1
+        logger.info("finished processing job #%i", self.jobsdone - 1)
+
+    def getstate(self):
+        """Get the state accumulated since the last call, and start accumulating afresh."""
+        from gensim.models.ldamodel import LdaState
+
+        if self.kind == 'lda':
+            state = self.model.state
+            self.model.state = LdaState(state.eta, state.sstats.shape, state.dtype)
+        else:
+            state = self.model.projection
+            self.model.projection = state.empty_like()
+        return encode_state(state)
+
+
+def _send_heartbeats(sock, send_lock, busy, interval, stop):
+    """Tell the dispatcher every `interval` seconds that this worker is alive, while it is `busy` with a request."""
+    while not stop.wait(interval):
+        with send_lock:
+            if busy.is_set():
+                try:
+                    send_message(sock, MSG_ALIVE)
+                except socket.error:
+                    return
+
+
+def run_worker(host, port, authkey, connect_timeout=60):
+    """Connect to the dispatcher at `host`:`port` and process its requests, until told to exit.
+
+    Parameters
+    ----------
+    host : str
+        Hostname or IP address of the dispatcher.
+    port : int
+        Port of the dispatcher.
+    authkey : {bytes, str}
+        Secret shared with the dispatcher.
+    connect_timeout : float, optional
+        Keep retrying to connect for this many seconds, in case the dispatcher isn't listening yet.
+
+    Raises
+    ------
+    WorkerError
+        If the dispatcher doesn't know `authkey`.
+
+    """
+    authkey = authkey.encode('utf8') if isinstance(authkey, str) else bytes(authkey)
+    deadline = time.time() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except socket.error:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.5)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    send_lock, busy, stop = threading.Lock(), threading.Event(), threading.Event()
+    try:
+        sock.settimeout(connect_timeout)
+        _authenticate(sock, authkey, server=False)
+        send_message(sock, MSG_HELLO)
+        _, meta, _ = recv_message(sock)
+        sock.settimeout(None)
+        logger.info("connected to dispatcher at %s:%i", host, port)
+        if meta['heartbeat']:
+            heartbeats = threading.Thread(
+                target=_send_heartbeats, args=(sock, send_lock, busy, meta['heartbeat'], stop))
+            heartbeats.daemon = True
+            heartbeats.start()
+    except Exception:
+        sock.close()
+        raise
+
+    worker = _Worker()
+    try:
+        while True:
+            try:
+                msgtype, meta, arrays = recv_message(sock)
+            except EOFError:
+                logger.info("dispatcher closed the connection")
+                break
+            if msgtype == MSG_EXIT:
+                logger.info("terminating worker")
+                break
+            busy.set()
+            try:
+                if msgtype == MSG_INIT:
+                    worker.initialize(meta, pickle.loads(arrays[0].tobytes()))
+                    reply = (MSG_DONE, None, [])
+                elif msgtype == MSG_RESET:
+                    worker.reset(None if meta is None else decode_state(meta, arrays))
+                    reply = (MSG_DONE, None, [])
+                elif msgtype == MSG_JOB:
+                    worker.processjob(decode_job(meta, arrays))
+                    reply = (MSG_DONE, None, [])
+                elif msgtype == MSG_GETSTATE:
+                    reply = (MSG_STATE,) + worker.getstate()
+                else:
+                    raise ValueError("unexpected message type %r" % msgtype)
+            except Exception as err:
+                logger.exception("failed to process message of type %r", msgtype)
+                reply = (MSG_ERROR, repr(err), [])
+            with send_lock:
+                busy.clear()  # no more heartbeats after the reply
+                send_message(sock, *reply)
+    finally:
+        stop.set()
+        sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__[:-130], formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--host", help="Dispatcher hostname (default: %(default)s)", default='localhost')
+    parser.add_argument("--port", help="Dispatcher port", type=int, required=True)
+    parser.add_argument(
+        "--authkey", help="Secret shared with the dispatcher (default: $%s)" % AUTHKEY_ENV,
+        default=os.environ.get(AUTHKEY_ENV)
+    )
+    parser.add_argument(
+        '-v', '--verbose', help='Verbose flag', action='store_const', dest="loglevel",
+        const=logging.INFO, default=logging.WARNING
+    )
+    args = parser.parse_args()
+    if not args.authkey:
+        parser.error("an authkey is required, set %s or pass --authkey" % AUTHKEY_ENV)
+
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=args.loglevel)
+    logger.info("running %s", " ".join(sys.argv))
+    run_worker(args.host, args.port, args.authkey)
+    logger.info("finished running %s", " ".join(sys.argv))
+
+
+if __name__ == '__main__':
+    main()
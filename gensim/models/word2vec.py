@@ -185,11 +185,12 @@ import sys
 import os
 import heapq
 from timeit import default_timer
-from collections import defaultdict, namedtuple
+from collections import defaultdict, deque, namedtuple
 from types import GeneratorType
 import threading
 import itertools
 import copy
+import multiprocessing
 from queue import Queue, Empty
 
 from numpy import float32 as REAL
@@ -441,7 +442,7 @@ class Word2Vec(utils.SaveLoad):
 
     def build_vocab(
             self, corpus_iterable=None, corpus_file=None, update=False, progress_per=10000,
-            keep_raw_vocab=False, trim_rule=None, **kwargs,
+            keep_raw_vocab=False, trim_rule=None, workers=None, **kwargs,
         ):
         """Build vocabulary from a sequence of sentences (can be a once-only generator stream).
 
@@ -476,12 +477,16 @@ class Word2Vec(utils.SaveLoad):
                 * `count` (int) - the word's frequency count in the corpus
                 * `min_count` (int) - the minimum count threshold.
 
+        workers : int, optional
+            Number of processes used to count the words of the corpus, see
+            :meth:`~gensim.models.word2vec.Word2Vec.scan_vocab`. By default, the corpus is scanned in this process.
         **kwargs : object
             Key word arguments propagated to `self.prepare_vocab`
 
         """
         total_words, corpus_count = self.scan_vocab(
-            corpus_iterable=corpus_iterable, corpus_file=corpus_file, progress_per=progress_per, trim_rule=trim_rule)
+            corpus_iterable=corpus_iterable, corpus_file=corpus_file, progress_per=progress_per, workers=workers,
+            trim_rule=trim_rule)
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
         report_values = self.prepare_vocab(update=update, keep_raw_vocab=keep_raw_vocab, trim_rule=trim_rule, **kwargs)
@@ -569,12 +574,110 @@ class Word2Vec(utils.SaveLoad):
         self.raw_vocab = vocab
         return total_words, corpus_count
 
+    def _scan_vocab_parallel(self, corpus_iterable, corpus_file, progress_per, workers, trim_rule):
+        """Count the words of the corpus in `workers` processes, and merge their counts into `self.raw_vocab`.
+
+        A `corpus_file` is split into `workers` ranges of bytes, like in
+        :meth:`~gensim.models.word2vec.Word2Vec._train_epoch_corpusfile`, and each process reads the lines
+        starting in its range. A `corpus_iterable` is read in this process, and sent to the others in batches.
+
+        With `max_vocab_size`, the counts of each process are pruned like in the serial scan, and so is their merge
+        after adding the counts of each process. The resulting counts may then differ from the serial scan.
+
+        """
+        vocab = defaultdict(int)
+        total_words, corpus_count = 0, 0
+        min_reduce = 1
+        # the trim rule is only needed to prune, and must be pickled to be sent to the workers
+        prune_args = (self.max_vocab_size, trim_rule if self.max_vocab_size else None)
+
+        if corpus_file is not None:
+            corpus_file_size = os.path.getsize(corpus_file)
+            offsets = [corpus_file_size * part // workers for part in range(workers + 1)]
+            jobs = [
+                (_count_corpus_file_words, (corpus_file, start, end) + prune_args)
+                for start, end in zip(offsets, offsets[1:])
+            ]
+        else:
+            jobs = (
+                (_count_words, (batch, ) + prune_args)
+                for batch in _word_batches(corpus_iterable, 10 * MAX_WORDS_IN_BATCH)
+            )
+
+        next_progress = progress_per
+
+        def merge(result):
+            nonlocal total_words, corpus_count, min_reduce, next_progress
+            partial_vocab, partial_words, partial_count = result
+            utils.merge_counts(vocab, partial_vocab)
+            total_words += partial_words
+            corpus_count += partial_count
+            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
+                utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+                min_reduce += 1
+            if corpus_count >= next_progress:
+                logger.info(
+                    "PROGRESS: at sentence #%i, processed %i words, keeping %i word types",
+                    corpus_count, total_words, len(vocab)
+                )
+                next_progress = corpus_count + progress_per
+
+        pool = multiprocessing.Pool(workers)
+        pending = deque()
+        try:
+            for target, args in jobs:
+                pending.append(pool.apply_async(target, args))
+                # merge the partial counts in the order they were sent, with at most 2 jobs per worker in flight
+                while len(pending) >= 2 * workers:
+                    merge(pending.popleft().get())
+            while pending:
+                merge(pending.popleft().get())
+        finally:
+            pool.terminate()
+
+        self.raw_vocab = vocab
+        return total_words, corpus_count
+
     def scan_vocab(self, corpus_iterable=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None):
-        logger.info("collecting all words and their counts")
-        if corpus_file:
-            corpus_iterable = LineSentence(corpus_file)
+        """Collect the counts of all words of the corpus into `self.raw_vocab`.
+
+        Parameters
+        ----------
+        corpus_iterable : iterable of list of str, optional
+            Sentences to scan.
+        corpus_file : str, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        progress_per : int, optional
+            Indicates how many sentences to process before logging the progress.
+        workers : int, optional
+            Number of processes used to count the words. A `corpus_file` is split into `workers` ranges of bytes,
+            scanned in parallel; compressed files are always scanned in this process. A `corpus_iterable` is read in
+            this process, and its words are counted by the workers. The `trim_rule` must be picklable to be used
+            with `max_vocab_size`. By default, the corpus is scanned in this process.
+        trim_rule : function, optional
+            Vocabulary trimming rule applied when `max_vocab_size` is exceeded,
+            see :meth:`~gensim.models.word2vec.Word2Vec.build_vocab`.
+
+        Returns
+        -------
+        (int, int)
+            Tuple of (total words in the corpus, number of sentences).
 
-        total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
+        """
+        logger.info("collecting all words and their counts")
+        if corpus_file and os.path.splitext(corpus_file)[1] in ('.gz', '.bz2', '.xz'):
+            # compressed files can't be split by offsets
+            workers = None
+
+        if workers is not None and workers > 1:
+            logger.info("counting words in %i processes", workers)
+            total_words, corpus_count = self._scan_vocab_parallel(
+                corpus_iterable, corpus_file, progress_per, workers, trim_rule
+            )
+        else:
+            if corpus_file:
+                corpus_iterable = LineSentence(corpus_file)
+            total_words, corpus_count = self._scan_vocab(corpus_iterable, progress_per, trim_rule)
 
         logger.info(
             "collected %i word types from a corpus of %i raw words and %i sentences",
@@ -942,7 +1045,7 @@ class Word2Vec(utils.SaveLoad):
     def train(
             self, corpus_iterable=None, corpus_file=None, total_examples=None, total_words=None,
             epochs=None, start_alpha=None, end_alpha=None, word_count=0,
-            queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(),
+            queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(), resume_from=None,
             **kwargs,
         ):
         """Update the model's neural weights from a sequence of sentences.
@@ -970,10 +1073,11 @@ class Word2Vec(utils.SaveLoad):
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
             See also the `tutorial on data streaming in Python
             <https://rare-technologies.com/data-streaming-in-python-generators-iterators-iterables/>`_.
-        corpus_file : str, optional
+        corpus_file : {str, :class:`~gensim.models.word2vec.WordIdCorpus`}, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
-            `corpus_file` arguments need to be passed (not both of them).
+            `corpus_file` arguments need to be passed (not both of them). A corpus converted once to word ids with
+            :meth:`~gensim.models.word2vec.WordIdCorpus.serialize` skips all text parsing during training.
         total_examples : int
             Count of sentences.
         total_words : int
@@ -1002,6 +1106,10 @@ class Word2Vec(utils.SaveLoad):
             :meth:`~gensim.models.word2vec.Word2Vec.get_latest_training_loss`.
         callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             Sequence of callbacks to be executed at specific stages during training.
+        resume_from : str, optional
+            Path prefix of a :class:`~gensim.models.callbacks.TrainingCheckpoint` saved by an interrupted call
+            of `train()` with the same arguments. Load its weights and continue training where it stopped.
+            Training from `corpus_file` continues from the start of the interrupted epoch.
 
         Examples
         --------
@@ -1025,9 +1133,17 @@ class Word2Vec(utils.SaveLoad):
             total_examples=total_examples,
             total_words=total_words)
 
+        if isinstance(corpus_file, WordIdCorpus):
+            corpus_file.check_vocab(self.wv)
+
         self.compute_loss = compute_loss
         self.running_training_loss = 0.0
 
+        start_epoch, skip_examples, skip_words = 0, 0, 0
+        if resume_from is not None:
+            from gensim.models.callbacks import TrainingCheckpoint
+            start_epoch, skip_examples, skip_words = TrainingCheckpoint.restore(self, resume_from)
+
         for callback in callbacks:
             callback.on_train_begin(self)
 
@@ -1036,7 +1152,13 @@ class Word2Vec(utils.SaveLoad):
         start = default_timer() - 0.00001
         job_tally = 0
 
-        for cur_epoch in range(self.epochs):
+        for cur_epoch in range(start_epoch, self.epochs):
+            if corpus_iterable is None or cur_epoch > start_epoch:
+                skip_examples, skip_words = 0, 0
+            # (epoch, examples, raw words) trained so far, for the callbacks
+            self.epoch_progress = (cur_epoch, skip_examples, skip_words)
+            self.training_metrics = TrainingMetrics(cur_epoch)
+
             for callback in callbacks:
                 callback.on_epoch_begin(self)
 
@@ -1044,7 +1166,7 @@ class Word2Vec(utils.SaveLoad):
                 trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch(
                     corpus_iterable, cur_epoch=cur_epoch, total_examples=total_examples,
                     total_words=total_words, queue_factor=queue_factor, report_delay=report_delay,
-                    callbacks=callbacks, **kwargs)
+                    callbacks=callbacks, skip_examples=skip_examples, skip_words=skip_words, **kwargs)
             else:
                 trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_corpusfile(
                     corpus_file, cur_epoch=cur_epoch, total_examples=total_examples, total_words=total_words,
@@ -1079,8 +1201,9 @@ class Word2Vec(utils.SaveLoad):
 
         Parameters
         ----------
-        corpus_file : str
-            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or this worker's stream
+            over a :class:`~gensim.models.word2vec.WordIdCorpus`.
         thread_id : int
             Thread index starting from 0 to `number of workers - 1`.
         offset : int
@@ -1097,10 +1220,13 @@ class Word2Vec(utils.SaveLoad):
 
         """
         thread_private_mem = self._get_thread_working_mem()
+        metrics = self.training_metrics.add_worker()
 
+        start = default_timer()
         examples, tally, raw_tally = self._do_train_epoch(
             corpus_file, thread_id, offset, cython_vocab, thread_private_mem, cur_epoch,
             total_examples=total_examples, total_words=total_words, **kwargs)
+        metrics.add_job(default_timer() - start, tally, raw_tally)
 
         progress_queue.put((examples, tally, raw_tally))
         progress_queue.put(None)
@@ -1113,40 +1239,49 @@ class Word2Vec(utils.SaveLoad):
 
         Parameters
         ----------
-        job_queue : Queue of (list of objects, float)
+        job_queue : Queue of (list of objects, float, int)
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
-            Each job is represented by a tuple where the first element is the corpus chunk to be processed and
-            the second is the floating-point learning rate.
-        progress_queue : Queue of (int, int, int)
-            A queue of progress reports. Each report is represented as a tuple of these 3 elements:
+            Each job is represented by a tuple where the first element is the corpus chunk to be processed,
+            the second is the floating-point learning rate and the third is the job number.
+        progress_queue : Queue of (int, int, int, int)
+            A queue of progress reports. Each report is represented as a tuple of these 4 elements:
                 * Size of data chunk processed, for example number of sentences in the corpus chunk.
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
+                * Number of the job.
 
         """
         thread_private_mem = self._get_thread_working_mem()
         jobs_processed = 0
         callbacks = progress_queue.callbacks
+        metrics = self.training_metrics.add_worker()
         while True:
+            start = default_timer()
             job = job_queue.get()
+            metrics.get_wait += default_timer() - start
             if job is None:
                 progress_queue.put(None)
                 break  # no more jobs => quit this worker
-            data_iterable, alpha = job
+            data_iterable, alpha, job_no = job
 
             for callback in callbacks:
                 callback.on_batch_begin(self)
 
+            start = default_timer()
             tally, raw_tally = self._do_train_job(data_iterable, alpha, thread_private_mem)
+            metrics.add_job(default_timer() - start, tally, raw_tally)
 
             for callback in callbacks:
                 callback.on_batch_end(self)
 
-            progress_queue.put((len(data_iterable), tally, raw_tally))  # report back progress
+            progress_queue.put((len(data_iterable), tally, raw_tally, job_no))  # report back progress
             jobs_processed += 1
         logger.debug("worker exiting, processed %i jobs", jobs_processed)
 
-    def _job_producer(self, data_iterator, job_queue, cur_epoch=0, total_examples=None, total_words=None):
+    def _job_producer(
+            self, data_iterator, job_queue, cur_epoch=0, total_examples=None, total_words=None,
+            skip_examples=0, skip_words=0,
+        ):
         """Fill the jobs queue using the data found in the input stream.
 
         Each job is represented by a tuple where the first element is the corpus chunk to be processed and
@@ -1156,10 +1291,10 @@ class Word2Vec(utils.SaveLoad):
         ----------
         data_iterator : iterable of list of objects
             The input dataset. This will be split in chunks and these chunks will be pushed to the queue.
-        job_queue : Queue of (list of object, float)
+        job_queue : Queue of (list of object, float, int)
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
-            Each job is represented by a tuple where the first element is the corpus chunk to be processed and
-            the second is the floating-point learning rate.
+            Each job is represented by a tuple where the first element is the corpus chunk to be processed,
+            the second is the floating-point learning rate and the third is the job number.
         cur_epoch : int, optional
             The current training epoch, needed to compute the training parameters for each job.
             For example in many implementations the learning rate would be dropping with the number of epochs.
@@ -1169,12 +1304,31 @@ class Word2Vec(utils.SaveLoad):
         total_words : int, optional
             Count of total objects in `data_iterator`. In the usual case this would correspond to the number of raw
             words in a corpus. Used to log progress.
+        skip_examples : int, optional
+            Number of objects at the start of `data_iterator` already trained in this epoch, to skip.
+        skip_words : int, optional
+            Count of raw words in the skipped objects.
 
         """
         job_batch, batch_size = [], 0
-        pushed_words, pushed_examples = 0, 0
-        next_alpha = self._get_next_alpha(0.0, cur_epoch)
+        pushed_words, pushed_examples = skip_words, skip_examples
+        epoch_progress = 0.0
+        if skip_examples:
+            data_iterator = itertools.islice(data_iterator, skip_examples, None)
+            if total_examples:
+                epoch_progress = 1.0 * pushed_examples / total_examples
+            else:
+                epoch_progress = 1.0 * pushed_words / total_words
+        next_alpha = self._get_next_alpha(epoch_progress, cur_epoch)
         job_no = 0
+        metrics = self.training_metrics
+
+        def put(job, words=None):
+            start = default_timer()
+            job_queue.put(job)
+            metrics.put_wait += default_timer() - start
+            if words is not None:
+                metrics.add_job_size(words)
 
         for data_idx, data in enumerate(data_iterator):
             data_length = self._raw_word_count([data])
@@ -1186,7 +1340,7 @@ class Word2Vec(utils.SaveLoad):
                 batch_size += data_length
             else:
                 job_no += 1
-                job_queue.put((job_batch, next_alpha))
+                put((job_batch, next_alpha, job_no), batch_size)
 
                 # update the learning rate for the next job
                 if total_examples:
@@ -1204,7 +1358,7 @@ class Word2Vec(utils.SaveLoad):
         # add the last job too (may be significantly smaller than batch_words)
         if job_batch:
             job_no += 1
-            job_queue.put((job_batch, next_alpha))
+            put((job_batch, next_alpha, job_no), batch_size)
 
         if job_no == 0 and self.train_count == 0:
             logger.warning(
@@ -1214,26 +1368,28 @@ class Word2Vec(utils.SaveLoad):
 
         # give the workers heads up that they can finish -- no more work!
         for _ in range(self.workers):
-            job_queue.put(None)
+            put(None)
+        metrics.producer_time = default_timer() - metrics.start
         logger.debug("job loop exiting, total %i jobs", job_no)
 
     def _log_epoch_progress(
             self, progress_queue=None, job_queue=None, cur_epoch=0, total_examples=None,
-            total_words=None, report_delay=1.0, is_corpus_file_mode=None,
+            total_words=None, report_delay=1.0, is_corpus_file_mode=None, skip_examples=0, skip_words=0,
         ):
         """Get the progress report for a single training epoch.
 
         Parameters
         ----------
-        progress_queue : Queue of (int, int, int)
+        progress_queue : Queue of (int, int, int[, int])
             A queue of progress reports. Each report is represented as a tuple of these 3 elements:
                 * size of data chunk processed, for example number of sentences in the corpus chunk.
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
-        job_queue : Queue of (list of object, float)
+            and, except in `corpus_file` mode, the number of the job.
+        job_queue : Queue of (list of object, float, int)
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
             Each job is represented by a tuple where the first element is the corpus chunk to be processed and
-            the second is the floating-point learning rate.
+            the second is the floating-point learning rate and the third is the job number.
         cur_epoch : int, optional
             The current training epoch, needed to compute the training parameters for each job.
             For example in many implementations the learning rate would be dropping with the number of epochs.
@@ -1247,6 +1403,10 @@ class Word2Vec(utils.SaveLoad):
             Number of seconds between two consecutive progress report messages in the logger.
         is_corpus_file_mode : bool, optional
             Whether training is file-based (corpus_file argument) or not.
+        skip_examples : int, optional
+            Number of examples of this epoch trained before a resumed training, counted in the logged progress.
+        skip_words : int, optional
+            Count of raw words in these examples.
 
         Returns
         -------
@@ -1261,6 +1421,10 @@ class Word2Vec(utils.SaveLoad):
         start, next_report = default_timer() - 0.00001, 1.0
         job_tally = 0
         unfinished_worker_count = self.workers
+        # jobs may finish out of order: only the examples up to the first job still running are safe to skip when
+        # resuming from a checkpoint, so keep the reports of later jobs until the gap is filled
+        finished_jobs, next_job_no = {}, 1
+        done_examples, done_words = skip_examples, skip_words
 
         while unfinished_worker_count > 0:
             report = progress_queue.get()  # blocks if workers too slow
@@ -1268,25 +1432,36 @@ class Word2Vec(utils.SaveLoad):
                 unfinished_worker_count -= 1
                 logger.info("worker thread finished; awaiting finish of %i more threads", unfinished_worker_count)
                 continue
-            examples, trained_words, raw_words = report
+            examples, trained_words, raw_words = report[:3]
             job_tally += 1
 
             # update progress stats
             example_count += examples
             trained_word_count += trained_words  # only words in vocab & sampled
             raw_word_count += raw_words
+            if len(report) > 3:
+                finished_jobs[report[3]] = (examples, raw_words)
+                while next_job_no in finished_jobs:
+                    job_examples, job_words = finished_jobs.pop(next_job_no)
+                    done_examples += job_examples
+                    done_words += job_words
+                    next_job_no += 1
+                self.epoch_progress = (cur_epoch, done_examples, done_words)
 
             # log progress once every report_delay seconds
             elapsed = default_timer() - start
             if elapsed >= next_report:
+                if job_queue is not None:
+                    self.training_metrics.queue_depth.append((elapsed, job_queue.qsize()))
                 self._log_progress(
-                    job_queue, progress_queue, cur_epoch, example_count, total_examples,
-                    raw_word_count, total_words, trained_word_count, elapsed)
+                    job_queue, progress_queue, cur_epoch, skip_examples + example_count, total_examples,
+                    skip_words + raw_word_count, total_words, trained_word_count, elapsed)
                 next_report = elapsed + report_delay
         # all done; report the final stats
         elapsed = default_timer() - start
+        self.training_metrics.elapsed = elapsed
         self._log_epoch_end(
-            cur_epoch, example_count, total_examples, raw_word_count, total_words,
+            cur_epoch, skip_examples + example_count, total_examples, skip_words + raw_word_count, total_words,
             trained_word_count, elapsed, is_corpus_file_mode)
         self.total_train_time += elapsed
         return trained_word_count, raw_word_count, job_tally
@@ -1298,8 +1473,9 @@ class Word2Vec(utils.SaveLoad):
 
         Parameters
         ----------
-        corpus_file : str
-            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        corpus_file : {str, :class:`~gensim.models.word2vec.WordIdCorpus`}
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a corpus converted
+            to word ids.
         cur_epoch : int, optional
             The current training epoch, needed to compute the training parameters for each job.
             For example in many implementations the learning rate would be dropping with the number of epochs.
@@ -1330,7 +1506,14 @@ class Word2Vec(utils.SaveLoad):
 
         progress_queue = Queue()
 
-        corpus_file_size = os.path.getsize(corpus_file)
+        if isinstance(corpus_file, WordIdCorpus):
+            # every thread reads its own range of rows
+            thread_inputs = [(stream, 0) for stream in corpus_file._streams(self.workers)]
+        else:
+            corpus_file_size = os.path.getsize(corpus_file)
+            thread_inputs = [
+                (corpus_file, corpus_file_size / self.workers * thread_id) for thread_id in range(self.workers)
+            ]
 
         thread_kwargs = copy.copy(kwargs)
         thread_kwargs['cur_epoch'] = cur_epoch
@@ -1339,11 +1522,9 @@ class Word2Vec(utils.SaveLoad):
         workers = [
             threading.Thread(
                 target=self._worker_loop_corpusfile,
-                args=(
-                    corpus_file, thread_id, corpus_file_size / self.workers * thread_id, cython_vocab, progress_queue
-                ),
+                args=(thread_input, thread_id, offset, cython_vocab, progress_queue),
                 kwargs=thread_kwargs
-            ) for thread_id in range(self.workers)
+            ) for thread_id, (thread_input, offset) in enumerate(thread_inputs)
         ]
 
         for thread in workers:
@@ -1358,7 +1539,7 @@ class Word2Vec(utils.SaveLoad):
 
     def _train_epoch(
             self, data_iterable, cur_epoch=0, total_examples=None, total_words=None,
-            queue_factor=2, report_delay=1.0, callbacks=(),
+            queue_factor=2, report_delay=1.0, callbacks=(), skip_examples=0, skip_words=0,
         ):
         """Train the model for a single epoch.
 
@@ -1379,6 +1560,10 @@ class Word2Vec(utils.SaveLoad):
             Multiplier for size of queue -> size = number of workers * queue_factor.
         report_delay : float, optional
             Number of seconds between two consecutive progress report messages in the logger.
+        skip_examples : int, optional
+            Number of objects at the start of `data_iterable` already trained in this epoch, to skip.
+        skip_words : int, optional
+            Count of raw words in the skipped objects.
 
         Returns
         -------
@@ -1403,7 +1588,10 @@ class Word2Vec(utils.SaveLoad):
         workers.append(threading.Thread(
             target=self._job_producer,
             args=(data_iterable, job_queue),
-            kwargs={'cur_epoch': cur_epoch, 'total_examples': total_examples, 'total_words': total_words}))
+            kwargs={
+                'cur_epoch': cur_epoch, 'total_examples': total_examples, 'total_words': total_words,
+                'skip_examples': skip_examples, 'skip_words': skip_words,
+            }))
 
         for thread in workers:
             thread.daemon = True  # make interrupting the process with ctrl+c easier
@@ -1411,7 +1599,7 @@ class Word2Vec(utils.SaveLoad):
 
         trained_word_count, raw_word_count, job_tally = self._log_epoch_progress(
             progress_queue, job_queue, cur_epoch=cur_epoch, total_examples=total_examples, total_words=total_words,
-            report_delay=report_delay, is_corpus_file_mode=False)
+            report_delay=report_delay, is_corpus_file_mode=False, skip_examples=skip_examples, skip_words=skip_words)
 
         return trained_word_count, raw_word_count, job_tally
 
@@ -1879,7 +2067,7 @@ class Word2Vec(utils.SaveLoad):
     def _save_specials(self, fname, separately, sep_limit, ignore, pickle_protocol, compress, subname):
         """Arrange any special handling for the `gensim.utils.SaveLoad` protocol."""
         # don't save properties that are merely calculated from others
-        ignore = set(ignore).union(['cum_table', ])
+        ignore = set(ignore).union(['cum_table', 'training_metrics', ])
         return super(Word2Vec, self)._save_specials(
             fname, separately, sep_limit, ignore, pickle_protocol, compress, subname)
 
@@ -1968,6 +2156,114 @@ class Word2Vec(utils.SaveLoad):
         return self.running_training_loss
 
 
+class TrainingMetrics(object):
+    def __init__(self, epoch):
+        """Timings of the training pipeline during one epoch, to find out what limits the training speed.
+
+        Word2Vec and its subclasses keep the metrics of the current epoch in their `training_metrics` attribute, so
+        that callbacks can read them during training, or export them with
+        :meth:`~gensim.models.word2vec.TrainingMetrics.as_dict` at the end of each epoch:
+
+        * Worker threads waiting for jobs (`get_wait`) are starved by the thread that reads the corpus.
+        * A reader waiting to put jobs into a full queue (`put_wait`) has workers too slow or too few to keep up.
+        * The job queue depth over time shows which of them is ahead.
+
+        Parameters
+        ----------
+        epoch : int
+            Number of the epoch.
+
+        """
+        self.epoch = epoch
+        self.start = default_timer()
+        self.elapsed = None  #: Duration of the epoch in seconds, set once it is finished.
+        self.workers = []  #: :class:`~gensim.models.word2vec.WorkerMetrics` of each worker thread.
+        self.producer_time = None  #: Seconds spent by the thread reading the corpus into jobs.
+        self.put_wait = 0.0  #: Seconds this thread spent blocked on a full job queue.
+        self.job_count = 0  #: Number of jobs queued.
+        self.job_words = 0  #: Raw word count of all queued jobs.
+        self.job_min = None  #: Raw word count of the smallest job.
+        self.job_max = 0  #: Raw word count of the largest job.
+        #: Number of jobs by size: item `i` counts the jobs of at least `2 ** (i - 1)` and less than `2 ** i` words.
+        self.job_histogram = []
+        #: (seconds since the start of the epoch, jobs waiting in the queue), sampled at each progress report.
+        self.queue_depth = []
+
+    def add_worker(self):
+        """Get a new :class:`~gensim.models.word2vec.WorkerMetrics`, for a worker thread to record its jobs."""
+        worker = WorkerMetrics()
+        self.workers.append(worker)  # atomic, the worker threads may call this at the same time
+        return worker
+
+    def add_job_size(self, words):
+        """Record the raw word count of a queued job."""
+        self.job_count += 1
+        self.job_words += words
+        self.job_min = words if self.job_min is None else min(self.job_min, words)
+        self.job_max = max(self.job_max, words)
+        bucket = int(words).bit_length()
+        if bucket >= len(self.job_histogram):
+            self.job_histogram.extend([0] * (bucket + 1 - len(self.job_histogram)))
+        self.job_histogram[bucket] += 1
+
+    def as_dict(self):
+        """Summarize the metrics.
+
+        Returns
+        -------
+        dict
+            The epoch, its duration, the number of jobs and words, the time spent by the reader thread and the time
+            it was blocked, statistics of the job sizes with their histogram as {upper bound: job count}, the queue
+            depth samples, and the totals of each worker thread as returned by
+            :meth:`~gensim.models.word2vec.WorkerMetrics.as_dict`.
+
+        """
+        elapsed = self.elapsed if self.elapsed is not None else default_timer() - self.start
+        workers = [worker.as_dict() for worker in self.workers]
+        raw_words = sum(worker['raw_words'] for worker in workers)
+        return {
+            'epoch': self.epoch,
+            'seconds': elapsed,
+            'jobs': sum(worker['jobs'] for worker in workers),
+            'raw_words': raw_words,
+            'words_per_sec': raw_words / elapsed if elapsed else 0.0,
+            'producer_seconds': self.producer_time,
+            'producer_put_wait': self.put_wait,
+            'job_words': {
+                'min': self.job_min, 'mean': self.job_words / self.job_count, 'max': self.job_max,
+                'histogram': {2 ** i: count for i, count in enumerate(self.job_histogram) if count},
+            } if self.job_count else {},
+            'queue_depth': list(self.queue_depth),
+            'workers': workers,
+        }
+
+
+class WorkerMetrics(object):
+    def __init__(self):
+        """Jobs done by one worker thread in an epoch, and the time it spent on them."""
+        self.jobs = 0
+        self.words = 0  #: Effective words trained, after dropping unknown and downsampled words.
+        self.raw_words = 0
+        self.train_time = 0.0  #: Seconds spent training on jobs.
+        self.get_wait = 0.0  #: Seconds spent blocked on an empty job queue.
+
+    def add_job(self, seconds, words, raw_words):
+        self.jobs += 1
+        self.words += words
+        self.raw_words += raw_words
+        self.train_time += seconds
+
+    def as_dict(self):
+        return {
+            'jobs': self.jobs,
+            'words': self.words,
+            'raw_words': self.raw_words,
+            'train_seconds': self.train_time,
+            'get_wait': self.get_wait,
+            'words_per_sec': self.raw_words / self.train_time if self.train_time else 0.0,
+        }
+
+
 class BrownCorpus(object):
     def __init__(self, dirname):
         """Iterate over sentences from the `Brown corpus <https://en.wikipedia.org/wiki/Brown_Corpus>`_
@@ -2125,6 +2421,248 @@ class PathLineSentences(object):
                         i += self.max_sentence_length
 
 
+class WordIdCorpus(object):
+    UNKNOWN_ID = 2 ** 32 - 1  #: Word id stored for words missing from the vocabulary.
+
+    def __init__(self, fname, mmap='r'):
+        """A corpus already converted to vocabulary indexes, for `corpus_file` training without any text parsing.
+
+        Words of all rows (sentences or documents) are stored back to back as uint32 ids in `fname + '.ids.npy'`,
+        and `fname + '.offsets.npy'` holds the int64 position where each row starts, plus the total length.
+        `fname + '.vocab_size.npy'` records the size of the vocabulary the ids refer to.
+        Convert a corpus once with :meth:`~gensim.models.word2vec.WordIdCorpus.serialize`, then pass this object as
+        `corpus_file` to `train()` of a :class:`~gensim.models.word2vec.Word2Vec`,
+        :class:`~gensim.models.fasttext.FastText` or :class:`~gensim.models.doc2vec.Doc2Vec` model with the same
+        vocabulary. Each worker thread trains on its own range of rows, with about the same number of words.
+
+        Parameters
+        ----------
+        fname : str
+            Path prefix the corpus was serialized to.
+        mmap : {'r', 'r+', 'c', None}, optional
+            Memory-map the arrays instead of loading them into RAM, see :func:`numpy.load`.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import datapath, get_tmpfile
+            >>> from gensim.models.word2vec import Word2Vec, WordIdCorpus
+            >>>
+            >>> corpus_file = datapath('lee_background.cor')
+            >>> model = Word2Vec(min_count=1)
+            >>> model.build_vocab(corpus_file=corpus_file)
+            >>> corpus = WordIdCorpus.serialize(get_tmpfile('lee_ids'), model.wv, corpus_file=corpus_file)
+            >>> result = model.train(corpus_file=corpus, total_words=corpus.num_words, epochs=model.epochs)
+
+        """
+        self.fname = fname
+        self.word_ids = np.load(fname + '.ids.npy', mmap_mode=mmap)
+        self.offsets = np.load(fname + '.offsets.npy', mmap_mode=mmap)
+        self.vocab_size = None  #: Size of the vocabulary the corpus was serialized with, if known.
+        if os.path.exists(fname + '.vocab_size.npy'):
+            self.vocab_size = int(np.load(fname + '.vocab_size.npy'))
+        self._max_id = None  # highest word id in the corpus, computed on first use
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_words(self):
+        """Total number of words in the corpus, including the out-of-vocabulary ones."""
+        return len(self.word_ids)
+
+    def __iter__(self):
+        """Iterate over the rows, as arrays of word ids."""
+        for start, end in zip(self.offsets[:-1], self.offsets[1:]):
+            yield self.word_ids[start:end]
+
+    @staticmethod
+    def serialize(fname, wv, corpus_iterable=None, corpus_file=None, progress_per=10000):
+        """Convert a corpus to the word ids of `wv` and save it under the `fname` path prefix.
+
+        Each sentence of `corpus_iterable`, or each line of `corpus_file`, becomes one row, so that Doc2Vec
+        documents keep the tags given by their line number. Long rows are not split.
+
+        Parameters
+        ----------
+        fname : str
+            Path prefix for the output files.
+        wv : :class:`~gensim.models.keyedvectors.KeyedVectors`
+            Vocabulary of the model the corpus will be trained with.
+        corpus_iterable : iterable of list of str, optional
+            Sentences to convert. Only one of `corpus_iterable` or `corpus_file` must be provided.
+        corpus_file : str, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        progress_per : int, optional
+            Log progress every `progress_per` rows.
+
+        Returns
+        -------
+        :class:`~gensim.models.word2vec.WordIdCorpus`
+            The converted corpus, memory-mapped.
+
+        """
+        if not (corpus_iterable is None) ^ (corpus_file is None):
+            raise ValueError("You must provide only one of corpus_iterable or corpus_file arguments.")
+        if corpus_file is not None:
+            with utils.open(corpus_file, 'rb') as fin:
+                return WordIdCorpus.serialize(
+                    fname, wv, corpus_iterable=(utils.to_unicode(line).split() for line in fin),
+                    progress_per=progress_per,
+                )
+
+        logger.info("converting corpus to word ids in %s.ids.npy", fname)
+        key_to_index = wv.key_to_index
+        offsets = [0]
+        with utils.open(fname + '.ids.npy', 'wb') as fout:
+            # the array length is only known at the end: reserve the header, fill it in once the ids are written
+            _write_npy_header(fout, 0)
+            for row_no, row in enumerate(corpus_iterable):
+                if row_no % progress_per == 0:
+                    logger.info("PROGRESS: at row #%i, processed %i words", row_no, offsets[-1])
+                ids = np.fromiter(
+                    (key_to_index.get(word, WordIdCorpus.UNKNOWN_ID) for word in row), dtype='<u4', count=len(row),
+                )
+                fout.write(ids.tobytes())
+                offsets.append(offsets[-1] + len(ids))
+            fout.seek(0)
+            _write_npy_header(fout, offsets[-1])
+        np.save(fname + '.offsets.npy', np.array(offsets, dtype=np.int64))
+        np.save(fname + '.vocab_size.npy', np.int64(len(wv)))
+        logger.info("converted %i rows with %i words", len(offsets) - 1, offsets[-1])
+        return WordIdCorpus(fname)
+
+    def check_vocab(self, wv):
+        """Check that the word ids of the corpus are valid for the vocabulary `wv`.
+
+        Training indexes the vocabulary with the ids without any bounds checks, so that a corpus serialized with
+        another vocabulary would otherwise corrupt memory or crash the process.
+
+        Parameters
+        ----------
+        wv : :class:`~gensim.models.keyedvectors.KeyedVectors`
+            Vocabulary of the model to train.
+
+        Raises
+        ------
+        ValueError
+            If the corpus was serialized with a vocabulary of a different size, or contains ids outside of `wv`.
+
+        """
+        if self.vocab_size is not None and self.vocab_size != len(wv):
+            raise ValueError(
+                "corpus %s was serialized with a vocabulary of %i words, but the model has %i words" % (
+                    self.fname, self.vocab_size, len(wv)))
+        if self._max_id is None:
+            max_id = -1
+            for start in range(0, len(self.word_ids), 2 ** 24):  # bound the size of the temporary arrays
+                ids = self.word_ids[start:start + 2 ** 24]
+                ids = ids[ids != self.UNKNOWN_ID]
+                if len(ids):
+                    max_id = max(max_id, int(ids.max()))
+            self._max_id = max_id
+        if self._max_id >= len(wv):
+            raise ValueError("corpus %s contains word id %i, but the model has only %i words" % (
+                self.fname, self._max_id, len(wv)))
+
+    def _streams(self, workers):
+        """Split the rows into `workers` ranges of about the same number of words, one stream for each."""
+        from gensim.models.word2vec_corpusfile import CythonWordIdStream
+
+        bounds = np.searchsorted(self.offsets, np.arange(workers + 1) * self.num_words // workers)
+        bounds[-1] = len(self)  # trailing empty rows
+        return [
+            CythonWordIdStream(self.word_ids, self.offsets, start, end)
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+
+def _write_npy_header(fout, length):
+    """Write the .npy header of a uint32 array of `length` items, always 128 bytes long whatever `length` is."""
+    header = {'descr': '<u4', 'fortran_order': False, 'shape': (length,)}
+    header = repr(header).encode('latin1').ljust(117) + b'\n'
+    fout.write(b'\x93NUMPY\x01\x00' + np.array(len(header), dtype='<u2').tobytes() + header)
+
+
+def _word_batches(sentences, batch_words):
+    """Group `sentences` into lists of sentences with at least `batch_words` words, except for the last one."""
+    batch, batch_size = [], 0
+    for sentence_no, sentence in enumerate(sentences):
+        if sentence_no == 0 and isinstance(sentence, str):
+            logger.warning(
+                "Each 'sentences' item should be a list of words (usually unicode strings). "
+                "First item here is instead plain %s.",
+                type(sentence),
+            )
+        batch.append(sentence)
+        batch_size += len(sentence)
+        if batch_size >= batch_words:
+            yield batch
+            batch, batch_size = [], 0
+    if batch:
+        yield batch
+
+
+def _count_words(sentences, max_vocab_size=None, trim_rule=None):
+    """Count the words of `sentences` in a worker process of :meth:`~gensim.models.word2vec.Word2Vec.scan_vocab`.
+
+    Parameters
+    ----------
+    sentences : iterable of list of str
+        The sentences to count.
+    max_vocab_size : int, optional
+        Prune the counts whenever they contain more words, like :meth:`~gensim.models.word2vec.Word2Vec._scan_vocab`.
+    trim_rule : function, optional
+        Vocabulary trimming rule used when pruning.
+
+    Returns
+    -------
+    (dict of (str, int), int, int)
+        The counts of the words, the number of words and the number of sentences.
+
+    """
+    vocab = defaultdict(int)
+    total_words, sentence_count = 0, 0
+    min_reduce = 1
+    for sentence in sentences:
+        for word in sentence:
+            vocab[word] += 1
+        total_words += len(sentence)
+        sentence_count += 1
+
+        if max_vocab_size and len(vocab) > max_vocab_size:
+            utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+            min_reduce += 1
+    return vocab, total_words, sentence_count
+
+
+def _count_corpus_file_words(corpus_file, start, end, max_vocab_size=None, trim_rule=None):
+    """Count the words of the lines of `corpus_file` that start within the bytes `start:end`, see
+    :func:`~gensim.models.word2vec._count_words`.
+
+    The lines are split into sentences exactly like :class:`~gensim.models.word2vec.LineSentence` does.
+
+    """
+    def sentences():
+        with open(corpus_file, 'rb') as fin:
+            if start > 0:
+                # skip the rest of the line that started before `start`, it belongs to the previous range
+                fin.seek(start - 1)
+                fin.readline()
+            while fin.tell() < end:
+                line = fin.readline()
+                if not line:
+                    break
+                line = utils.to_unicode(line).split()
+                i = 0
+                while i < len(line):
+                    yield line[i: i + MAX_WORDS_IN_BATCH]
+                    i += MAX_WORDS_IN_BATCH
+
+    return _count_words(sentences(), max_vocab_size=max_vocab_size, trim_rule=trim_rule)
+
+
 class Word2VecVocab(utils.SaveLoad):
     """Obsolete class retained for now as load-compatibility state capture."""
     pass
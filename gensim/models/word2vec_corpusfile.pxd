@@ -60,8 +60,24 @@ ctypedef unordered_map[string, VocabItem] cvocab_t
 
 cdef class CythonVocab:
     cdef cvocab_t vocab
+    cdef vector[VocabItem] items
     cdef subword_arrays
     cdef cvocab_t* get_vocab_ptr(self) nogil except *
+    cdef VocabItem* get_items_ptr(self) nogil
+
+
+cdef class CythonWordIdStream:
+    cdef public object word_ids, offsets
+    cdef np.uint32_t *word_ids_ptr
+    cdef np.int64_t *offsets_ptr
+    cdef public long long start_row, end_row, row, pos
+    cdef public size_t max_sentence_length
+
+    cdef bool_t is_eof(self) nogil
+    cdef void reset(self) nogil
+    cdef long long next_sentence_length(self) nogil
+    cdef np.uint32_t* read_sentence(self, long long *length) nogil
+    cdef np.uint32_t* read_document(self, long long *length) nogil
 
 
 cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil
@@ -34,6 +34,7 @@ from gensim.models.word2vec_inner cimport (
 )
 
 DEF MAX_SENTENCE_LEN = 10000
+cdef np.uint32_t UNKNOWN_WORD_ID = 0xFFFFFFFF  # out-of-vocabulary marker in a WordIdCorpus
 
 
 @cython.final
@@ -42,6 +43,7 @@ cdef class CythonVocab:
         cdef VocabItem word
 
         vocab_sample_ints = wv.expandos['sample_int']
+        self.items.resize(len(wv.key_to_index))
         if hs:
             vocab_codes = wv.expandos['code']
             vocab_points = wv.expandos['point']
@@ -61,10 +63,70 @@ cdef class CythonVocab:
                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])
 
             self.vocab[token] = word
+            self.items[word.index] = word
 
     cdef cvocab_t* get_vocab_ptr(self) nogil except *:
         return &self.vocab
 
+    cdef VocabItem* get_items_ptr(self) nogil:
+        return self.items.data()
+
+
+@cython.final
+cdef class CythonWordIdStream:
+    """Read rows `start_row` to `end_row` of a :class:`~gensim.models.word2vec.WordIdCorpus` without the GIL.
+
+    Rows longer than `max_sentence_length` are returned as several sentences, same as with
+    :class:`~gensim.models.word2vec_corpusfile.CythonLineSentence`.
+
+    """
+    def __init__(self, word_ids, offsets, start_row, end_row, max_sentence_length=MAX_SENTENCE_LEN):
+        # keep references to the (possibly memory-mapped) arrays, so the pointers below stay valid
+        self.word_ids = np.ascontiguousarray(word_ids, dtype=np.uint32)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.word_ids_ptr = <np.uint32_t *>np.PyArray_DATA(self.word_ids)
+        self.offsets_ptr = <np.int64_t *>np.PyArray_DATA(self.offsets)
+        self.start_row = start_row
+        self.end_row = end_row
+        self.max_sentence_length = max_sentence_length
+        self.reset()
+
+    cdef bool_t is_eof(self) nogil:
+        return self.row >= self.end_row
+
+    cdef void reset(self) nogil:
+        self.row = self.start_row
+        self.pos = self.offsets_ptr[self.start_row]
+
+    cdef long long next_sentence_length(self) nogil:
+        return min(self.offsets_ptr[self.row + 1] - self.pos, <long long>self.max_sentence_length)
+
+    cdef np.uint32_t* read_sentence(self, long long *length) nogil:
+        cdef np.uint32_t *sentence = self.word_ids_ptr + self.pos
+
+        length[0] = self.next_sentence_length()
+        self.pos += length[0]
+        if self.pos == self.offsets_ptr[self.row + 1]:
+            self.row += 1
+        return sentence
+
+    cdef np.uint32_t* read_document(self, long long *length) nogil:
+        cdef np.uint32_t *document = self.word_ids_ptr + self.pos
+
+        length[0] = self.offsets_ptr[self.row + 1] - self.pos
+        self.row += 1
+        self.pos = self.offsets_ptr[self.row]
+        return document
+
+    def __iter__(self):
+        cdef long long length
+
+        self.reset()
+        while not self.is_eof():
+            sentence = self.read_sentence(&length)
+            if length:
+                yield [sentence[i] for i in range(length)]
+
 
 def rebuild_cython_line_sentence(source, max_sentence_length):
     return CythonLineSentence(source, max_sentence_length=max_sentence_length)
@@ -229,6 +291,56 @@ cdef void prepare_c_structures_for_batch(
         reduced_windows[i] = random_int32(next_random) % window
 
 
+cdef long long prepare_c_structures_for_id_batch(
+        CythonWordIdStream stream, int sample, int hs, int window, long long *total_words,
+        int *effective_words, int *effective_sentences, unsigned long long *next_random,
+        VocabItem *items, int *sentence_idx, np.uint32_t *indexes, int *codelens,
+        np.uint8_t **codes, np.uint32_t **points, np.uint32_t *reduced_windows) nogil:
+    """Same as `prepare_c_structures_for_batch`, but read up to MAX_SENTENCE_LEN word ids from `stream`.
+
+    Returns the number of sentences read.
+
+    """
+    cdef VocabItem *word
+    cdef np.uint32_t *sent
+    cdef long long sent_len, batch_words = 0, num_sentences = 0
+
+    sentence_idx[0] = 0  # indices of the first sentence always start at 0
+    while not stream.is_eof():
+        if batch_words and batch_words + stream.next_sentence_length() > MAX_SENTENCE_LEN:
+            break
+        sent = stream.read_sentence(&sent_len)
+        num_sentences += 1
+        if sent_len == 0:
+            continue  # ignore empty sentences; leave effective_sentences unchanged
+        batch_words += sent_len
+        total_words[0] += sent_len
+
+        for i in range(sent_len):
+            # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+            if sent[i] == UNKNOWN_WORD_ID:
+                continue
+
+            word = &items[sent[i]]
+            if sample and word.sample_int < random_int32(next_random):
+                continue
+            indexes[effective_words[0]] = word.index
+            if hs:
+                codelens[effective_words[0]] = word.code_len
+                codes[effective_words[0]] = word.code
+                points[effective_words[0]] = word.point
+            effective_words[0] += 1
+
+        effective_sentences[0] += 1
+        sentence_idx[effective_sentences[0]] = effective_words[0]
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i in range(effective_words[0]):
+        reduced_windows[i] = random_int32(next_random) % window
+
+    return num_sentences
+
+
 cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil:
     return alpha - ((alpha - end_alpha) * (<REAL_t> cur_epoch) / num_epochs)
 
@@ -260,8 +372,8 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     ----------
     model : :class:`~gensim.models.word2vec.Word2Vec`
         The Word2Vec model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -288,8 +400,11 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
+    cdef long long num_sentences
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
@@ -302,17 +417,29 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
+            if from_ids:
+                num_sentences = prepare_c_structures_for_id_batch(
+                    id_stream, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_items_ptr(), c.sentence_idx, c.indexes,
+                    c.codelens, c.codes, c.points, c.reduced_windows)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
 
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
-                c.codelens, c.codes, c.points, c.reduced_windows)
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
+                    c.codelens, c.codes, c.points, c.reduced_windows)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -339,7 +466,7 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
                                 c.words_lockf, c.words_lockf_len,
                                 c.compute_loss, &c.running_training_loss)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(
@@ -360,8 +487,8 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     ----------
     model : :class:`~gensim.models.word2vec.Word2Vec`
         The Word2Vec model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec_corpusfile.CythonWordIdStream`}
+        Path to corpus file, or a stream over this worker's part of a :class:`~gensim.models.word2vec.WordIdCorpus`.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -388,8 +515,11 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef bint from_ids = isinstance(corpus_file, CythonWordIdStream)
+    cdef CythonWordIdStream id_stream = corpus_file if from_ids else None
+    cdef CythonLineSentence input_stream = None if from_ids else CythonLineSentence(corpus_file, offset)
     cdef CythonVocab vocab = _cython_vocab
+    cdef long long num_sentences
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
@@ -402,17 +532,29 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if from_ids:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        # a word id stream ends exactly at its last row, a line stream reads on into the next worker's part
+        while not (id_stream.is_eof() if from_ids else
+                   input_stream.is_eof() or total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
+            if from_ids:
+                num_sentences = prepare_c_structures_for_id_batch(
+                    id_stream, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_items_ptr(), c.sentence_idx, c.indexes,
+                    c.codelens, c.codes, c.points, c.reduced_windows)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
 
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &effective_sentences, &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx,
-                c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &effective_sentences, &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx,
+                    c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -437,7 +579,7 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
                             c.next_random, c.words_lockf, c.words_lockf_len, c.compute_loss,
                             &c.running_training_loss)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(
@@ -72,9 +72,13 @@ import logging
 import itertools
 import os
 import heapq
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy
 import scipy.sparse
+from scipy.spatial.distance import cdist
 
 from gensim import interfaces, utils, matutils
 from six.moves import map, range, zip
@@ -97,6 +101,9 @@ class Shard(utils.SaveLoad):
     Basically just wraps :class:`~gensim.similarities.docsim.MatrixSimilarity`,
     :class:`~gensim.similarities.docsim.SparseMatrixSimilarity`, etc, so that it mmaps from disk on request (query).
 
+    The wrapped index matrix is always stored in raw `.npy` files (`data`, `indptr` and `indices` for sparse
+    matrices), so that loading a shard only maps these files into memory, instead of unpickling and copying them.
+
     """
     def __init__(self, fname, index):
         """
@@ -113,7 +120,7 @@ class Shard(utils.SaveLoad):
         self.length = len(index)
         self.cls = index.__class__
         logger.info("saving index shard to %s", self.fullname())
-        index.save(self.fullname())
+        index.save(self.fullname(), separately=['index'])
         self.index = self.get_index()
 
     def fullname(self):
@@ -158,10 +165,16 @@ class Shard(utils.SaveLoad):
             Index instance.
 
         """
-        if not hasattr(self, 'index'):
+        index = getattr(self, 'index', None)
+        if index is None:
             logger.debug("mmaping index from %s", self.fullname())
-            self.index = self.cls.load(self.fullname(), mmap='r')
-        return self.index
+            index = self.index = self.cls.load(self.fullname(), mmap='r')
+        return index
+
+    def unload(self):
+        """Drop the loaded index (if any), to free its memory. It will be loaded again on the next request."""
+        if self.__dict__.pop('index', None) is not None:
+            logger.debug("unloaded index of %s", self)
 
     def get_document_id(self, pos):
         """Get index vector at position `pos`.
@@ -301,7 +314,10 @@ class Similarity(interfaces.SimilarityABC):
 
     """
 
-    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2'):
+    def __init__(
+            self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2',
+            workers=1, max_resident_shards=None,
+        ):
         """
 
         Parameters
@@ -322,6 +338,15 @@ class Similarity(interfaces.SimilarityABC):
             comfortably into your RAM.
         norm : {'l1', 'l2'}, optional
             Normalization to use.
+        workers : int, optional
+            Number of threads to query the shards with, concurrently. The threads are started on the first query
+            and reused by all subsequent queries, until :meth:`~gensim.similarities.docsim.Similarity.destroy`.
+            The heavy lifting in the shards is done by numpy/scipy, which releases the GIL,
+            so queries over many shards can use multiple cores.
+        max_resident_shards : int, optional
+            Maximum number of shards to keep loaded at once. When more shards are needed, the least recently used
+            ones are unloaded. Shards are memory-mapped, so this bounds the memory used by an index which doesn't
+            fit in RAM, at the cost of re-mapping shards on each query. If None, shards stay loaded once used.
 
         Notes
         -----
@@ -348,6 +373,12 @@ class Similarity(interfaces.SimilarityABC):
         self.norm = norm
         self.chunksize = int(chunksize)
         self.shardsize = shardsize
+        self.workers = int(workers)
+        self.executor = None  # thread pool for querying the shards, created on first use
+        self.executor_lock = threading.Lock()
+        self.max_resident_shards = max_resident_shards
+        self.resident_shards = OrderedDict()  # loaded shards, least recently used first
+        self.resident_lock = threading.Lock()
         self.shards = []
         self.fresh_docs, self.fresh_nnz = [], 0
 
@@ -363,6 +394,79 @@ class Similarity(interfaces.SimilarityABC):
             len(self), len(self.shards), self.output_prefix
         )
 
+    def __getstate__(self):
+        """Special handler for pickle.
+
+        Returns
+        -------
+        dict
+            Object that contains state of current instance without the thread pool `executor`.
+
+        """
+        result = self.__dict__.copy()
+        # threads can't be pickled; the pool will be recreated on the first query after loading
+        result['executor'] = None
+        # neither can locks; shards are pickled without their loaded index anyway
+        result['resident_shards'] = OrderedDict()
+        del result['resident_lock']
+        result.pop('executor_lock', None)
+        return result
+
+    def __setstate__(self, state):
+        """Special handler for unpickle, recreates the locks that guard the loaded shards and the thread pool.
+
+        Parameters
+        ----------
+        state : dict
+            Object state, as returned by :meth:`~gensim.similarities.docsim.Similarity.__getstate__`.
+
+        """
+        self.__dict__.update(state)
+        self.resident_shards = OrderedDict()
+        self.resident_lock = threading.Lock()
+        self.executor_lock = threading.Lock()
+
+    def touch_shard(self, shard):
+        """Mark `shard` as the most recently used, and unload the least recently used shards
+        over the `max_resident_shards` limit.
+
+        Parameters
+        ----------
+        shard : :class:`~gensim.similarities.docsim.Shard`
+            Shard that was just used.
+
+        """
+        if getattr(self, 'max_resident_shards', None) is None:
+            return
+        with self.resident_lock:
+            if not hasattr(shard, 'index'):
+                # already unloaded again by a concurrent query, nothing to track
+                self.resident_shards.pop(id(shard), None)
+                return
+            self.resident_shards[id(shard)] = shard
+            self.resident_shards.move_to_end(id(shard))
+            while len(self.resident_shards) > self.max_resident_shards:
+                _, lru_shard = self.resident_shards.popitem(last=False)
+                lru_shard.unload()
+
+    def query_shard(self, args):
+        """Same as the module-level :func:`~gensim.similarities.docsim.query_shard`, plus LRU bookkeeping.
+
+        Parameters
+        ---------
+        args : (list of (int, number), :class:`~gensim.interfaces.SimilarityABC`)
+            Query and Shard instances
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or :class:`scipy.sparse.csr_matrix`
+            Similarities of the query against documents indexed in this shard.
+
+        """
+        result = query_shard(args)
+        self.touch_shard(args[1])
+        return result
+
     def add_documents(self, corpus):
         """Extend the index with new documents.
 
@@ -460,6 +564,7 @@ class Similarity(interfaces.SimilarityABC):
         shard.num_best = self.num_best
         shard.num_nnz = self.fresh_nnz
         self.shards.append(shard)
+        self.touch_shard(shard)
         self.fresh_docs, self.fresh_nnz = [], 0
 
     def reopen_shard(self):
@@ -474,6 +579,8 @@ class Similarity(interfaces.SimilarityABC):
         self.fresh_docs = list(last_index.index)
         self.fresh_nnz = last_shard.num_nnz
         del self.shards[-1]  # remove the shard from index, *but its file on disk is not deleted*
+        if getattr(self, 'resident_shards', None):
+            self.resident_shards.pop(id(last_shard), None)
         logger.debug("reopen complete")
 
     def query_shards(self, query):
@@ -489,16 +596,33 @@ class Similarity(interfaces.SimilarityABC):
         (None, list of individual shard query results)
             Query results.
 
+        Notes
+        -----
+        If the index was created with `workers > 1`, all shards are queried concurrently in a pool of threads.
+        (Alternatively, setting the module-level `PARALLEL_SHARDS` to the number of processes queries the shards in
+        a new pool of processes each time, which is only worth it for very costly queries.)
+
         """
         args = zip([query] * len(self.shards), self.shards)
+        workers = getattr(self, 'workers', 1)  # `workers` missing in indexes saved by older versions
         if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
             logger.debug("spawning %i query processes", PARALLEL_SHARDS)
             pool = multiprocessing.Pool(PARALLEL_SHARDS)
             result = pool.imap(query_shard, args, chunksize=1 + len(self.shards) / PARALLEL_SHARDS)
+        elif workers > 1 and len(self.shards) > 1:
+            # query all shards concurrently, in the persistent thread pool
+            with self.executor_lock:
+                # concurrent queries must not each start a pool, the extra ones would never be shut down
+                if getattr(self, 'executor', None) is None:
+                    logger.debug("starting %i query threads", workers)
+                    self.executor = ThreadPoolExecutor(max_workers=workers)
+                executor = self.executor
+            pool = None
+            result = executor.map(self.query_shard, args)
         else:
             # serial processing, one shard after another
             pool = None
-            result = map(query_shard, args)
+            result = map(self.query_shard, args)
         return pool, result
 
     def __getitem__(self, query):
@@ -616,6 +740,7 @@ class Similarity(interfaces.SimilarityABC):
         if not self.shards or docpos < 0 or docpos >= pos:
             raise ValueError("invalid document position: %s (must be 0 <= x < %s)" % (docpos, len(self)))
         result = shard.get_document_id(docpos - pos + len(shard))
+        self.touch_shard(shard)
         return result
 
     def similarity_by_id(self, docpos):
@@ -695,6 +820,7 @@ class Similarity(interfaces.SimilarityABC):
 
         for shard in self.shards:
             query = shard.get_index().index
+            self.touch_shard(shard)
             for chunk_start in range(0, query.shape[0], chunksize):
                 # scipy.sparse doesn't allow slicing beyond real size of the matrix
                 # (unlike numpy). so, clip the end of the chunk explicitly to make
@@ -752,6 +878,10 @@ class Similarity(interfaces.SimilarityABC):
     def destroy(self):
         """Delete all files under self.output_prefix Index is not usable anymore after calling this method."""
         import glob
+        with self.executor_lock:
+            if getattr(self, 'executor', None) is not None:
+                self.executor.shutdown()
+                self.executor = None
         for fname in glob.glob(self.output_prefix + '*'):
             logger.info("deleting %s", fname)
             os.remove(fname)
@@ -1014,8 +1144,16 @@ class WmdSimilarity(interfaces.SimilarityABC):
         >>> query = ['trees']
         >>> sims = index[query]
 
+    Searching a larger corpus for only the `num_best` most similar documents can skip most of the exact
+    (and expensive) WMD computations, using the "prefetch and prune" approach of Kusner et al.:
+
+    .. sourcecode:: pycon
+
+        >>> index = WmdSimilarity(common_texts, model, num_best=3, prune=True)
+        >>> sims = index[query]  # same results as with prune=False, but faster
+
     """
-    def __init__(self, corpus, kv_model, num_best=None, chunksize=256):
+    def __init__(self, corpus, kv_model, num_best=None, chunksize=256, prune=False):
         """
 
         Parameters
@@ -1028,12 +1166,19 @@ class WmdSimilarity(interfaces.SimilarityABC):
             Number of results to retrieve.
         chunksize : int, optional
             Size of chunk.
+        prune : bool, optional
+            If True and `num_best` is set, first compute the cheap word centroid distance (WCD) and relaxed WMD
+            (RWMD) lower bounds of all documents, and compute the exact WMD only for documents whose lower bound
+            can still get them into the `num_best` most similar ones. The `num_best` results are the same as
+            without pruning; similarities of the pruned documents are reported as 0.0.
 
         """
         self.corpus = corpus
         self.wv = kv_model
         self.num_best = num_best
         self.chunksize = chunksize
+        self.prune = prune
+        self.bounds_index = None  # lazily initialized by init_bounds_index()
 
         # Normalization of features is not possible, as corpus is a list (of lists) of strings.
         self.normalize = False
@@ -1074,8 +1219,10 @@ class WmdSimilarity(interfaces.SimilarityABC):
         result = []
         for qidx in range(n_queries):
             # Compute similarity for each query.
-            qresult = [self.wv.wmdistance(document, query[qidx]) for document in self.corpus]
-            qresult = numpy.array(qresult)
+            if self.prune and self.num_best:
+                qresult = self.pruned_wmdistances(query[qidx], self.num_best)
+            else:
+                qresult = self.wv.wmdistance_many(query[qidx], self.corpus)
             qresult = 1. / (1. + qresult)  # Similarity is the negative of the distance.
 
             # Append single query result to list of all results.
@@ -1089,6 +1236,134 @@ class WmdSimilarity(interfaces.SimilarityABC):
 
         return result
 
+    def init_bounds_index(self):
+        """Precompute the corpus data needed for the WMD lower bounds: the nBOW weights of all documents,
+        as a sparse documents x words matrix, the unit-normed vectors of all corpus words, and the
+        word centroid of each document.
+
+        Called automatically on the first pruned query, see the `prune` parameter of the constructor.
+
+        """
+        logger.info("computing word centroids and nBOW weights of %i documents", len(self.corpus))
+        vocab, indices, data, indptr = {}, [], [], [0]
+        for document in self.corpus:
+            counts = {}
+            for token in document:
+                if token in self.wv:
+                    counts[token] = counts.get(token, 0) + 1
+            doc_len = sum(counts.values())
+            for token, count in counts.items():
+                indices.append(vocab.setdefault(token, len(vocab)))
+                data.append(count / doc_len)
+            indptr.append(len(indices))
+
+        weights = scipy.sparse.csr_matrix(
+            (numpy.array(data, dtype=numpy.float64), numpy.array(indices, dtype=numpy.int64), indptr),
+            shape=(len(indptr) - 1, len(vocab)),
+        )
+        vectors = numpy.zeros((len(vocab), self.wv.vector_size), dtype=numpy.float64)
+        for token, token_id in vocab.items():
+            vectors[token_id] = self.wv.get_vector(token, norm=True)
+        centroids = weights.dot(vectors)
+        self.bounds_index = weights, vectors, centroids
+
+    def lower_bounds(self, query):
+        """Compute lower bounds of the WMD between `query` and all documents in the corpus.
+
+        Parameters
+        ----------
+        query : list of str
+            Input document.
+
+        Returns
+        -------
+        (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+            Word centroid distances (WCD) and the (tighter) relaxed WMD (RWMD) lower bounds, one per corpus document.
+            Both are `inf` for documents with no words in the vocabulary.
+
+        """
+        if self.bounds_index is None:
+            self.init_bounds_index()
+        weights, vectors, centroids = self.bounds_index
+        num_docs = weights.shape[0]
+        _, query_vectors, query_weights, _ = self.wv._wmd_nbow(query)
+        if not len(query_weights) or not len(vectors):
+            return numpy.full(num_docs, numpy.inf), numpy.full(num_docs, numpy.inf)
+
+        # Euclidean distances between each query word and each corpus word, query_words x corpus_words.
+        distances = cdist(query_vectors, vectors)
+
+        wcd = numpy.linalg.norm(centroids - query_weights.dot(query_vectors), axis=1)
+
+        # RWMD, relaxed in one direction: all weight of each document word flows to its nearest query word.
+        rwmd_doc = weights.dot(distances.min(axis=0))
+
+        # RWMD, relaxed in the other direction: all weight of each query word flows to its nearest document word.
+        # Document by document minimum over columns of `distances`, in chunks of documents to bound memory use.
+        rwmd_query = numpy.zeros(num_docs)
+        indptr, indices = weights.indptr, weights.indices
+        for chunk_start in range(0, num_docs, self.chunksize):
+            chunk_end = min(num_docs, chunk_start + self.chunksize)
+            docs = numpy.arange(chunk_start, chunk_end)
+            docs = docs[indptr[docs] < indptr[docs + 1]]  # skip empty documents, which reduceat can't handle
+            if not len(docs):
+                continue
+            start, end = indptr[chunk_start], indptr[chunk_end]
+            nearest = numpy.minimum.reduceat(distances[:, indices[start:end]], indptr[docs] - start, axis=1)
+            rwmd_query[docs] = query_weights.dot(nearest)
+
+        rwmd = numpy.maximum(rwmd_doc, rwmd_query)
+        empty = indptr[1:] == indptr[:-1]
+        wcd[empty] = rwmd[empty] = numpy.inf
+        return wcd, rwmd
+
+    def pruned_wmdistances(self, query, topn):
+        """Compute the WMD between `query` and corpus documents, skipping documents that can't be among the
+        `topn` nearest ones.
+
+        Documents are visited in the order of increasing word centroid distance, and the exact WMD is computed
+        only for documents whose relaxed WMD lower bound is smaller than the `topn`-th best exact distance so far.
+
+        Parameters
+        ----------
+        query : list of str
+            Input document.
+        topn : int
+            Number of nearest documents that must get their exact distance computed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Distances between `query` and all corpus documents, `inf` for the pruned documents.
+
+        """
+        wcd, rwmd = self.lower_bounds(query)
+        result = numpy.full(len(wcd), numpy.inf)
+        order = numpy.argsort(wcd, kind='mergesort')
+        order = order[numpy.isfinite(wcd[order])]
+
+        nearest = []  # heap of the `topn` smallest exact distances, as negative values
+        num_exact = 0
+        for block_start in range(0, len(order), topn):
+            block = order[block_start: block_start + topn]
+            if len(nearest) == topn:
+                threshold = -nearest[0]
+                if wcd[block[0]] >= threshold:
+                    break  # WCD is a lower bound and the order is by WCD: no remaining document can get closer
+                block = block[rwmd[block] < threshold]
+                if not len(block):
+                    continue
+            distances = self.wv.wmdistance_many(query, [self.corpus[docno] for docno in block])
+            result[block] = distances
+            num_exact += len(block)
+            for distance in distances:
+                if len(nearest) < topn:
+                    heapq.heappush(nearest, -distance)
+                elif distance < -nearest[0]:
+                    heapq.heapreplace(nearest, -distance)
+        logger.debug("computed exact WMD for %i out of %i documents", num_exact, len(result))
+        return result
+
     def __str__(self):
         return "%s<%i docs, %i features>" % (self.__class__.__name__, len(self), self.w2v_model.wv.syn0.shape[1])
 
@@ -1200,6 +1475,35 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
         :class:`scipy.sparse.csc`
             otherwise
 
+        """
+        is_corpus, query = self._query2csc(query)
+
+        # compute cosine similarity against every other document in the collection
+        result = self.index * query  # N x T * T x C = N x C
+        if result.shape[1] == 1 and not is_corpus:
+            # for queries of one document, return a 1d array
+            result = result.toarray().flatten()
+        elif self.maintain_sparsity:
+            # avoid converting to dense array if maintaining sparsity
+            result = result.T
+        else:
+            # otherwise, return a 2d matrix (#queries x #index)
+            result = result.toarray().T
+        return result
+
+    def _query2csc(self, query):
+        """Convert `query` into a sparse matrix with one query document per column.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), :class:`scipy.sparse.csr_matrix`}
+            Document or collection of documents.
+
+        Return
+        ------
+        (bool, :class:`scipy.sparse.csc_matrix`)
+            Whether `query` was a corpus, and the query matrix of shape (#features, #queries).
+
         """
         is_corpus, query = utils.is_corpus(query)
         if is_corpus:
@@ -1214,16 +1518,52 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
             else:
                 # default case: query is a single vector, in sparse gensim format
                 query = matutils.corpus2csc([query], self.index.shape[1], dtype=self.index.dtype)
+        return is_corpus, query.tocsc()
 
-        # compute cosine similarity against every other document in the collection
-        result = self.index * query.tocsc()  # N x T * T x C = N x C
-        if result.shape[1] == 1 and not is_corpus:
-            # for queries of one document, return a 1d array
-            result = result.toarray().flatten()
-        elif self.maintain_sparsity:
-            # avoid converting to dense array if maintaining sparsity
-            result = result.T
-        else:
-            # otherwise, return a 2d matrix (#queries x #index)
-            result = result.toarray().T
+    def __getitem__(self, query):
+        """Get similarities of the given document or corpus against this index.
+
+        Same as :meth:`gensim.interfaces.SimilarityABC.__getitem__`, except when only the `num_best` most
+        similar documents are requested (and `maintain_sparsity` is off). In that case, the top `num_best`
+        documents are picked directly from the sparse products of the index with chunks of `chunksize` queries,
+        without ever creating a dense vector of similarities to all documents in the index.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), :class:`scipy.sparse.csr_matrix`}
+            Document in the sparse Gensim bag-of-words format, or a streamed corpus of such documents.
+
+        Returns
+        -------
+        {:class:`numpy.ndarray`, list of (int, float), list of list of (int, float)}
+            Similarities of the given document or corpus against this index.
+
+        """
+        if self.num_best is None or self.maintain_sparsity:
+            return super(SparseMatrixSimilarity, self).__getitem__(query)
+
+        is_corpus, query = utils.is_corpus(query)
+        if self.normalize and not matutils.ismatrix(query):
+            if is_corpus:
+                query = [matutils.unitvec(v) for v in query]
+            else:
+                query = matutils.unitvec(query)
+        is_corpus, query = self._query2csc(query)
+
+        result = []
+        chunksize = max(1, self.chunksize or 1)
+        for chunk_start in range(0, query.shape[1], chunksize):
+            chunk_end = min(query.shape[1], chunk_start + chunksize)
+            sims = (self.index * query[:, chunk_start:chunk_end]).tocsc()  # N x T * T x C = N x C, still sparse
+            sims.sort_indices()
+            for col in range(sims.shape[1]):
+                start, end = sims.indptr[col], sims.indptr[col + 1]
+                doc_ids, values = sims.indices[start:end], sims.data[start:end].astype(float)
+                nonzero = numpy.nonzero(abs(values) > 1e-9)[0]
+                biggest = nonzero.take(matutils.argsort(abs(values).take(nonzero), self.num_best, reverse=True))
+                result.append(list(zip(doc_ids.take(biggest), values.take(biggest))))
+
+        if query.shape[1] == 1 and not is_corpus:
+            # for queries of one document, return the top-n of that single document
+            return result[0]
         return result
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Unit tests for the `corpora.CompactDictionary` class.
+"""
+
+
+import logging
+import unittest
+
+import numpy as np
+
+from gensim.corpora import Dictionary, CompactDictionary
+from gensim.corpora.compactdictionary import hash_tokens
+from gensim.test.utils import get_tmpfile, common_texts
+
+
+class TestCompactDictionary(unittest.TestCase):
+    def setUp(self):
+        self.texts = common_texts + [["máma", "mele", "maso", "máma"], ["a" * 20, ""]]
+        self.dictionary = Dictionary(self.texts)
+
+    def assertSameDictionary(self, dictionary, compact):
+        self.assertEqual(len(dictionary), len(compact))
+        self.assertEqual(dict(dictionary.items()), dict(compact.items()))
+        for tokenid in dictionary.keys():
+            self.assertEqual(dictionary.dfs[tokenid], compact.dfs[tokenid])
+            self.assertEqual(dictionary.cfs[tokenid], compact.cfs[tokenid])
+        self.assertEqual(
+            (dictionary.num_docs, dictionary.num_pos, dictionary.num_nnz),
+            (compact.num_docs, compact.num_pos, compact.num_nnz)
+        )
+
+    def testMapping(self):
+        compact = CompactDictionary(self.dictionary)
+        self.assertSameDictionary(self.dictionary, compact)
+        self.assertEqual(list(compact), self.dictionary.keys())
+        self.assertRaises(KeyError, compact.__getitem__, len(compact))
+        self.assertSameDictionary(self.dictionary, compact.to_dictionary())
+
+    def testDoc2bowAndDoc2idx(self):
+        compact = CompactDictionary(self.dictionary)
+        documents = self.texts + [["máma", b"m\xc3\xa1ma", "non_existent", "human"], []]
+        for document in documents:
+            self.assertEqual(self.dictionary.doc2bow(document), compact.doc2bow(document))
+            self.assertEqual(self.dictionary.doc2idx(document), compact.doc2idx(document))
+        self.assertEqual(compact.doc2idx(["non_existent", "human"], unknown_word_index=99), [99, 1])
+        self.assertRaises(TypeError, compact.doc2bow, "human")
+
+    def testDocs2bowAndDocs2idx(self):
+        compact = CompactDictionary(self.dictionary)
+        documents = self.texts + [[], ["máma", b"m\xc3\xa1ma", "non_existent", "human"]]
+        bow = compact.docs2bow(iter(documents))
+        self.assertEqual((bow != self.dictionary.docs2bow(documents)).nnz, 0)
+        ids, indptr = compact.docs2idx(iter(documents))
+        expected_ids, expected_indptr = self.dictionary.docs2idx(documents)
+        self.assertEqual(ids.tolist(), expected_ids.tolist())
+        self.assertEqual(indptr.tolist(), expected_indptr.tolist())
+
+    def testHashCollisions(self):
+        compact = CompactDictionary(self.dictionary)
+        # simulate a collision of all hashes, lookups must then go through the fallback dict
+        compact.hashes = np.zeros(0, dtype=np.uint64)
+        compact.hash_ids = np.zeros(0, dtype=np.int64)
+        compact.collisions = {token: tokenid for tokenid, token in self.dictionary.items()}
+        for document in self.texts:
+            self.assertEqual(self.dictionary.doc2bow(document), compact.doc2bow(document))
+
+    def testUnseenTokensWithSameHash(self):
+        compact = CompactDictionary(self.dictionary)
+        human = self.dictionary.token2id['human']
+        # numpy strips trailing zero bytes, which must not make "human\0" an alias of "human"
+        self.assertEqual(compact.doc2bow(["human\x00", "human"]), [(human, 1)])
+        self.assertEqual(compact.doc2idx(["human\x00"]), self.dictionary.doc2idx(["human\x00"]))
+        # a hash match alone is not enough, the token itself must match too
+        compact.hashes = hash_tokens([b"unseen"])
+        compact.hash_ids = np.array([human], dtype=np.int64)
+        self.assertEqual(compact.doc2idx(["unseen"]), [-1])
+        self.assertEqual(compact.docs2bow([["unseen"]]).nnz, 0)
+
+    def testHashTokens(self):
+        tokens = [b"", b"\x00", b"a", b"a\x00", b"ab", b"abcdefgh", b"abcdefghi", "máma".encode('utf8')]
+        hashes = hash_tokens(tokens)
+        self.assertEqual(len(set(hashes.tolist())), len(tokens))
+        # the hash of a token doesn't depend on the other tokens hashed with it
+        for token, hashed in zip(tokens, hashes):
+            self.assertEqual(hash_tokens([token])[0], hashed)
+
+    def testNonContiguousIds(self):
+        dictionary = Dictionary(self.texts)
+        dictionary.token2id['human'] = len(dictionary) + 5
+        self.assertRaises(ValueError, CompactDictionary, dictionary)
+
+    def testSaveLoadMmap(self):
+        fname = get_tmpfile('gensim_compact_dictionary.tst')
+        compact = CompactDictionary(self.dictionary)
+        compact.save(fname, sep_limit=0)
+        loaded = CompactDictionary.load(fname, mmap='r')
+        self.assertIsInstance(loaded.hashes, np.memmap)
+        self.assertSameDictionary(self.dictionary, loaded)
+        for document in self.texts:
+            self.assertEqual(self.dictionary.doc2bow(document), loaded.doc2bow(document))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    unittest.main()
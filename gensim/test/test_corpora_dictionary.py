@@ -117,6 +117,26 @@ class TestDictionary(unittest.TestCase):
 
         f.merge_with(g)
         self.assertEqual(sorted(d.token2id.keys()), sorted(f.token2id.keys()))
+        self.assertEqual(d.token2id, f.token2id)
+        self.assertEqual(d.dfs, f.dfs)
+        self.assertEqual(d.cfs, f.cfs)
+
+    def testAddDocumentsWorkers(self):
+        texts = self.texts * 5
+        d = Dictionary(texts)
+        parallel = Dictionary()
+        parallel.add_documents(texts, workers=2, chunksize=4)
+        self.assertEqual(d.token2id, parallel.token2id)
+        self.assertEqual(d.dfs, parallel.dfs)
+        self.assertEqual(d.cfs, parallel.cfs)
+        self.assertEqual(
+            (d.num_docs, d.num_pos, d.num_nnz), (parallel.num_docs, parallel.num_pos, parallel.num_nnz)
+        )
+
+        # pruning is applied to the merged dictionary
+        parallel = Dictionary()
+        parallel.add_documents(texts, prune_at=5, workers=2, chunksize=4)
+        self.assertEqual(len(parallel), 5)
 
     def testFilter(self):
         d = Dictionary(self.texts)
@@ -198,6 +218,33 @@ class TestDictionary(unittest.TestCase):
         # unicode must be converted to utf8
         self.assertEqual(d.doc2bow([u'\u017elu\u0165ou\u010dk\xfd']), [(0, 1)])
 
+    def test_docs2bow(self):
+        d = Dictionary(self.texts)
+        documents = self.texts + [[], ["human", "human", "non_existent", b"computer"]]
+        bow = d.docs2bow(iter(documents))
+        self.assertTrue(scipy.sparse.isspmatrix_csr(bow))
+        self.assertEqual(bow.shape, (len(documents), len(d)))
+        expected = [d.doc2bow(document) for document in documents]
+        self.assertEqual(list(gensim.matutils.Sparse2Corpus(bow, documents_columns=False)), expected)
+
+        # ids with gaps
+        d.token2id['human'] = len(d) + 5
+        bow = d.docs2bow(documents)
+        self.assertEqual(bow.shape, (len(documents), len(d) + 6))
+        expected = [d.doc2bow(document) for document in documents]
+        self.assertEqual(list(gensim.matutils.Sparse2Corpus(bow, documents_columns=False)), expected)
+        self.assertEqual(d.docs2bow([["computer"]]).shape, (1, len(d)))
+        self.assertEqual(Dictionary().docs2bow([["human"]]).shape, (1, 0))
+
+    def test_docs2idx(self):
+        d = Dictionary(self.texts)
+        documents = self.texts + [[], ["human", "non_existent", b"computer", "human"]]
+        ids, indptr = d.docs2idx(iter(documents), unknown_word_index=-5)
+        self.assertEqual(len(indptr), len(documents) + 1)
+        for docno, document in enumerate(documents):
+            self.assertEqual(ids[indptr[docno]:indptr[docno + 1]].tolist(), d.doc2idx(document, -5))
+        self.assertRaises(TypeError, d.docs2idx, ["human computer"])
+
     def test_saveAsText(self):
         """`Dictionary` can be saved as textfile. """
         tmpf = get_tmpfile('save_dict_test.txt')
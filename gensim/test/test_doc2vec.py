@@ -20,6 +20,7 @@ from testfixtures import log_capture
 
 from gensim import utils
 from gensim.models import doc2vec, keyedvectors
+from gensim.models.word2vec import WordIdCorpus
 from gensim.test.utils import datapath, get_tmpfile, temporary_file, common_texts as raw_sentences
 
 
@@ -380,6 +381,27 @@ class TestDoc2VecModel(unittest.TestCase):
             > model.similarity_unseen_docs(rome_words, car_words)
         )
 
+    def test_infer_vectors(self):
+        """Test inferring the vectors of many documents in several threads"""
+        corpus = list(DocsLeeCorpus())
+        documents = [doc.words for doc in corpus]
+
+        # without negative sampling and downsampling, the inference is deterministic
+        model = doc2vec.Doc2Vec(corpus, dm=0, hs=1, negative=0, sample=0, vector_size=10, min_count=2, epochs=2)
+        expected = np.array([model.infer_vector(words) for words in documents])
+        inferred = model.infer_vectors(iter(documents), workers=3, out=np.zeros((len(documents), 10), dtype=np.float32))
+        self.assertTrue(np.array_equal(inferred, expected))
+
+        model = doc2vec.Doc2Vec(corpus, dm=1, vector_size=10, min_count=2, epochs=2, workers=2)
+        inferred = model.infer_vectors(documents)
+        self.assertEqual(inferred.shape, (len(documents), 10))
+        self.assertTrue(np.all(np.isfinite(inferred)))
+
+        wrong_size = np.zeros((len(documents), 5), dtype=np.float32)
+        self.assertRaises(ValueError, model.infer_vectors, documents, out=wrong_size)
+        self.assertRaises(ValueError, model.infer_vectors, iter(documents), out=np.zeros((10, 10), dtype=np.float32))
+        self.assertRaises(TypeError, model.infer_vectors, ['rome italy'])
+
     def model_sanity(self, model, keep_training=True):
         """Any non-trivial model on DocsLeeCorpus can pass these sanity checks"""
         fire1 = 0  # doc 0 sydney fires
@@ -457,6 +479,26 @@ class TestDoc2VecModel(unittest.TestCase):
             model = doc2vec.Doc2Vec(corpus_file=corpus_file, vector_size=100, min_count=2, epochs=20, workers=1)
             self.model_sanity(model)
 
+    def test_training_from_word_ids(self):
+        """Test doc2vec training on a corpus converted to word ids."""
+        with temporary_file(get_tmpfile('gensim_doc2vec.tst')) as corpus_file:
+            save_lee_corpus_as_line_sentence(corpus_file)
+
+            model = doc2vec.Doc2Vec(vector_size=100, min_count=2, epochs=20, workers=1)
+            model.build_vocab(corpus_file=corpus_file)
+            corpus = WordIdCorpus.serialize(get_tmpfile('gensim_doc2vec_ids'), model.wv, corpus_file=corpus_file)
+            self.assertEqual(len(corpus), 300)
+            self.assertEqual(corpus.num_words, model.corpus_total_words)
+
+            model.train(corpus_file=corpus, total_words=corpus.num_words, epochs=model.epochs)
+            self.model_sanity(model)
+
+            # rows are tagged with their number, whichever worker trains them
+            model = doc2vec.Doc2Vec(vector_size=100, min_count=2, epochs=20, workers=3)
+            model.build_vocab(corpus_file=corpus_file)
+            model.train(corpus_file=corpus, total_words=corpus.num_words, epochs=model.epochs)
+            self.model_sanity(model)
+
     def test_dbow_hs(self):
         """Test DBOW doc2vec training."""
         model = doc2vec.Doc2Vec(list_corpus, dm=0, hs=1, negative=0, min_count=2, epochs=20)
@@ -49,6 +49,45 @@ class TestHdpModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         ldam = self.model.suggested_lda_model()
         self.assertEqual(ldam.alpha[0], self.model.lda_alpha[0])
 
+    def testBatchEStep(self):
+        model = self.model
+        unique_words, word_list = {}, []
+        for doc in corpus:
+            for word_id, _ in doc:
+                if word_id not in unique_words:
+                    unique_words[word_id] = len(unique_words)
+                    word_list.append(word_id)
+        Elogsticks_1st = hdpmodel.expect_log_sticks(model.m_var_sticks)
+
+        expected = hdpmodel.SuffStats(model.m_T, len(word_list), len(corpus))
+        expected_likelihoods = [
+            model.doc_e_step(expected, Elogsticks_1st, unique_words, *zip(*doc), var_converge=model.m_var_converge)
+            for doc in corpus
+        ]
+
+        docs = [
+            (np.array([unique_words[word_id] for word_id, _ in doc]), np.array([cnt for _, cnt in doc], dtype=float))
+            for doc in corpus
+        ]
+        batch_size = hdpmodel.e_step_batch_size
+        hdpmodel.e_step_batch_size = 1  # no padding
+        try:
+            likelihoods, var_sticks_ss, var_beta_ss = hdpmodel.batch_e_step(
+                model.m_Elogbeta[:, word_list], Elogsticks_1st, docs, model.m_K, model.m_alpha, model.m_var_converge
+            )
+        finally:
+            hdpmodel.e_step_batch_size = batch_size
+        self.assertTrue(np.allclose(likelihoods, expected_likelihoods))
+        self.assertTrue(np.allclose(var_sticks_ss, expected.m_var_sticks_ss))
+        self.assertTrue(np.allclose(var_beta_ss, expected.m_var_beta_ss))
+
+    def testWorkers(self):
+        model = self.class_(corpus, id2word=dictionary, chunksize=4, workers=2, random_state=np.random.seed(0))
+        topics = model.get_topics()
+        self.assertEqual(topics.shape[1], len(dictionary))
+        self.assertTrue(np.all(np.isfinite(topics)))
+        self.assertTrue(model[corpus[0]])
+
 
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
@@ -97,6 +97,63 @@ class TestKeyedVectors(unittest.TestCase):
         predicted = [result[0] for result in self.vectors.most_similar([input_vector], topn=5)]
         self.assertEqual(expected, predicted)
 
+    def test_most_similar_batch(self):
+        """Test most_similar_batch returns the same results as repeated most_similar calls."""
+        queries = [(['war'], []), (['good', 'nice'], ['worst']), ([('israel', 2.0)], [])]
+        predicted = self.vectors.most_similar_batch(queries, topn=5)
+        self.assertEqual(len(predicted), len(queries))
+        for (positive, negative), result in zip(queries, predicted):
+            expected = self.vectors.most_similar(positive=positive, negative=negative, topn=5)
+            self.assertEqual([key for key, _ in expected], [key for key, _ in result])
+            self.assertTrue(np.allclose([sim for _, sim in expected], [sim for _, sim in result], atol=1e-6))
+
+        dists = self.vectors.most_similar_batch(queries, topn=None)
+        self.assertEqual(dists.shape, (len(queries), len(self.vectors)))
+
+        predicted = self.vectors.most_similar_batch(queries, topn=5, restrict_vocab=5)
+        expected = set(self.vectors.index_to_key[:5]) - {'war'}
+        self.assertEqual(expected, set(key for key, _ in predicted[0]))
+
+    def test_most_similar_batch_with_matrix_input(self):
+        """Test most_similar_batch accepts a 2D array of query vectors."""
+        queries = np.vstack([self.vectors['war'], self.vectors['good']])
+        predicted = self.vectors.most_similar_batch(queries, topn=5)
+        for query, result in zip(queries, predicted):
+            expected = self.vectors.similar_by_vector(query, topn=5)
+            self.assertEqual([key for key, _ in expected], [key for key, _ in result])
+        self.assertEqual(self.vectors.most_similar_batch(queries, topn=0), [[], []])
+
+    def test_fill_normed_vectors(self):
+        """Test queries return the same results when using the cached unit-normalized vectors."""
+        expected = self.vectors.most_similar('war', topn=5)
+        expected_cosmul = self.vectors.most_similar_cosmul('war', topn=5)
+        self.vectors.fill_normed_vectors()
+        self.assertEqual(self.vectors.normed_vectors.dtype, REAL)
+        self.assertTrue(np.allclose(np.linalg.norm(self.vectors.normed_vectors, axis=1), 1.0, atol=1e-6))
+        self.assertTrue(np.allclose(self.vectors.get_vector('war', norm=True), self.vectors.normed_vectors[
+            self.vectors.get_index('war')]))
+
+        predicted = self.vectors.most_similar('war', topn=5)
+        self.assertEqual([key for key, _ in expected], [key for key, _ in predicted])
+        self.assertTrue(np.allclose([sim for _, sim in expected], [sim for _, sim in predicted], atol=1e-6))
+        predicted = self.vectors.most_similar_cosmul('war', topn=5)
+        self.assertEqual([key for key, _ in expected_cosmul], [key for key, _ in predicted])
+
+        # invalidating the norms invalidates the cache too
+        self.vectors.norms = None
+        self.vectors.fill_norms()
+        self.assertIsNone(self.vectors.normed_vectors)
+
+    def test_fill_normed_vectors_save_load_mmap(self):
+        """Test the cached unit-normalized vectors survive a save & mmap load."""
+        self.vectors.fill_normed_vectors()
+        tmpf = gensim.test.utils.get_tmpfile('gensim_kv_normed.tst')
+        self.vectors.save(tmpf, separately=['vectors', 'norms', 'normed_vectors'])
+        loaded = KeyedVectors.load(tmpf, mmap='r')
+        self.assertIsInstance(loaded.normed_vectors, np.memmap)
+        self.assertTrue(np.array_equal(loaded.normed_vectors, self.vectors.normed_vectors))
+        self.assertEqual(loaded.most_similar('war', topn=5), self.vectors.most_similar('war', topn=5))
+
     def test_most_similar_to_given(self):
         """Test most_similar_to_given returns correct results."""
         predicted = self.vectors.most_similar_to_given('war', ['terrorism', 'call', 'waging'])
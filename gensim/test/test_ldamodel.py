@@ -16,7 +16,8 @@ import unittest
 
 import six
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy.special import gammaln, logsumexp
 
 from gensim.corpora import mmcorpus, Dictionary
 from gensim.models import ldamodel, ldamulticore
@@ -326,6 +327,112 @@ class TestLdaModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         # FIXME: Fails on osx and win
         # self.assertTrue(1 in result[0])
 
+    def testGetDocumentTopicsBatch(self):
+        model = self.class_(self.corpus, id2word=dictionary, num_topics=2, passes=100, random_state=0)
+        docs = list(corpus)
+
+        for workers in (1, 3):
+            doc_topics = model.get_document_topics_batch(self.corpus, chunksize=2, workers=workers)
+            self.assertEqual(doc_topics.shape, (len(docs), 2))
+            dense = model.get_document_topics_batch(self.corpus, chunksize=2, workers=workers, dense=True)
+            self.assertTrue(isinstance(dense, np.ndarray))
+            assert_allclose(doc_topics.toarray(), dense, atol=1e-2)
+            for doc, topics in zip(docs, dense):
+                assert_allclose(matutils.sparse2full(model.get_document_topics(doc), 2), topics, atol=1e-2)
+
+        doc_topics, offsets, word_phis = model.get_document_topics_batch(
+            self.corpus, chunksize=4, per_word_topics=True, minimum_phi_value=0.01
+        )
+        self.assertEqual(offsets[-1], word_phis.shape[0])
+        for d, doc in enumerate(docs):
+            _, _, word_phi = model.get_document_topics(doc, per_word_topics=True, minimum_phi_value=0.01)
+            phis = word_phis[offsets[d]:offsets[d + 1]].toarray()
+            for (_, expected), phi in zip(word_phi, phis):
+                for topic_id, value in expected:
+                    # the random initialization of gamma differs, the phi values only roughly match
+                    self.assertAlmostEqual(phi[topic_id], value, delta=0.1)
+
+        self.assertEqual(model.get_document_topics_batch([]).shape, (0, 2))
+
+        # the number of workers only changes the speed, not the results
+        model.random_state = np.random.RandomState(1)
+        expected = model.get_document_topics_batch(self.corpus, chunksize=1, dense=True)
+        for workers in (2, 4):
+            model.random_state = np.random.RandomState(1)
+            dense = model.get_document_topics_batch(self.corpus, chunksize=1, workers=workers, dense=True)
+            assert_array_equal(dense, expected)
+
+    @unittest.skipIf(not ldamodel.FAST_INFERENCE, "compiled E step not available")
+    def testFastInference(self):
+        # the compiled E step must agree with the pure Python one
+        docs = list(corpus)
+        for dtype in (np.float32, np.float64):
+            model = self.class_(corpus, id2word=dictionary, num_topics=2, passes=2, random_state=0, dtype=dtype)
+            model.random_state = np.random.RandomState(1)
+            gamma, sstats = model.inference(docs, collect_sstats=True)
+
+            model.random_state = np.random.RandomState(1)
+            ldamodel.FAST_INFERENCE = False
+            try:
+                expected_gamma, expected_sstats = model.inference(docs, collect_sstats=True)
+            finally:
+                ldamodel.FAST_INFERENCE = True
+
+            self.assertEqual(gamma.dtype, dtype)
+            self.assertEqual(sstats.dtype, dtype)
+            assert_allclose(gamma, expected_gamma, rtol=1e-4)
+            assert_allclose(sstats, expected_sstats, rtol=1e-4, atol=1e-6)
+
+    def testSparseSstats(self):
+        # the E step accumulates only the columns of the terms in the chunk
+        docs = list(corpus)[:3]
+        model = self.class_(corpus, id2word=dictionary, num_topics=2, passes=2, random_state=0)
+        model.random_state = np.random.RandomState(1)
+        gamma, sstats = model.inference(docs, collect_sstats=True)
+
+        model.random_state = np.random.RandomState(1)
+        state = ldamodel.LdaState(model.eta, model.state.sstats.shape, model.dtype)
+        assert_allclose(model.do_estep(docs, state), gamma)
+        assert_allclose(state.sstats, sstats)
+        self.assertEqual(state.numdocs, len(docs))
+
+        ids = sorted(set(id for doc in docs for id, _ in doc))
+        unused = [id for id in range(len(dictionary)) if id not in ids]
+        self.assertTrue(np.all(sstats[:, unused] == 0))
+
+    def testBound(self):
+        docs = list(corpus)
+        model = self.class_(corpus, id2word=dictionary, num_topics=2, passes=2, random_state=0, eval_every=1)
+        gamma, _ = model.inference(docs)
+
+        # the chunked bound must agree with the straightforward per-document formula
+        Elogbeta = matutils.dirichlet_expectation(model.state.get_lambda())
+        expected = 0.0
+        for d, doc in enumerate(docs):
+            Elogthetad = matutils.dirichlet_expectation(gamma[d])
+            expected += sum(cnt * logsumexp(Elogthetad + Elogbeta[:, id]) for id, cnt in doc)
+            expected += np.sum((model.alpha - gamma[d]) * Elogthetad)
+            expected += np.sum(gammaln(gamma[d]) - gammaln(model.alpha))
+            expected += gammaln(np.sum(model.alpha)) - gammaln(np.sum(gamma[d]))
+        expected += np.sum((model.eta - model.state.get_lambda()) * Elogbeta)
+        expected += np.sum(gammaln(model.state.get_lambda()) - gammaln(model.eta))
+        expected += np.sum(gammaln(np.sum(model.eta)) - gammaln(np.sum(model.state.get_lambda(), 1)))
+        self.assertAlmostEqual(model.bound(docs, gamma=gamma), expected, delta=abs(expected) * 1e-5)
+
+        heldout = ldamodel.HeldOutCorpus(docs)
+        self.assertEqual(len(heldout), len(docs))
+        self.assertEqual([[(id, int(cnt)) for id, cnt in doc] for doc in heldout], docs)
+        self.assertEqual(heldout.num_words, sum(cnt for doc in docs for _, cnt in doc))
+        self.assertAlmostEqual(model.bound(heldout, gamma=gamma), model.bound(docs, gamma=gamma), places=2)
+
+        # the gammas of each evaluation are the starting point of the next one
+        self.assertIsNone(heldout.gamma)
+        perwordbound = model.log_perplexity(heldout)
+        self.assertEqual(heldout.gamma.shape, (len(docs), 2))
+        self.assertAlmostEqual(perwordbound, model.log_perplexity(docs), places=1)
+        model.update(corpus)
+        self.assertTrue(np.isfinite(model.log_perplexity(heldout)))
+
     def testPasses(self):
         # long message includes the original error message with a custom one
         self.longMessage = True
@@ -508,6 +615,32 @@ class TestLdaMulticore(TestLdaModel):
     def testAlphaAuto(self):
         self.assertRaises(RuntimeError, self.class_, alpha='auto')
 
+    def testSharedMemory(self):
+        # with one worker and batch updates, both modes see the same topics for the same chunks
+        kwargs = dict(id2word=dictionary, num_topics=2, passes=3, batch=True, workers=1, chunksize=3, random_state=1)
+        model = self.class_(corpus, **kwargs)
+        shared_model = self.class_(corpus, shared_memory=True, **kwargs)
+        self.assertTrue(np.allclose(model.get_topics(), shared_model.get_topics()))
+
+        # online updates with several workers still learn the expected topics
+        passed = False
+        for i in range(5):
+            model = self.class_(corpus, id2word=dictionary, num_topics=2, passes=100, workers=2, shared_memory=True)
+            vec = matutils.sparse2full(model[list(corpus)[0]], 2)
+            passed = np.allclose(sorted(vec), [0.13, 0.87], atol=1e-1)
+            if passed:
+                break
+        self.assertTrue(passed)
+
+    def testEvaluationKeepsTrainingResults(self):
+        # with a single worker, the training jobs queued before an evaluation finish while it waits for its gammas:
+        # their documents must still be trained on, even when they are the last ones of the pass
+        for i in range(3):
+            model = self.class_(id2word=dictionary, chunksize=1, num_topics=2, workers=1, eval_every=1)
+            for updates in range(1, 4):
+                model.update(self.corpus)
+                self.assertEqual(model.num_updates, updates * len(self.corpus))
+
 
 # endclass TestLdaMulticore
 
@@ -199,12 +199,12 @@ class TestLdaSeq(unittest.TestCase):
             ['bank', 'loan', 'sell']
         ]
         # initializing using own LDA sufficient statistics so that we get same results each time.
-        sstats = np.loadtxt(datapath('DTM/sstats_test.txt'))
-        dictionary = Dictionary(texts)
-        corpus = [dictionary.doc2bow(text) for text in texts]
+        self.sstats = np.loadtxt(datapath('DTM/sstats_test.txt'))
+        self.dictionary = Dictionary(texts)
+        self.corpus = [self.dictionary.doc2bow(text) for text in texts]
         self.ldaseq = ldaseqmodel.LdaSeqModel(
-            corpus=corpus, id2word=dictionary, num_topics=2,
-            time_slice=[10, 10, 11], initialize='own', sstats=sstats,
+            corpus=self.corpus, id2word=self.dictionary, num_topics=2,
+            time_slice=[10, 10, 11], initialize='own', sstats=self.sstats,
             passes=2, lda_inference_max_iter=10, em_min_iter=1, em_max_iter=4
         )
 
@@ -222,6 +222,67 @@ class TestLdaSeq(unittest.TestCase):
         expected_doc_topic = 0.00066577896138482028
         self.assertAlmostEqual(doc_topic[0], expected_doc_topic, places=2)
 
+    def testPosterior(self):
+        # the vectorized Kalman filter over the whole vocabulary matches the scalar recurrence of each word
+        def post_variance(fwd_variance, variance, obs_variance, chain_variance):
+            T = len(variance) - 1
+            fwd_variance[0] = chain_variance * 1000
+            for t in range(1, T + 1):
+                c = obs_variance / (fwd_variance[t - 1] + chain_variance + obs_variance) if obs_variance else 0
+                fwd_variance[t] = c * (fwd_variance[t - 1] + chain_variance)
+            variance[T] = fwd_variance[T]
+            for t in range(T - 1, -1, -1):
+                c = (fwd_variance[t] / (fwd_variance[t] + chain_variance)) ** 2 if fwd_variance[t] > 0.0 else 0
+                variance[t] = (c * (variance[t + 1] - chain_variance)) + ((1 - c) * fwd_variance[t])
+
+        def post_mean(fwd_mean, mean, obs, fwd_variance, obs_variance, chain_variance):
+            T = len(mean) - 1
+            fwd_mean[0] = 0
+            for t in range(1, T + 1):
+                c = obs_variance / (fwd_variance[t - 1] + chain_variance + obs_variance)
+                fwd_mean[t] = c * fwd_mean[t - 1] + (1 - c) * obs[t - 1]
+            mean[T] = fwd_mean[T]
+            for t in range(T - 1, -1, -1):
+                c = chain_variance / (fwd_variance[t] + chain_variance) if chain_variance != 0.0 else 0.0
+                mean[t] = c * fwd_mean[t] + (1 - c) * mean[t + 1]
+
+        chain = self.ldaseq.topic_chains[0]
+        for obs_variance in (chain.obs_variance, 0.0):  # without observation noise, fwd_variance drops to 0
+            chain.obs_variance = obs_variance
+            variance, fwd_variance = map(np.copy, chain.compute_post_variance(None, chain.chain_variance))
+            mean, fwd_mean = map(np.copy, chain.compute_post_mean(None, chain.chain_variance))
+            for word in range(chain.vocab_len):
+                expected_fwd_variance, expected_variance = [0.0] * len(variance[word]), [0.0] * len(variance[word])
+                post_variance(expected_fwd_variance, expected_variance, obs_variance, chain.chain_variance)
+                expected_fwd_mean, expected_mean = [0.0] * len(mean[word]), [0.0] * len(mean[word])
+                post_mean(
+                    expected_fwd_mean, expected_mean, list(chain.obs[word]), expected_fwd_variance,
+                    obs_variance, chain.chain_variance
+                )
+                np.testing.assert_allclose(fwd_variance[word], expected_fwd_variance, rtol=1e-12)
+                np.testing.assert_allclose(variance[word], expected_variance, rtol=1e-12)
+                np.testing.assert_allclose(fwd_mean[word], expected_fwd_mean, rtol=1e-12, atol=1e-15)
+                np.testing.assert_allclose(mean[word], expected_mean, rtol=1e-12, atol=1e-15)
+
+            # a single word updates its own row only
+            chain.variance[:], chain.fwd_variance[:], chain.mean[:], chain.fwd_mean[:] = 0, 0, 0, 0
+            chain.compute_post_variance(1, chain.chain_variance)
+            chain.compute_post_mean(1, chain.chain_variance)
+            np.testing.assert_array_equal(chain.variance[1], variance[1])
+            np.testing.assert_array_equal(chain.mean[1], mean[1])
+            self.assertFalse(chain.variance[0].any() or chain.mean[2].any())
+
+    def testWorkers(self):
+        # chunks of documents and topic chains are fitted in parallel, with the same results
+        ldaseq = ldaseqmodel.LdaSeqModel(
+            corpus=self.corpus, id2word=self.dictionary, num_topics=2,
+            time_slice=[10, 10, 11], initialize='own', sstats=self.sstats,
+            passes=2, lda_inference_max_iter=10, em_min_iter=1, em_max_iter=4, chunksize=4, workers=2
+        )
+        np.testing.assert_allclose(ldaseq.gammas, self.ldaseq.gammas)
+        for chain, expected in zip(ldaseq.topic_chains, self.ldaseq.topic_chains):
+            np.testing.assert_allclose(chain.e_log_prob, expected.e_log_prob)
+
     def testDtypeBackwardCompatibility(self):
         ldaseq_3_0_1_fname = datapath('DTM/ldaseq_3_0_1_model')
         test_doc = [(547, 1), (549, 1), (552, 1), (555, 1)]
@@ -116,6 +116,37 @@ class TestLsiModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         # the two LSI representations must equal up to sign
         self.assertTrue(np.allclose(abs(vec1), abs(vec2), atol=1e-5))
 
+    def testTransformToArray(self):
+        corpus = list(self.corpus)
+        model = lsimodel.LsiModel(corpus, num_topics=2)
+        for scaled in (False, True):
+            expected = matutils.corpus2dense(model.__getitem__(corpus, scaled=scaled, chunksize=None), 2).T
+            chunks = list(model.iter_dense_chunks(corpus, chunksize=4, scaled=scaled))
+            self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 1])
+            self.assertTrue(np.allclose(np.vstack(chunks), expected))
+            self.assertTrue(np.allclose(model.transform_to_array(corpus, chunksize=4, scaled=scaled), expected))
+
+        fname = get_tmpfile('gensim_models_lsi_vectors.npy')
+        model.transform_to_array(corpus, out=fname)
+        self.assertTrue(np.allclose(np.load(fname, mmap_mode='r'), matutils.corpus2dense(model[corpus], 2).T))
+
+        with self.assertRaises(ValueError):
+            model.transform_to_array(corpus, out=np.empty((len(corpus) - 1, 2)))
+
+    def testWorkers(self):
+        corpus = list(self.corpus)
+        u, s, vt = np.linalg.svd(matutils.corpus2dense(corpus, self.corpus.num_terms), full_matrices=False)
+
+        # multi-pass: the same passes, with the chunks multiplied by several processes
+        model = lsimodel.LsiModel(corpus, num_topics=3, chunksize=2, onepass=False, workers=2)
+        self.assertTrue(np.allclose(s[:3], model.projection.s))
+        self.assertTrue(np.allclose(np.abs(u[:, :3]), np.abs(model.projection.u), atol=1e-6))
+
+        # one-pass: chunks decomposed in parallel, merged in their original order
+        model = lsimodel.LsiModel(corpus, num_topics=3, chunksize=2, workers=2)
+        serial = lsimodel.LsiModel(corpus, num_topics=3, chunksize=2)
+        self.assertTrue(np.allclose(serial.projection.s, model.projection.s))
+
     def testPersistence(self):
         fname = get_tmpfile('gensim_models_lsi.tst')
         model = self.model
@@ -266,6 +266,20 @@ class UnitvecTestCase(unittest.TestCase):
         self.assertEqual(norm, 1.0)
 
 
+class TestArgsortRows(unittest.TestCase):
+    def test_matches_argsort(self):
+        x = np.random.RandomState(0).uniform(size=(4, 20))
+        for topn in (1, 5, 20, 25, None):
+            for reverse in (False, True):
+                result = matutils.argsort_rows(x, topn=topn, reverse=reverse)
+                expected = [matutils.argsort(row, topn=topn, reverse=reverse) for row in x]
+                self.assertTrue(np.array_equal(result, np.array(expected)))
+
+    def test_empty(self):
+        result = matutils.argsort_rows(np.ones((3, 5)), topn=0)
+        self.assertEqual(result.shape, (3, 0))
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
@@ -12,6 +12,8 @@ import logging
 import unittest
 import math
 import os
+import threading
+import time
 
 import numpy
 import scipy
@@ -373,6 +375,28 @@ class TestWmdSimilarity(_TestSimilarityABC):
             self.assertTrue(numpy.alltrue(sims >= 0.0))
             self.assertTrue(numpy.alltrue(sims <= 1.0))
 
+    @unittest.skipIf(PYEMD_EXT is False, "pyemd not installed")
+    def testLowerBounds(self):
+        index = self.cls(TEXTS + [['not_in_vocab']], self.w2v_model, chunksize=2)
+        for query in TEXTS:
+            wcd, rwmd = index.lower_bounds(query)
+            distances = self.w2v_model.wmdistance_many(query, index.corpus)
+            self.assertTrue(numpy.all(wcd <= distances + 1e-9))
+            self.assertTrue(numpy.all(rwmd <= distances + 1e-9))
+            self.assertEqual(numpy.inf, wcd[-1])
+            self.assertEqual(numpy.inf, rwmd[-1])
+
+    @unittest.skipIf(PYEMD_EXT is False, "pyemd not installed")
+    def testPrune(self):
+        index = self.cls(TEXTS, self.w2v_model, num_best=3)
+        pruned_index = self.cls(TEXTS, self.w2v_model, num_best=3, prune=True)
+        for query in TEXTS + [['not_in_vocab'], TEXTS[:2]]:
+            sims = index[query]
+            pruned_sims = pruned_index[query]
+            if query and isinstance(query[0], list):
+                sims, pruned_sims = sims[0], pruned_sims[0]
+            self.assertEqual(sorted(sims), sorted(pruned_sims))
+
 
 class TestSoftCosineSimilarity(_TestSimilarityABC):
     def setUp(self):
@@ -490,6 +514,26 @@ class TestSparseMatrixSimilarity(_TestSimilarityABC):
         self.assertTrue(scipy.sparse.issparse(scipy_topn_sims))
         self.assertEqual(dense_topn_sims, [matutils.scipy2sparse(v) for v in scipy_topn_sims])
 
+    def testNumBestSparseTopk(self):
+        """Top-k picked from the sparse product agrees with clipping the dense similarities"""
+        num_features = len(DICTIONARY)
+        index = self.cls(CORPUS, num_features=num_features, num_best=3, chunksize=2)
+        dense_sims = index.get_similarities([matutils.unitvec(doc) for doc in CORPUS])
+        for queries, sims in ((CORPUS, dense_sims), (CORPUS[0], dense_sims[0])):
+            topn_sims = index[queries]
+            expected = [matutils.full2sparse_clipped(row, 3) for row in numpy.atleast_2d(sims)]
+            if sims.ndim == 1:
+                topn_sims = [topn_sims]
+            self.assertEqual(len(topn_sims), len(expected))
+            for got, exp in zip(topn_sims, expected):
+                self.assertEqual(len(got), len(exp))
+                self.assertEqual([docid for docid, _ in got], [docid for docid, _ in exp])
+                numpy.testing.assert_allclose([sim for _, sim in got], [sim for _, sim in exp], rtol=1e-6)
+
+        # the query matrix of a chunked Similarity iteration goes through the same path
+        index = self.cls(CORPUS, num_features=num_features, num_best=4)
+        self.assertEqual(list(index)[1], index[CORPUS][1])
+
 
 class TestSimilarity(_TestSimilarityABC):
     def setUp(self):
@@ -516,6 +560,105 @@ class TestSimilarity(_TestSimilarityABC):
         self.assertTrue(numpy.allclose(expected, sims))
         index.destroy()
 
+    def testWorkers(self):
+        """test querying the shards in multiple threads"""
+        index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=2)
+        threaded_index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=2, workers=3)
+        for num_best in [None, 3]:
+            index.num_best = threaded_index.num_best = num_best
+            for query in [CORPUS[0], CORPUS]:
+                expected = index[query]
+                sims = threaded_index[query]
+                if num_best is None:
+                    self.assertTrue(numpy.allclose(expected, sims))
+                else:
+                    self.assertEqual(expected, sims)
+        self.assertIsNotNone(threaded_index.executor)
+
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        threaded_index.save(fname)
+        loaded = self.cls.load(fname)
+        self.assertIsNone(loaded.executor)
+        self.assertEqual(loaded[CORPUS[0]], threaded_index[CORPUS[0]])
+
+        index.destroy()
+        threaded_index.destroy()
+        self.assertIsNone(threaded_index.executor)
+
+    def testWorkersConcurrentQueries(self):
+        """test concurrent first queries start a single thread pool"""
+        index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=2, workers=3)
+        expected = index[CORPUS[0]]
+        index.destroy()
+        index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=2, workers=3)
+        executors = []
+
+        class SlowExecutor(similarities.docsim.ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                executors.append(self)
+                time.sleep(0.1)  # let the other queries reach the executor check meanwhile
+                super(SlowExecutor, self).__init__(*args, **kwargs)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(index[CORPUS[0]])) for _ in range(4)]
+        executor_class, similarities.docsim.ThreadPoolExecutor = similarities.docsim.ThreadPoolExecutor, SlowExecutor
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            similarities.docsim.ThreadPoolExecutor = executor_class
+        self.assertEqual(len(executors), 1)
+        self.assertEqual(len(results), 4)
+        for sims in results:
+            self.assertTrue(numpy.allclose(expected, sims))
+        index.destroy()
+
+    def testShardsMmap(self):
+        """test shard matrices are stored as separate .npy files and mmap'ed back"""
+        for num_features in [len(DICTIONARY), 1000]:  # dense & sparse shards
+            index = self.cls(None, CORPUS, num_features=num_features, shardsize=5)
+            expected = index[CORPUS[0]]
+            for shard in index.shards:
+                shard.unload()
+                self.assertFalse(hasattr(shard, 'index'))
+                matrix = shard.get_index().index
+                if scipy.sparse.issparse(matrix):
+                    self.assertIsInstance(matrix.data, numpy.memmap)
+                else:
+                    self.assertIsInstance(matrix, numpy.memmap)
+            self.assertTrue(numpy.allclose(expected, index[CORPUS[0]]))
+            index.destroy()
+
+    def testMaxResidentShards(self):
+        """test the least recently used shards are unloaded"""
+        index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=3)
+        expected = index[CORPUS]
+        limited_index = self.cls(None, CORPUS, num_features=len(DICTIONARY), shardsize=3, max_resident_shards=2)
+        for workers in [1, 3]:
+            limited_index.workers = workers
+            sims = limited_index[CORPUS]
+            self.assertTrue(numpy.allclose(expected, sims))
+            resident = [shard for shard in limited_index.shards if hasattr(shard, 'index')]
+            self.assertEqual(len(resident), 2)
+            self.assertEqual(len(limited_index.resident_shards), 2)
+
+        # the lock is recreated on load, before any query
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        limited_index.save(fname)
+        loaded = self.cls.load(fname)
+        self.assertIsInstance(loaded.resident_lock, type(threading.Lock()))
+        self.assertEqual(len(loaded.resident_shards), 0)
+        self.assertTrue(numpy.allclose(expected, loaded[CORPUS]))
+        self.assertEqual(len(loaded.resident_shards), 2)
+
+        for expected_sims, sims in zip(index, limited_index):
+            self.assertTrue(numpy.allclose(expected_sims, sims))
+        self.assertEqual(len([shard for shard in limited_index.shards if hasattr(shard, 'index')]), 2)
+        index.destroy()
+        limited_index.destroy()
+
     def testMmapCompressed(self):
         pass
         # turns out this test doesn't exercise this because there are no arrays
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for distributed LDA and LSI training over sockets.
+"""
+
+
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import unittest
+
+import numpy as np
+import scipy.sparse
+
+from gensim import matutils
+from gensim.corpora.mmcorpus import MmCorpus
+from gensim.models import ldamodel, lsimodel, socket_dispatcher
+from gensim.test.utils import datapath, common_corpus, common_dictionary
+
+
+class TestSocketDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.corpus = MmCorpus(datapath('testcorpus.mm'))
+
+    def testMessages(self):
+        left, right = socket.socketpair()
+        try:
+            arrays = [
+                np.arange(12, dtype=np.float32).reshape(3, 4), np.zeros(0, dtype=np.int64), np.float64(3.5),
+                np.zeros((3, 0)),
+            ]
+            socket_dispatcher.send_message(left, socket_dispatcher.MSG_JOB, {'some': 'meta'}, arrays)
+            msgtype, meta, received = socket_dispatcher.recv_message(right)
+            self.assertEqual(msgtype, socket_dispatcher.MSG_JOB)
+            self.assertEqual(meta, {'some': 'meta'})
+            for array, expected in zip(received, arrays):
+                self.assertEqual(array.dtype, expected.dtype)
+                np.testing.assert_array_equal(array, expected)
+        finally:
+            left.close()
+            right.close()
+
+    def testAuthentication(self):
+        def authenticate(sock, authkey, server, results):
+            try:
+                socket_dispatcher._authenticate(sock, authkey, server)
+                results.append(True)
+            except (socket_dispatcher.WorkerError, EOFError):
+                results.append(False)
+            finally:
+                sock.close()
+
+        for worker_key, expected in [(b'secret', True), (b'wrong', False)]:
+            left, right = socket.socketpair()
+            left.settimeout(5)
+            right.settimeout(5)
+            dispatcher_results, worker_results = [], []
+            thread = threading.Thread(target=authenticate, args=(left, b'secret', True, dispatcher_results))
+            thread.start()
+            authenticate(right, worker_key, False, worker_results)
+            thread.join()
+            self.assertEqual(dispatcher_results, [expected])
+            self.assertEqual(worker_results, [expected])
+
+    def testJobs(self):
+        chunk = [[(0, 1.0), (3, 2.5)], [], [(1, 1.0)]]
+        self.assertEqual(socket_dispatcher.decode_job(*socket_dispatcher.encode_job(chunk)), chunk)
+
+        numpy_chunk = [np.asarray(doc, dtype=np.float32) for doc in chunk]
+        self.assertEqual(socket_dispatcher.decode_job(*socket_dispatcher.encode_job(numpy_chunk)), chunk)
+
+        job = matutils.corpus2csc(chunk, num_terms=5)
+        decoded = socket_dispatcher.decode_job(*socket_dispatcher.encode_job(job))
+        self.assertTrue(scipy.sparse.isspmatrix_csc(decoded))
+        np.testing.assert_array_equal(decoded.toarray(), job.toarray())
+
+    def testStates(self):
+        state = ldamodel.LdaState(np.full(5, 0.1), (2, 5), dtype=np.float64)
+        state.sstats[:] = np.random.RandomState(0).rand(2, 5)
+        state.numdocs = 7
+        decoded = socket_dispatcher.decode_state(*socket_dispatcher.encode_state(state))
+        self.assertEqual(decoded.numdocs, 7)
+        self.assertEqual(decoded.dtype, np.float64)
+        np.testing.assert_array_equal(decoded.sstats, state.sstats)
+        np.testing.assert_array_equal(decoded.eta, state.eta)
+
+        # states of workers only cover some of the terms, and are sent as columns
+        state.sstats[:, 1:] = 0.0
+        meta, arrays = socket_dispatcher.encode_state(state)
+        self.assertEqual(arrays[-1].shape, (2, 1))
+        decoded = socket_dispatcher.decode_state(meta, arrays)
+        np.testing.assert_array_equal(decoded.sstats, state.sstats)
+
+        projection = lsimodel.Projection(self.corpus.num_terms, 2, matutils.corpus2csc(self.corpus))
+        for expected in (projection, projection.empty_like()):
+            decoded = socket_dispatcher.decode_state(*socket_dispatcher.encode_state(expected))
+            self.assertEqual((decoded.m, decoded.k), (expected.m, expected.k))
+            if expected.u is None:
+                self.assertIsNone(decoded.u)
+            else:
+                np.testing.assert_array_equal(decoded.u, expected.u)
+                np.testing.assert_array_equal(decoded.s, expected.s)
+
+    def testLda(self):
+        dispatcher = socket_dispatcher.SocketDispatcher(workers=2)
+        try:
+            model = ldamodel.LdaModel(
+                common_corpus, id2word=common_dictionary, num_topics=2, chunksize=2, passes=2,
+                distributed=dispatcher, random_state=0
+            )
+            self.assertEqual(model.numworkers, 2)
+            self.assertEqual(model.get_topics().shape, (2, len(common_dictionary)))
+            self.assertTrue(np.isfinite(model.log_perplexity(common_corpus)))
+        finally:
+            dispatcher.exit()
+
+    def testLsi(self):
+        dispatcher = socket_dispatcher.SocketDispatcher(workers=2)
+        try:
+            model = lsimodel.LsiModel(self.corpus, num_topics=2, chunksize=3, distributed=dispatcher)
+        finally:
+            dispatcher.exit()
+        # merging the projections of many small jobs is only approximate
+        u, s, vt = np.linalg.svd(matutils.corpus2dense(self.corpus, self.corpus.num_terms), full_matrices=False)
+        self.assertTrue(np.allclose(s[:2], model.projection.s, rtol=0.05))
+
+    def testRemoteWorkers(self):
+        # find a free port, and start workers that keep trying to connect to it
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+        self.assertRaises(ValueError, socket_dispatcher.SocketDispatcher, workers=2, host='127.0.0.1', port=port)
+        workers = [
+            multiprocessing.Process(target=socket_dispatcher.run_worker, args=('127.0.0.1', port, authkey))
+            for authkey in ['secret', b'secret']
+        ]
+        for worker in workers:
+            worker.start()
+
+        dispatcher = socket_dispatcher.SocketDispatcher(workers=2, host='127.0.0.1', port=port, authkey='secret')
+        try:
+            self.assertEqual(dispatcher.processes, [])
+            model = ldamodel.LdaModel(
+                common_corpus, id2word=common_dictionary, num_topics=2, chunksize=2, distributed=dispatcher
+            )
+            self.assertEqual(model.numworkers, 2)
+        finally:
+            dispatcher.exit()
+        for worker in workers:
+            worker.join(timeout=10)
+            self.assertFalse(worker.is_alive())
+
+    @unittest.skipIf(not hasattr(signal, 'SIGSTOP'), "needs SIGSTOP to freeze a worker")
+    def testUnresponsiveWorker(self):
+        dispatcher = socket_dispatcher.SocketDispatcher(workers=2, timeout=1.0)
+        frozen = dispatcher.processes[0]
+        try:
+            model = ldamodel.LdaModel(id2word=common_dictionary, num_topics=2, distributed=dispatcher)
+            dispatcher.reset(model.state)
+            # a worker that stops answering (and sending heartbeats) is dropped, and its jobs reassigned
+            os.kill(frozen.pid, signal.SIGSTOP)
+            for document in common_corpus:
+                dispatcher.putjob([document])
+            state = dispatcher.getstate()
+            self.assertEqual(state.numdocs, len(common_corpus))
+            self.assertEqual(len(dispatcher.getworkers()), 1)
+        finally:
+            os.kill(frozen.pid, signal.SIGCONT)
+            dispatcher.exit()
+
+    def testWorkerFailure(self):
+        dispatcher = socket_dispatcher.SocketDispatcher(workers=2)
+        try:
+            model = ldamodel.LdaModel(id2word=common_dictionary, num_topics=2, distributed=dispatcher)
+            dispatcher.reset(model.state)
+            chunks = [common_corpus[i:i + 1] for i in range(len(common_corpus))]
+            for chunk in chunks[:4]:
+                dispatcher.putjob(chunk)
+            while dispatcher.jobsdone() < 4:
+                time.sleep(0.01)
+
+            # the results of the jobs this worker finished die with it, and must be recomputed
+            dispatcher.processes[0].terminate()
+            for chunk in chunks[4:]:
+                dispatcher.putjob(chunk)
+            state = dispatcher.getstate()
+            self.assertEqual(state.numdocs, len(common_corpus))
+            self.assertEqual(len(dispatcher.getworkers()), 1)
+
+            expected = ldamodel.LdaState(model.eta, model.state.sstats.shape)
+            model.do_estep(common_corpus, expected)
+            np.testing.assert_allclose(state.sstats.sum(), expected.sstats.sum(), rtol=1e-3)
+        finally:
+            dispatcher.exit()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
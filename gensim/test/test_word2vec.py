@@ -15,12 +15,14 @@ import pytest
 import os
 import bz2
 import sys
+from queue import Queue
 import six
 
 import numpy as np
 
 from gensim import utils
 from gensim.models import word2vec, keyedvectors
+from gensim.models.callbacks import CallbackAny2Vec, TrainingCheckpoint
 from gensim.test.utils import datapath, get_tmpfile, temporary_file, common_texts as sentences, \
     LeeCorpus, lee_corpus_list
 from testfixtures import log_capture
@@ -120,6 +122,27 @@ class TestWord2VecModel(unittest.TestCase):
         total_words = model.scan_vocab(sentences)[0]
         self.assertEqual(total_words, 29)
 
+    def testScanVocabWorkers(self):
+        # counting the words in several processes gives the same vocabulary as a single process
+        expected = word2vec.Word2Vec(min_count=1)
+        expected_totals = expected.scan_vocab(lee_corpus_list)
+        model = word2vec.Word2Vec(min_count=1)
+        self.assertEqual(model.scan_vocab(lee_corpus_list, workers=2), expected_totals)
+        self.assertEqual(dict(model.raw_vocab), dict(expected.raw_vocab))
+
+        # the lines of a corpus file are split between the processes by their offsets
+        corpus_file = datapath('lee_background.cor')
+        expected = word2vec.Word2Vec(min_count=1)
+        expected_totals = expected.scan_vocab(corpus_file=corpus_file)
+        for workers in (2, 3):
+            model = word2vec.Word2Vec(min_count=1)
+            self.assertEqual(model.scan_vocab(corpus_file=corpus_file, workers=workers), expected_totals)
+            self.assertEqual(dict(model.raw_vocab), dict(expected.raw_vocab))
+
+        model = word2vec.Word2Vec(min_count=1, max_vocab_size=500)
+        model.scan_vocab(corpus_file=corpus_file, workers=2)
+        self.assertLessEqual(len(model.raw_vocab), 500)
+
     def testMaxFinalVocab(self):
         # Test for less restricting effect of max_final_vocab
         # max_final_vocab is specified but has no effect
@@ -522,6 +545,123 @@ class TestWord2VecModel(unittest.TestCase):
             sims2 = [(w, sim) for w, sim in sims2 if w != 'graph']  # ignore 'graph' itself
             self.assertEqual(sims, sims2)
 
+    def testTrainingFromWordIds(self):
+        """Test word2vec training on a corpus converted to word ids."""
+        corpus_file = datapath('lee_background.cor')
+        model = word2vec.Word2Vec(vector_size=10, min_count=5, workers=3)
+        model.build_vocab(corpus_file=corpus_file)
+
+        corpus = word2vec.WordIdCorpus.serialize(get_tmpfile('gensim_word2vec_ids'), model.wv, corpus_file=corpus_file)
+        self.assertEqual((len(corpus), corpus.num_words), (model.corpus_count, model.corpus_total_words))
+        first_line = next(iter(word2vec.LineSentence(corpus_file)))
+        expected = [model.wv.key_to_index.get(word, corpus.UNKNOWN_ID) for word in first_line]
+        self.assertEqual(list(next(iter(corpus))), expected)
+
+        # the workers split the rows between them, each one reading its rows once per epoch
+        self.assertEqual(sum(len(list(stream)) for stream in corpus._streams(3)), len(corpus))
+        examples, raw_words = model.train(corpus_file=corpus, total_words=corpus.num_words, epochs=2)
+        self.assertEqual(raw_words, 2 * corpus.num_words)
+        self.assertEqual(corpus.offsets[-1], corpus.num_words)
+
+        same = word2vec.WordIdCorpus(get_tmpfile('gensim_word2vec_ids'), mmap=None)
+        self.assertTrue(np.array_equal(same.word_ids, corpus.word_ids))
+        self.assertEqual(same.vocab_size, len(model.wv))
+
+        # ids of another vocabulary would index out of bounds
+        smaller = word2vec.Word2Vec(vector_size=10, min_count=20)
+        smaller.build_vocab(corpus_file=corpus_file)
+        self.assertRaises(ValueError, smaller.train, corpus_file=corpus, total_words=corpus.num_words, epochs=1)
+        same.vocab_size = None  # a corpus without its recorded vocabulary size
+        self.assertRaises(ValueError, smaller.train, corpus_file=same, total_words=corpus.num_words, epochs=1)
+
+    def testTrainingCheckpoint(self):
+        """Test resuming word2vec training from a checkpoint."""
+        model = word2vec.Word2Vec(vector_size=10, min_count=1, workers=2, batch_words=5)
+        model.build_vocab(sentences)
+        untrained = get_tmpfile('gensim_word2vec_untrained.tst')
+        model.save(untrained)
+        checkpoint = TrainingCheckpoint(get_tmpfile('gensim_word2vec_checkpoint'), every=0)
+        model.train(sentences, total_examples=model.corpus_count, epochs=3, callbacks=[checkpoint])
+
+        # the last checkpoint is the end of training
+        restored = word2vec.Word2Vec.load(untrained)
+        self.assertEqual(TrainingCheckpoint.restore(restored, checkpoint.path_prefix), (3, 0, 0))
+        self.assertTrue(np.array_equal(restored.wv.vectors, model.wv.vectors))
+        self.assertTrue(np.array_equal(restored.syn1neg, model.syn1neg))
+        self.assertEqual(restored.train(
+            sentences, total_examples=model.corpus_count, epochs=3, resume_from=checkpoint.path_prefix), (0, 0))
+
+        # resume in the middle of the second epoch
+        skipped_words = sum(len(sentence) for sentence in sentences[:4])
+        checkpoint.on_train_begin(restored)
+        checkpoint.save(restored, 1, 4, skipped_words)
+        checkpoint.on_train_end(restored)
+        restored = word2vec.Word2Vec.load(untrained)
+        trained_words, raw_words = restored.train(
+            sentences, total_examples=model.corpus_count, epochs=3, resume_from=checkpoint.path_prefix)
+        self.assertEqual(raw_words, 2 * model.corpus_total_words - skipped_words)
+
+    def testTrainingCheckpointJobOrder(self):
+        """Test the resume position only covers jobs finished without gaps, in corpus order."""
+        model = word2vec.Word2Vec(vector_size=10, min_count=1, workers=2)
+        model.build_vocab(sentences)
+        model.training_metrics = word2vec.TrainingMetrics(0)
+
+        positions = []
+
+        class RecordingQueue(Queue):
+            def get(self, *args, **kwargs):
+                positions.append(getattr(model, 'epoch_progress', None))
+                return Queue.get(self, *args, **kwargs)
+
+        # (examples, trained words, raw words, job number): job 2 finishes before job 1, then job 3
+        progress_queue = RecordingQueue()
+        for report in [(2, 5, 6, 2), (1, 3, 4, 1), (3, 7, 8, 3), None, None]:
+            progress_queue.put(report)
+        model.epoch_progress = (0, 0, 0)
+        model._log_epoch_progress(progress_queue, cur_epoch=0, total_examples=6)
+        self.assertEqual(positions[1:4], [(0, 0, 0), (0, 3, 10), (0, 6, 18)])
+
+    def testTrainingMetrics(self):
+        """Test the per epoch metrics of the training pipeline."""
+        class MetricsLogger(CallbackAny2Vec):
+            def __init__(self):
+                self.epochs = []
+
+            def on_epoch_end(self, model):
+                self.epochs.append(model.training_metrics.as_dict())
+
+        metrics = MetricsLogger()
+        model = word2vec.Word2Vec(
+            sentences, vector_size=10, min_count=1, workers=2, batch_words=5, epochs=2, callbacks=[metrics])
+        self.assertEqual([epoch['epoch'] for epoch in metrics.epochs], [0, 1])
+        for epoch in metrics.epochs:
+            self.assertEqual(len(epoch['workers']), 2)
+            self.assertEqual(epoch['raw_words'], model.corpus_total_words)
+            self.assertEqual(sum(worker['raw_words'] for worker in epoch['workers']), model.corpus_total_words)
+            # the queue depth is only sampled with the progress reports
+            self.assertTrue(len(epoch['queue_depth']) <= epoch['jobs'])
+            self.assertTrue(all(len(sample) == 2 for sample in epoch['queue_depth']))
+            self.assertEqual(epoch['jobs'], sum(worker['jobs'] for worker in epoch['workers']))
+            self.assertEqual(epoch['jobs'], sum(epoch['job_words']['histogram'].values()))
+            self.assertAlmostEqual(epoch['job_words']['mean'] * epoch['jobs'], model.corpus_total_words)
+            self.assertTrue(epoch['job_words']['min'] <= epoch['job_words']['mean'] <= epoch['job_words']['max'])
+            self.assertTrue(epoch['words_per_sec'] > 0)
+
+        # the metrics are not saved with the model
+        tmpf = get_tmpfile('gensim_word2vec.tst')
+        model.save(tmpf)
+        self.assertIsNone(word2vec.Word2Vec.load(tmpf).training_metrics)
+
+        # the corpus_file mode has a single job per worker thread
+        with temporary_file(get_tmpfile('gensim_word2vec.tst')) as corpus_file:
+            utils.save_as_line_sentence(sentences, corpus_file)
+            model = word2vec.Word2Vec(corpus_file=corpus_file, vector_size=10, min_count=1, workers=2, epochs=1)
+        epoch = model.training_metrics.as_dict()
+        self.assertEqual(epoch['jobs'], 2)
+        self.assertEqual(epoch['raw_words'], sum(worker['raw_words'] for worker in epoch['workers']))
+        self.assertEqual(epoch['queue_depth'], [])
+
     def testScoring(self):
         """Test word2vec scoring."""
         model = word2vec.Word2Vec(sentences, vector_size=2, min_count=1, hs=1, negative=0)
@@ -1054,6 +1194,21 @@ class TestWMD(unittest.TestCase):
         distance = model.wv.wmdistance(sentence, sentence)
         self.assertEqual(0.0, distance)
 
+    @unittest.skipIf(PYEMD_EXT is False, "pyemd not installed")
+    def testWmdistanceMany(self):
+        '''Check that bulk distances match pairwise distances.'''
+
+        model = word2vec.Word2Vec(sentences, min_count=2, seed=42, workers=1)
+        query = ['human', 'interface', 'computer', 'computer']
+        documents = sentences + [['not_in_vocab'], ['computer'], []]
+        distances = model.wv.wmdistance_many(query, documents)
+        self.assertEqual(distances.shape, (len(documents), ))
+        for document, distance in zip(documents, distances):
+            self.assertTrue(np.allclose(model.wv.wmdistance(query, document), distance))
+        self.assertEqual(float('inf'), distances[-1])
+        self.assertEqual(float('inf'), distances[-3])
+        self.assertTrue(np.all(np.isinf(model.wv.wmdistance_many(['not_in_vocab'], documents))))
+
 
 class TestWord2VecSentenceIterators(unittest.TestCase):
     def testLineSentenceWorksWithFilename(self):